@@ -0,0 +1,57 @@
+"""
+Per-page cost of decoding a history response.
+
+Compares the former two-pass parsing (json -> dicts -> one model per item -> history
+model validating the list again) with the single-pass decoding the clients use now.
+
+    python -m benchmarks.history_decode [--items 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import timeit
+
+from chiefpay.decoding import VALIDATION_MODES, decode_history
+from chiefpay.types import Invoice, InvoicesHistory, Transaction, TransactionsHistory
+
+from benchmarks import payloads
+
+
+def two_pass_invoices(body: bytes) -> InvoicesHistory:
+    data = json.loads(body)
+    invoices = [Invoice(**item) for item in data.get("invoices")]
+    return InvoicesHistory(invoices=invoices, totalCount=data.get("totalCount"))
+
+
+def two_pass_transactions(body: bytes) -> TransactionsHistory:
+    data = json.loads(body)
+    transactions = [Transaction(**item) for item in data.get("transactions")]
+    return TransactionsHistory(transactions=transactions, totalCount=data.get("totalCount"))
+
+
+def measure(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="items per page")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per case (best is kept)")
+    args = parser.parse_args()
+
+    cases = (
+        (InvoicesHistory, payloads.invoices_page(args.items), two_pass_invoices),
+        (TransactionsHistory, payloads.transactions_page(args.items), two_pass_transactions),
+    )
+    print(f"{'page':<22}{'decoding':<16}{'ms/page':>10}{'speedup':>10}")
+    for model, page, two_pass in cases:
+        body = json.dumps(page).encode()
+        baseline = measure(lambda: two_pass(body), args.repeat)
+        print(f"{model.__name__:<22}{'two-pass':<16}{baseline:>10.2f}{1:>9.2f}x")
+        for mode in VALIDATION_MODES:
+            elapsed = measure(lambda: decode_history(model, body, mode), args.repeat)
+            print(f"{'':<22}{mode:<16}{elapsed:>10.2f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
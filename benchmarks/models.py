@@ -0,0 +1,135 @@
+"""
+Decode time and memory per object of the chiefpay.types models.
+
+For every model, item count and decoding mode ("full", "raw") a synthetic
+response body is decoded the way the clients do it: Invoice and Transaction as one
+object (1 item) or a JSON list, PaymentMethods with that many methods and the
+history models as one page. Time is the best of several runs; memory is measured
+with tracemalloc in a separate run, as the bytes the decoded result keeps and the
+peak while decoding, both divided by the item count.
+
+    python -m benchmarks.models [--sizes 1 1000 100000] [--models Invoice ...] [--output models.json]
+"""
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from chiefpay.decoding import VALIDATION_MODES, decode, decode_history, decode_list
+from chiefpay.types import (
+    Invoice,
+    InvoicesHistory,
+    PaymentMethods,
+    Transaction,
+    TransactionsHistory,
+)
+
+from benchmarks import payloads
+from benchmarks.results import write_results
+
+
+def _items(item: Callable[[int], Dict], count: int):
+    return item(0) if count == 1 else [item(n) for n in range(count)]
+
+
+# Synthetic response body and decoding of each model, given the item count and the mode.
+MODELS: Dict[str, Tuple[Callable[[int], object], Callable[[bytes, int, str], object]]] = {
+    "Invoice": (
+        lambda count: _items(payloads.invoice, count),
+        lambda body, count, mode: (
+            decode(Invoice, body, mode) if count == 1 else decode_list(Invoice, body, mode)
+        ),
+    ),
+    "Transaction": (
+        lambda count: _items(payloads.transaction, count),
+        lambda body, count, mode: (
+            decode(Transaction, body, mode) if count == 1 else decode_list(Transaction, body, mode)
+        ),
+    ),
+    "PaymentMethods": (
+        payloads.payment_methods,
+        lambda body, count, mode: decode(PaymentMethods, body, mode),
+    ),
+    "InvoicesHistory": (
+        payloads.invoices_page,
+        lambda body, count, mode: decode_history(InvoicesHistory, body, mode),
+    ),
+    "TransactionsHistory": (
+        payloads.transactions_page,
+        lambda body, count, mode: decode_history(TransactionsHistory, body, mode),
+    ),
+}
+
+
+def measure_time(func: Callable[[], object], repeat: int) -> float:
+    """
+    Returns the best time of one call, in seconds, over `repeat` timed loops.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_memory(func: Callable[[], object]) -> Tuple[int, int]:
+    """
+    Returns the bytes retained by the result of `func` and the peak bytes allocated while it ran.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained - before, peak - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100000], help="item counts")
+    parser.add_argument(
+        "--models", nargs="+", choices=list(MODELS), default=list(MODELS), help="models to run"
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=VALIDATION_MODES, default=list(VALIDATION_MODES), help="decoding modes"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed loops per case (best is kept)")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'model':<22}{'items':>8}  {'mode':<6}{'us/item':>10}{'bytes/item':>12}{'peak/item':>12}")
+    for name in args.models:
+        payload, decoder = MODELS[name]
+        for count in args.sizes:
+            body = json.dumps(payload(count)).encode()
+            for mode in args.modes:
+                run = lambda: decoder(body, count, mode)
+                seconds = measure_time(run, args.repeat)
+                retained, peak = measure_memory(run)
+                result = {
+                    "model": name,
+                    "items": count,
+                    "mode": mode,
+                    "body_bytes": len(body),
+                    "seconds": seconds,
+                    "us_per_item": seconds / count * 1e6,
+                    "bytes_per_item": retained / count,
+                    "peak_bytes_per_item": peak / count,
+                }
+                results.append(result)
+                print(
+                    f"{name:<22}{count:>8}  {mode:<6}{result['us_per_item']:>10.2f}"
+                    f"{result['bytes_per_item']:>12.0f}{result['peak_bytes_per_item']:>12.0f}"
+                )
+
+    write_results(args.output, "models", vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Socket.IO event throughput, latency and ack round-trip of the socket clients.
+
+The stand-in server pushes `notification` events (invoice and transaction ones in
+turn) and `rates` events to SocketClient and AsyncSocketClient at a fixed rate (0
+for as fast as it can). Reported are the events per second the client handled, the
+end-to-end latency from the emit to the `on_notification` / `on_rates` callback and,
+for notifications, the round-trip time of the `{"status": "success"}` ack. Server and
+client share the process, so compare results taken on the same machine.
+
+    python -m benchmarks.notifications [--events 2000] [--rate 0] [--output notifications.json]
+"""
+
+import argparse
+import asyncio
+import time
+from functools import partial
+from time import perf_counter
+from typing import Any, Dict, List
+from uuid import UUID
+
+from chiefpay import AsyncSocketClient, SocketClient
+from chiefpay.decoding import VALIDATION_MODES
+from chiefpay.types import Rate
+
+from benchmarks import payloads
+from benchmarks.results import milliseconds, percentile, write_results
+from benchmarks.server import StandInServer
+
+
+API_KEY = "benchmark"
+EVENTS = ("notification", "rates")
+SUCCESS = {"status": "success"}
+
+
+class Trace:
+    """
+    Emit, receive and ack times of the events of one run, by sequence number.
+    """
+
+    def __init__(self):
+        self.sent: Dict[int, float] = {}
+        self.received: Dict[int, float] = {}
+        self.acks: Dict[int, float] = {}
+        self.failed_acks = 0
+
+    def receive(self, data: Any):
+        self.received[sequence(data)] = perf_counter()
+
+    def ack(self, seq: int, response: Any = None):
+        if response == SUCCESS:
+            self.acks[seq] = perf_counter()
+        else:
+            self.failed_acks += 1
+
+    def done(self, event: str, seqs: range) -> bool:
+        received = all(seq in self.received for seq in seqs)
+        if event != "notification":
+            return received
+        acked = sum(1 for seq in seqs if seq in self.acks)
+        return received and acked + self.failed_acks >= len(seqs)
+
+
+def event_payload(event: str, seq: int) -> Any:
+    """
+    Returns the payload of event `seq`, tagged with its sequence number so that
+    the client side can match it to its emit time.
+    """
+    if event == "rates":
+        return payloads.rates() + [{"name": "SEQ", "rate": str(seq)}]
+    data = payloads.notification(seq)
+    data[data["type"]]["id"] = str(UUID(int=seq, version=4))
+    return data
+
+
+def sequence(data: Any) -> int:
+    """
+    Returns the sequence number of a decoded event, in any decoding mode.
+    """
+    if isinstance(data, list):
+        for rate in data:
+            if isinstance(rate, dict):
+                rate = Rate.model_construct(**rate)
+            if rate.name == "SEQ":
+                return int(rate.rate)
+        raise ValueError("rates event without a sequence number")
+    if isinstance(data, dict):
+        item = data[data["type"]]
+        return _uuid_sequence(item["id"])
+    return _uuid_sequence(getattr(data, data.type).id)
+
+
+def _uuid_sequence(value: Any) -> int:
+    uuid = value if isinstance(value, UUID) else UUID(str(value))
+    # Clear the version and variant bits UUID(version=4) set.
+    return uuid.int & ~(0xF << 76) & ~(0x3 << 62)
+
+
+async def emit_events(
+    server: StandInServer, event: str, data: List, seqs: range, rate: float, trace: Trace
+):
+    """
+    Emits `data` to the last connected socket, `rate` events per second (0 for no pacing).
+    """
+    sid = server.sockets[-1]
+    start = perf_counter()
+    for index, (seq, payload) in enumerate(zip(seqs, data)):
+        if rate:
+            delay = start + index / rate - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        trace.sent[seq] = perf_counter()
+        callback = partial(trace.ack, seq) if event == "notification" else None
+        await server.sio.emit(event, payload, to=sid, callback=callback)
+
+
+def summarize(client: str, event: str, trace: Trace, seqs: range) -> Dict:
+    received = [seq for seq in seqs if seq in trace.received]
+    latencies = [trace.received[seq] - trace.sent[seq] for seq in received]
+    acks = [trace.acks[seq] - trace.sent[seq] for seq in seqs if seq in trace.acks]
+    start = min(trace.sent[seq] for seq in seqs)
+    elapsed = max((trace.received[seq] for seq in received), default=start) - start
+    return {
+        "client": client,
+        "event": event,
+        "events": len(seqs),
+        "received": len(received),
+        "lost": len(seqs) - len(received),
+        "seconds": elapsed,
+        "events_per_s": len(received) / elapsed if elapsed else 0.0,
+        "latency_p50_ms": milliseconds(percentile(latencies, 0.5)),
+        "latency_p99_ms": milliseconds(percentile(latencies, 0.99)),
+        "acks": len(acks),
+        "failed_acks": trace.failed_acks,
+        "ack_p50_ms": milliseconds(percentile(acks, 0.5)) if event == "notification" else None,
+        "ack_p99_ms": milliseconds(percentile(acks, 0.99)) if event == "notification" else None,
+    }
+
+
+def run_sync(server: StandInServer, event: str, args: argparse.Namespace) -> Dict:
+    trace = Trace()
+    client = SocketClient(API_KEY, base_url=server.url, validate=args.validate)
+    if event == "notification":
+        client.set_on_notification(trace.receive)
+    else:
+        client.set_on_rates(trace.receive)
+
+    with client:
+        for seqs in _runs(args):
+            data = [event_payload(event, seq) for seq in seqs]
+            server.submit(emit_events(server, event, data, seqs, args.rate, trace)).result()
+            deadline = time.monotonic() + args.timeout
+            while not trace.done(event, seqs) and time.monotonic() < deadline:
+                time.sleep(0.005)
+    return summarize("SocketClient", event, trace, seqs)
+
+
+async def run_async(server: StandInServer, event: str, args: argparse.Namespace) -> Dict:
+    trace = Trace()
+
+    async def receive(data: Any):
+        trace.receive(data)
+
+    client = AsyncSocketClient(API_KEY, base_url=server.url, validate=args.validate)
+    if event == "notification":
+        client.set_on_notification(receive)
+    else:
+        client.set_on_rates(receive)
+
+    async with client:
+        for seqs in _runs(args):
+            data = [event_payload(event, seq) for seq in seqs]
+            emitted = server.submit(emit_events(server, event, data, seqs, args.rate, trace))
+            await asyncio.wrap_future(emitted)
+            deadline = time.monotonic() + args.timeout
+            while not trace.done(event, seqs) and time.monotonic() < deadline:
+                await asyncio.sleep(0.005)
+    return summarize("AsyncSocketClient", event, trace, seqs)
+
+
+def _runs(args: argparse.Namespace) -> List[range]:
+    # Unmeasured warm-up events first (the connection may still be upgrading to a
+    # websocket), then the measured ones; their sequence numbers do not overlap.
+    return [range(args.events, args.events + args.warmup), range(args.events)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000, help="measured events per case and client")
+    parser.add_argument("--warmup", type=int, default=100, help="unmeasured events before each run")
+    parser.add_argument("--rate", type=float, default=0.0, help="events per second (0 for no pacing)")
+    parser.add_argument("--cases", nargs="+", choices=EVENTS, default=list(EVENTS), help="events to run")
+    parser.add_argument("--validate", choices=VALIDATION_MODES, default="full", help="decoding mode")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds to wait for the last events")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'event':<14}{'client':<19}{'events/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'ack p50':>9}{'ack p99':>9}{'lost':>6}"
+    )
+    with StandInServer() as server:
+        for event in args.cases:
+            for run in (run_sync, lambda *run_args: asyncio.run(run_async(*run_args))):
+                result = run(server, event, args)
+                results.append(result)
+                print(
+                    f"{event:<14}{result['client']:<19}{result['events_per_s']:>10.1f}"
+                    f"{result['latency_p50_ms'] or 0:>9.2f}{result['latency_p99_ms'] or 0:>9.2f}"
+                    f"{result['ack_p50_ms'] or 0:>9.2f}{result['ack_p99_ms'] or 0:>9.2f}"
+                    f"{result['lost']:>6}"
+                )
+
+    write_results(args.output, "notifications", vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
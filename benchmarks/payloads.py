@@ -0,0 +1,144 @@
+"""
+Deterministic synthetic API payloads shaped like the ChiefPay REST responses.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from uuid import UUID
+
+from chiefpay.utils import Utils
+
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+CHAINS = ("TRON", "ETH", "BSC", "POLYGON", "TON")
+TOKENS = ("USDT", "USDC", "NATIVE")
+STATUSES = (
+    "WAITING_SELECTION",
+    "WAITING_PAYMENT",
+    "COMPLETE",
+    "EXPIRED",
+    "OVER_PAID",
+    "UNDER_PAID",
+)
+
+
+def invoice(n: int, created_at: datetime = None) -> Dict:
+    rng = random.Random(n)
+    created_at = created_at or START + timedelta(seconds=n)
+    amount = f"{rng.randint(100, 100000) / 100:.2f}"
+    chain, token = rng.choice(CHAINS), rng.choice(TOKENS)
+    return {
+        "id": str(UUID(int=rng.getrandbits(128), version=4)),
+        "orderId": f"order-{n}",
+        "merchantName": "Benchmark Shop",
+        "amount": amount,
+        "paymentAmount": amount,
+        "paidAmount": amount if n % 3 else "0",
+        "feeIncluded": bool(n % 2),
+        "accuracy": "0.01",
+        "feeRate": "0.02",
+        "expectedMerchantAmount": f"{float(amount) * 0.98:.2f}",
+        "merchantPaidAmount": f"{float(amount) * 0.98:.2f}" if n % 3 else "0",
+        "createdAt": Utils.format_date(created_at),
+        "expiredAt": Utils.format_date(created_at + timedelta(hours=1)),
+        "status": STATUSES[n % len(STATUSES)],
+        "url": f"https://pay.chiefpay.org/invoice/{n}",
+        "urlSuccess": "https://shop.example/success",
+        "urlReturn": "https://shop.example/return",
+        "lastTransaction": {"chain": chain, "txid": f"{rng.getrandbits(256):064x}"},
+        "paymentDetails": {
+            "chain": chain,
+            "token": token,
+            "address": f"T{rng.getrandbits(160):040x}",
+            "amount": f"{float(amount) * 1.02:.6f}",
+        },
+    }
+
+
+def transaction(n: int, created_at: datetime = None) -> Dict:
+    rng = random.Random(-n - 1)
+    created_at = created_at or START + timedelta(seconds=n)
+    usd = rng.randint(100, 100000) / 100
+    return {
+        "txid": f"{rng.getrandbits(256):064x}",
+        "chain": rng.choice(CHAINS),
+        "token": rng.choice(TOKENS),
+        "value": f"{usd * 1.0003:.6f}",
+        "usd": f"{usd:.2f}",
+        "fee": f"{usd * 0.02:.2f}",
+        "wallet": {
+            "id": str(UUID(int=rng.getrandbits(128), version=4)),
+            "orderId": f"wallet-{n % 500}",
+        },
+        "createdAt": Utils.format_date(created_at),
+        "blockCreatedAt": Utils.format_date(created_at - timedelta(seconds=30)),
+        "merchantAmount": f"{usd * 0.98:.2f}",
+        "id": str(UUID(int=rng.getrandbits(128), version=4)),
+    }
+
+
+def wallet(n: int) -> Dict:
+    rng = random.Random(n)
+    return {
+        "id": str(UUID(int=rng.getrandbits(128), version=4)),
+        "orderId": f"wallet-{n}",
+        "addresses": [
+            {
+                "chain": chain,
+                "token": token,
+                "methodName": f"{token}_{chain}",
+                "address": f"T{rng.getrandbits(160):040x}",
+            }
+            for chain in CHAINS
+            for token in TOKENS[:2]
+        ],
+    }
+
+
+def rates() -> List[Dict]:
+    return [
+        {"name": name, "rate": rate}
+        for name, rate in (("BTC", "97000.12"), ("ETH", "3400.5"), ("TRX", "0.24"), ("TON", "5.4"))
+    ]
+
+
+def payment_methods(count: int = None) -> Dict:
+    pairs = [(chain, token) for chain in CHAINS for token in TOKENS]
+    methods = []
+    for n in range(len(pairs) if count is None else count):
+        chain, token = pairs[n % len(pairs)]
+        if n >= len(pairs):
+            chain = f"{chain}{n // len(pairs)}"
+        methods.append(
+            {
+                "chain": chain,
+                "token": token,
+                "methodName": f"{token}_{chain}",
+                "icon": f"https://static.chiefpay.org/icons/{token}_{chain}.svg",
+                "chainIcon": f"https://static.chiefpay.org/icons/{chain}.svg",
+                "tokenIcon": f"https://static.chiefpay.org/icons/{token}.svg",
+            }
+        )
+    return {"paymentMethods": methods}
+
+
+def notification(n: int) -> Dict:
+    if n % 2:
+        return {"type": "transaction", "transaction": transaction(n)}
+    return {"type": "invoice", "invoice": invoice(n)}
+
+
+def invoices_page(count: int, start: int = 0, total_count: int = None) -> Dict:
+    return {
+        "invoices": [invoice(n) for n in range(start, start + count)],
+        "totalCount": count if total_count is None else total_count,
+    }
+
+
+def transactions_page(count: int, start: int = 0, total_count: int = None) -> Dict:
+    return {
+        "transactions": [transaction(n) for n in range(start, start + count)],
+        "totalCount": count if total_count is None else total_count,
+    }
@@ -0,0 +1,154 @@
+"""
+Throughput and latency of Client and AsyncClient against the stand-in API.
+
+Each case (create_invoice, get_invoice and full history pages) is run through both
+clients at the same concurrency; throughput, p50/p99 latency and retries are
+printed and written as JSON, so that results can be compared between releases.
+The stand-in server runs in this process unless --url points to one started with
+`python -m benchmarks.server`, so compare results taken on the same machine.
+
+    python -m benchmarks.rest [--requests 500] [--concurrency 10] [--output rest.json]
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Callable, Dict, List
+from uuid import UUID
+
+from chiefpay import AsyncClient, Client
+from chiefpay.decoding import VALIDATION_MODES
+from chiefpay.exceptions import ChiefPayError
+
+from benchmarks.results import milliseconds, percentile, write_results
+from benchmarks.server import StandInServer, add_server_arguments, server_options
+
+
+API_KEY = "benchmark"
+FROM_DATE = "2025-01-01T00:00:00.000Z"
+
+# Client call of each case, given the client, the request number and the page size;
+# AsyncClient calls return the coroutine to await.
+CASES: Dict[str, Callable] = {
+    "create_invoice": lambda client, n, page_size: client.create_invoice(f"order-{n}", amount="15.4"),
+    "get_invoice": lambda client, n, page_size: client.get_invoice(str(UUID(int=n, version=4))),
+    "invoices_history": lambda client, n, page_size: client.get_invoices(FROM_DATE, limit=page_size),
+    "transactions_history": lambda client, n, page_size: client.get_transactions(
+        FROM_DATE, limit=page_size
+    ),
+}
+
+
+def summarize(
+    client: str, case: str, latencies: List[float], errors: int, elapsed: float, retries: int
+) -> Dict:
+    return {
+        "client": client,
+        "case": case,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "retries": retries,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": milliseconds(percentile(latencies, 0.5)),
+        "p99_ms": milliseconds(percentile(latencies, 0.99)),
+    }
+
+
+def run_sync(url: str, case: str, args: argparse.Namespace) -> Dict:
+    call = CASES[case]
+    # Requests are distinct, but single-flight is off so that none can be coalesced.
+    with Client(
+        API_KEY, base_url=url, validate=args.validate, single_flight=False, max_workers=args.concurrency
+    ) as client:
+
+        def timed(n: int) -> float:
+            start = perf_counter()
+            call(client, n, args.page_size)
+            return perf_counter() - start
+
+        for n in range(args.warmup):
+            timed(args.requests + n)
+        retries = _retries(client)
+
+        latencies, errors = [], 0
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            start = perf_counter()
+            futures = [pool.submit(timed, n) for n in range(args.requests)]
+            for future in futures:
+                try:
+                    latencies.append(future.result())
+                except ChiefPayError:
+                    errors += 1
+            elapsed = perf_counter() - start
+        return summarize("Client", case, latencies, errors, elapsed, _retries(client) - retries)
+
+
+async def run_async(url: str, case: str, args: argparse.Namespace) -> Dict:
+    call = CASES[case]
+    async with AsyncClient(
+        API_KEY, base_url=url, validate=args.validate, single_flight=False
+    ) as client:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def timed(n: int) -> float:
+            async with semaphore:
+                start = perf_counter()
+                await call(client, n, args.page_size)
+                return perf_counter() - start
+
+        for n in range(args.warmup):
+            await timed(args.requests + n)
+        retries = _retries(client)
+
+        start = perf_counter()
+        results = await asyncio.gather(
+            *(timed(n) for n in range(args.requests)), return_exceptions=True
+        )
+        elapsed = perf_counter() - start
+        latencies = [result for result in results if isinstance(result, float)]
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ChiefPayError):
+                raise result
+        errors = len(results) - len(latencies)
+        return summarize("AsyncClient", case, latencies, errors, elapsed, _retries(client) - retries)
+
+
+def _retries(client) -> int:
+    return sum(metrics.retries for metrics in client.metrics.stats().values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="measured requests per case and client")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests before each run")
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES), help="cases to run")
+    parser.add_argument("--validate", choices=VALIDATION_MODES, default="full", help="decoding mode")
+    parser.add_argument("--url", help="running stand-in server to use instead of starting one")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = None if args.url else StandInServer(**server_options(args))
+    with server or nullcontext():
+        url = args.url or server.url
+        results = []
+        print(f"{'case':<22}{'client':<13}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'retries':>9}")
+        for case in args.cases:
+            for run in (run_sync, lambda *run_args: asyncio.run(run_async(*run_args))):
+                result = run(url, case, args)
+                results.append(result)
+                print(
+                    f"{case:<22}{result['client']:<13}{result['throughput']:>10.1f}"
+                    f"{result['p50_ms'] or 0:>10.2f}{result['p99_ms'] or 0:>10.2f}"
+                    f"{result['errors']:>8}{result['retries']:>9}"
+                )
+
+    write_results(args.output, "rest", vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Statistics and JSON result files of the benchmarks, comparable between releases.
+"""
+
+import json
+import math
+import platform
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, Optional
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    Returns the nearest-rank `q` quantile (0 to 1) of `values`, or None if there are none.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def milliseconds(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
+
+
+def write_results(path: Optional[str], benchmark: str, options: Dict, results: List[Dict]):
+    """
+    Writes `results` to `path` with the versions and platform they were measured on;
+    does nothing if `path` is None.
+    """
+    if not path:
+        return
+    report = {
+        "benchmark": benchmark,
+        "chiefpay": _chiefpay_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "options": options,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def _chiefpay_version() -> Optional[str]:
+    try:
+        return version("chiefpay")
+    except PackageNotFoundError:
+        return None
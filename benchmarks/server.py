@@ -0,0 +1,296 @@
+"""
+Local stand-in for the ChiefPay REST API, serving synthetic payloads.
+
+Every REST path of `chiefpay.constants.Endpoints` is served, with a fixed added
+latency, a share of requests answered with 429 and configurable history page sizes.
+History pages are encoded once per size, so serving them costs little next to the
+clients under test. The Socket.IO endpoint accepts socket clients; events are pushed
+to them through `sio`.
+
+    python -m benchmarks.server [--port 8080] [--latency-ms 0] [--throttle 0] [--page-size 1000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Coroutine, Dict, List, Optional
+
+import socketio
+from aiohttp import web
+
+from chiefpay.constants import Endpoints
+
+from benchmarks import payloads
+
+
+class StandInServer:
+    """
+    Stand-in ChiefPay API on 127.0.0.1, run on its own event loop and thread.
+
+    Example:
+        with StandInServer(latency=0.005, throttle=0.01) as server:
+            client = Client("benchmark", base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle: float = 0.0,
+        retry_after_ms: int = 10,
+        page_size: int = 1000,
+        total_count: Optional[int] = None,
+        port: int = 0,
+    ):
+        """
+        Parameters:
+            latency (float): Seconds added to every response.
+            throttle (float): Fraction of requests answered with 429 (0 to 1).
+            retry_after_ms (int): Retry-After-ms header of the 429 responses.
+            page_size (int): Maximum number of items of a history page.
+            total_count (int, optional): `totalCount` of history pages (the page size if None).
+            port (int): Port to listen on (0 for a free one).
+        """
+        if not 0 <= throttle <= 1:
+            raise ValueError("throttle must be between 0 and 1")
+        self.latency = latency
+        self.throttle = throttle
+        self.retry_after_ms = retry_after_ms
+        self.page_size = page_size
+        self.total_count = total_count
+        self.port = port
+        self.requests = 0
+        self.throttled = 0
+        self.sio = socketio.AsyncServer(async_mode="aiohttp")
+        self.sio.on("connect", self._socket_connect)
+        self.sio.on("disconnect", self._socket_disconnect)
+        self.sockets: List[str] = []
+        self._random = random.Random(0)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        for endpoint in Endpoints:
+            for method, handler in _ROUTES.get(endpoint, ()):
+                app.router.add_route(method, endpoint.value, getattr(self, handler))
+        self.sio.attach(app, socketio_path=Endpoints.socket.value)
+        return app
+
+    async def start_async(self):
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop_async(self):
+        await self.sio.shutdown()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        # Socket.IO ping tasks outlive their sockets; finish them before the loop stops.
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def start(self) -> "StandInServer":
+        """
+        Starts serving on a background thread; returns once the port is bound.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start_async(), self._loop).result()
+        return self
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """
+        Runs `coroutine` on the server event loop, e.g. to emit Socket.IO events.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop_async(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith(Endpoints.socket.value):
+            return await handler(request)
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.throttle and self._random.random() < self.throttle:
+            self.throttled += 1
+            return web.json_response(
+                {"code": "RESOURCE_EXHAUSTED", "errors": ["rate limited"]},
+                status=429,
+                headers={"Retry-After-ms": str(self.retry_after_ms)},
+            )
+        return await handler(request)
+
+    async def _invoices_history(self, request: web.Request) -> web.Response:
+        return _json_body(_invoices_page(self._page_size(request), self.total_count))
+
+    async def _transactions_history(self, request: web.Request) -> web.Response:
+        return _json_body(_transactions_page(self._page_size(request), self.total_count))
+
+    async def _rates(self, request: web.Request) -> web.Response:
+        return _json_body(_rates())
+
+    async def _payment_methods(self, request: web.Request) -> web.Response:
+        return _json_body(_payment_methods())
+
+    async def _create_invoice(self, request: web.Request) -> web.Response:
+        spec = await request.json()
+        invoice = payloads.invoice(self.requests)
+        invoice["orderId"] = spec.get("orderId", invoice["orderId"])
+        if spec.get("amount") is not None:
+            invoice["amount"] = str(spec["amount"])
+        invoice["feeIncluded"] = bool(spec.get("feeIncluded"))
+        return web.json_response(invoice)
+
+    async def _invoice(self, request: web.Request) -> web.Response:
+        invoice = payloads.invoice(self.requests)
+        invoice["id"] = request.match_info["id"]
+        return web.json_response(invoice)
+
+    async def _patch_invoice(self, request: web.Request) -> web.Response:
+        spec = await request.json()
+        invoice = payloads.invoice(self.requests)
+        invoice["id"] = request.match_info["id"]
+        if spec.get("amount") is not None:
+            invoice["amount"] = str(spec["amount"])
+        return web.json_response(invoice)
+
+    async def _cancel_invoice(self, request: web.Request) -> web.Response:
+        invoice = payloads.invoice(self.requests)
+        invoice["id"] = request.match_info["id"]
+        invoice["status"] = "EXPIRED"
+        return web.json_response(invoice)
+
+    async def _create_wallet(self, request: web.Request) -> web.Response:
+        spec = await request.json()
+        wallet = payloads.wallet(self.requests)
+        wallet["orderId"] = spec.get("orderId", wallet["orderId"])
+        return web.json_response(wallet)
+
+    async def _wallet(self, request: web.Request) -> web.Response:
+        wallet = payloads.wallet(self.requests)
+        wallet["id"] = request.match_info["id"]
+        return web.json_response(wallet)
+
+    async def _socket_connect(self, sid: str, environ: Dict):
+        if not environ.get("HTTP_X_API_KEY"):
+            raise socketio.exceptions.ConnectionRefusedError("Wrong api key")
+        self.sockets.append(sid)
+
+    async def _socket_disconnect(self, sid: str, *args):
+        if sid in self.sockets:
+            self.sockets.remove(sid)
+
+    def _page_size(self, request: web.Request) -> int:
+        try:
+            limit = int(request.query.get("limit", 100))
+        except ValueError:
+            raise web.HTTPBadRequest(
+                text=json.dumps({"code": "INVALID_ARGUMENT", "errors": ["limit"]}),
+                content_type="application/json",
+            )
+        return max(0, min(limit, self.page_size))
+
+
+# HTTP methods and StandInServer handlers, by endpoint (Endpoints.socket is served by `sio`).
+_ROUTES = {
+    Endpoints.invoices_history: (("GET", "_invoices_history"),),
+    Endpoints.transactions_history: (("GET", "_transactions_history"),),
+    Endpoints.rates: (("GET", "_rates"),),
+    Endpoints.payment_methods: (("GET", "_payment_methods"),),
+    Endpoints.invoice: (("POST", "_create_invoice"),),
+    Endpoints.invoice_by_id: (("GET", "_invoice"), ("PATCH", "_patch_invoice")),
+    Endpoints.invoice_cancel: (("POST", "_cancel_invoice"),),
+    Endpoints.invoice_prolong: (("POST", "_invoice"),),
+    Endpoints.invoice_subscribe: (("GET", "_invoice"),),
+    Endpoints.wallet: (("POST", "_create_wallet"),),
+    Endpoints.wallet_by_id: (("GET", "_wallet"),),
+}
+
+
+def _json_body(body: bytes) -> web.Response:
+    return web.Response(body=body, content_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def _invoices_page(count: int, total_count: Optional[int]) -> bytes:
+    return json.dumps(payloads.invoices_page(count, total_count=total_count)).encode()
+
+
+@lru_cache(maxsize=None)
+def _transactions_page(count: int, total_count: Optional[int]) -> bytes:
+    return json.dumps(payloads.transactions_page(count, total_count=total_count)).encode()
+
+
+@lru_cache(maxsize=None)
+def _rates() -> bytes:
+    return json.dumps(payloads.rates()).encode()
+
+
+@lru_cache(maxsize=None)
+def _payment_methods() -> bytes:
+    return json.dumps(payloads.payment_methods()).encode()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added to every response")
+    parser.add_argument("--throttle", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after-ms", type=int, default=10, help="Retry-After-ms of the 429 responses")
+    parser.add_argument("--page-size", type=int, default=1000, help="items per history page")
+
+
+def server_options(args: argparse.Namespace) -> Dict:
+    return {
+        "latency": args.latency_ms / 1000,
+        "throttle": args.throttle,
+        "retry_after_ms": args.retry_after_ms,
+        "page_size": args.page_size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = StandInServer(port=args.port, **server_options(args))
+    with server:
+        print(f"Serving the ChiefPay API on {server.url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
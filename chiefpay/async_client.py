@@ -1,13 +1,38 @@
 import aiohttp
-from typing import Dict, Optional
+import asyncio
+import warnings
+from functools import partial
+from time import perf_counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type, Union
 from chiefpay.base import BaseClient
-from chiefpay.constants import Endpoints
+from chiefpay.breaker import CircuitBreaker
+from chiefpay.cache import InvoiceCache, PaymentMethodsCache, RatesCache
+from chiefpay.codec import JSON_CONTENT_TYPE, JSONCodec
+from chiefpay.concurrency import AdaptiveConcurrency, report_overload, report_success
+from chiefpay.constants import BASE_URL, Endpoints
+from chiefpay.deadline import Deadline
+from chiefpay.decoding import HistoryModel, Validation
+from chiefpay.hedging import HedgePolicy, Hedger
 from chiefpay.exceptions import (
     APIError,
     InvalidJSONError,
     ManyRequestsError,
+    RequestTimeoutError,
     TransportError,
 )
+from chiefpay.pagination import (
+    MAX_PAGE_SIZE,
+    HistoryCursor,
+    item_created_at,
+    item_id,
+    split_range,
+)
+from chiefpay.metrics import Metrics
+from chiefpay.profiling import CallProfile, Profiler
+from chiefpay.ratelimit import RateLimit
+from chiefpay.transport import PoolStats, TransportConfig
 from chiefpay.types import (
     Rate,
     Wallet,
@@ -20,7 +45,7 @@ from chiefpay.types import (
 )
 from chiefpay.utils import Utils
 
-from asyncio import sleep
+from asyncio import Semaphore, ensure_future, gather, sleep
 
 
 class AsyncClient(BaseClient):
@@ -28,64 +53,302 @@ class AsyncClient(BaseClient):
     Client for making asynchronous requests to the payment system API.
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        transport: Optional[TransportConfig] = None,
+        rates_cache: Optional[RatesCache] = None,
+        payment_methods_cache: Optional[PaymentMethodsCache] = None,
+        invoice_cache: Optional[InvoiceCache] = None,
+        validate: Validation = "full",
+        codec: Optional[JSONCodec] = None,
+        rate_limit: Optional[RateLimit] = None,
+        single_flight: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        profiler: Optional[Profiler] = None,
+        hedging: Optional[HedgePolicy] = None,
+    ):
+        """
+        Initialize the client.
+
+        Parameters:
+            api_key (str): API key for authentication.
+            base_url (str): Base URL for the API endpoints.
+            transport (TransportConfig, optional): Connection pooling and timeout settings.
+            rates_cache (RatesCache, optional): Cache `get_rates` is served from.
+            payment_methods_cache (PaymentMethodsCache, optional): Cache `get_payment_methods` is served from.
+            invoice_cache (InvoiceCache, optional): Cache `get_invoice` is served from.
+            validate (str): How responses are decoded: "full" validates them into models
+                and "raw" returns plain dicts.
+            codec (JSONCodec, optional): JSON codec for request and response bodies
+                (orjson when installed, the standard library otherwise).
+            rate_limit (RateLimit, optional): Client-side request budget, shared by every
+                client using the same API key.
+            single_flight (bool): Whether identical concurrent GET requests share one HTTP call
+                (each caller still decodes the shared response itself). Off by default.
+            circuit_breaker (CircuitBreaker, optional): Fails requests fast while the API is failing.
+            metrics (Metrics, optional): Request hooks and metrics, e.g. shared with other clients.
+            profiler (Profiler, optional): Reports the per-phase timing of sampled calls.
+            hedging (HedgePolicy, optional): When a slow GET request is sent a second time
+                (never, if not set).
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            transport,
+            rates_cache,
+            payment_methods_cache,
+            invoice_cache,
+            validate,
+            codec,
+            rate_limit,
+            single_flight,
+            circuit_breaker,
+            metrics,
+            profiler,
+        )
+        self.hedger = Hedger(hedging) if hedging else None
+        self._background_tasks = set()
+
     def _init_session(self):
-        return aiohttp.ClientSession(headers=self.headers)
+        connector = aiohttp.TCPConnector(
+            limit=self.transport.total_limit,
+            limit_per_host=self.transport.pool_size_per_host,
+            keepalive_timeout=self.transport.keepalive_timeout,
+            ttl_dns_cache=self.transport.dns_cache_ttl,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.transport.connect_timeout,
+            sock_read=self.transport.read_timeout,
+        )
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[self.profiler.trace_config()] if self.profiler is not None else None,
+        )
 
-    async def _request(self, method: str, path: str, max_retries: int = 3, **kwargs):
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the HTTP connection pool utilization.
+
+        The counts come from aiohttp connector internals; they are 0 if this aiohttp
+        version does not expose them.
+        """
+        connector = self.session.connector if self.session else None
+        conns = _internal(connector, "_conns", dict)
+        acquired = _internal(connector, "_acquired_per_host", dict)
+        waiters = _internal(connector, "_waiters", dict)
+        return PoolStats(
+            hosts=len(set(conns) | {key for key, protos in acquired.items() if protos}),
+            in_use=len(_internal(connector, "_acquired", set)),
+            idle=sum(len(protos) for protos in conns.values()),
+            waiting=sum(len(queue) for queue in waiters.values()),
+            limit=self.transport.total_limit,
+            limit_per_host=self.transport.pool_size_per_host,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        max_retries: int = 3,
+        with_headers: bool = False,
+        json: Optional[Dict] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        **kwargs,
+    ):
         url = self._get_url(path)
+        deadline = Deadline.of(deadline)
+        if json is not None:
+            kwargs["data"] = self.codec.dumps(json)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **JSON_CONTENT_TYPE}
+
+        profile = self.profiler.sample(method, path) if self.profiler is not None else None
+        send = partial(
+            self._send, method, path, url, max_retries, with_headers, deadline, profile, **kwargs
+        )
+        key = self._flight_key(method, url, with_headers, kwargs)
+        if key is not None and self.single_flight is not None:
+            return await self.single_flight.do_async(
+                key, send, deadline.remaining() if deadline else None
+            )
+        return await send()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        max_retries: int,
+        with_headers: bool,
+        deadline: Optional[Deadline],
+        profile: Optional[CallProfile],
+        **kwargs,
+    ):
         for attempt in range(max_retries):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(
+                    path, deadline.remaining() if deadline else None
+                )
+            timeout, by_deadline = self._timeout(path, deadline)
             try:
-                async with self.session.request(method, url, **kwargs) as response:
-                    return await self._handle_response(response)
-            except ManyRequestsError:
+                with self._guard(path):
+                    start = perf_counter()
+                    if method == "GET" and self.hedger is not None:
+                        data, headers = await self._hedged_attempt(
+                            method, path, url, timeout, by_deadline, profile, **kwargs
+                        )
+                    else:
+                        data, headers = await self._attempt(
+                            method, path, url, timeout, by_deadline, profile, **kwargs
+                        )
+                    report_success(perf_counter() - start)
+                return (data, headers) if with_headers else data
+            except ManyRequestsError as e:
+                report_overload()
                 if attempt == max_retries - 1:
-                    raise ManyRequestsError() from None
-                continue
+                    raise
+                self.metrics.retried(path, e.retry_after)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.penalize(e.retry_after)
+                elif deadline is not None and e.retry_after >= deadline.remaining():
+                    raise RequestTimeoutError(
+                        "Deadline exceeded before retrying", deadline_exceeded=True
+                    ) from e
+                else:
+                    await sleep(e.retry_after)
+
+    async def _hedged_attempt(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Optional[float],
+        by_deadline: bool,
+        profile: Optional[CallProfile],
+        **kwargs,
+    ):
+        """
+        Runs one attempt through the hedger. The hedged copy of the attempt gets its own
+        profile and is only sent if the rate limiter has a token for it right away.
+        """
+        profiles = [profile, profile.copy() if profile is not None else None]
+
+        def attempt():
+            return self._attempt(
+                method, path, url, timeout, by_deadline, profiles.pop(0), **kwargs
+            )
+
+        admit = None
+        if self.rate_limiter is not None:
+            admit = lambda: self.rate_limiter.reserve(path, 0) is not None
+        return await self.hedger.run(path, attempt, admit)
+
+    async def _attempt(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Optional[float],
+        by_deadline: bool,
+        profile: Optional[CallProfile],
+        **kwargs,
+    ):
+        client_timeout = aiohttp.ClientTimeout(
+            total=timeout,
+            sock_connect=self.transport.connect_timeout,
+            sock_read=self.transport.read_timeout,
+        )
+        with self.metrics.track(method, path, url, kwargs.get("data")) as event:
+            if profile is not None:
+                Profiler.start_attempt(profile)
+            try:
+                async with self.session.request(
+                    method, url, timeout=client_timeout, trace_request_ctx=profile, **kwargs
+                ) as response:
+                    event.status = response.status
+                    event.bytes_in = response.content_length or 0
+                    body = await self._handle_response(response)
+                    if body is not None:
+                        event.bytes_in = len(body)
+                        if profile is not None:
+                            body = Profiler.body_read(profile, body)
+                    return body, response.headers
+            except asyncio.TimeoutError as e:
+                # Socket timeouts are the configured ones; only the total one is the deadline's.
+                raise RequestTimeoutError(
+                    f"Request to {url} timed out",
+                    deadline_exceeded=by_deadline and not isinstance(e, aiohttp.ServerTimeoutError),
+                ) from e
 
     async def _get_request(
-        self, path: str, params: Optional[Dict] = {}, max_retries: int = 3
+        self,
+        path: str,
+        params: Optional[Dict] = {},
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
-        params = self._get_json(params)
+        params = {
+            k: str(v).lower() if isinstance(v, bool) else v
+            for k, v in self._get_json(params).items()
+        }
 
-        return await self._request("GET", path, max_retries, params=params)
+        return await self._request("GET", path, max_retries, params=params, deadline=deadline)
 
     async def _post_request(
-        self, path: str, json: Optional[Dict] = {}, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = {},
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         json = self._get_json(json)
 
-        return await self._request("POST", path, max_retries, json=json)
+        return await self._request("POST", path, max_retries, json=json, deadline=deadline)
 
     async def _patch_request(
-        self, path: str, json: Optional[Dict] = {}, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = {},
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         json = self._get_json(json)
 
-        return await self._request("PATCH", path, max_retries, json=json)
+        return await self._request("PATCH", path, max_retries, json=json, deadline=deadline)
 
     async def _delete_request(
-        self, path: str, json: Optional[Dict] = {}, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = {},
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         json = self._get_json(json)
 
-        return await self._request("DELETE", path, max_retries, json=json)
+        return await self._request("DELETE", path, max_retries, json=json, deadline=deadline)
 
     def _get_json(self, data: Dict = {}):
         return {k: v for k, v in data.items() if v is not None}
 
-    @staticmethod
-    async def _handle_response(response: aiohttp.ClientResponse):
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse
+    ) -> Optional[bytes]:
         if response.status == 429:
-            headers = response.headers
-            retry = int(headers.get("Retry-After-ms", "3000")) / 1000
-            await sleep(retry)
-            raise ManyRequestsError()
+            raise ManyRequestsError(int(response.headers.get("Retry-After-ms", "3000")) / 1000)
+
+        if response.status == 304:
+            return None
+
+        body = await response.read()
 
         if not (200 <= response.status < 300):
-            text = await response.text()
             try:
-                content_type = response.headers.get("Content-Type", "")
-                error_data = await response.json(content_type=content_type)
+                error_data = self.codec.loads(body)
                 if error_data:
                     raise APIError(
                         status_code=response.status,
@@ -93,49 +356,113 @@ class AsyncClient(BaseClient):
                         code=error_data.get("code"),
                         errors=error_data.get("errors"),
                     )
-                raise TransportError(response.status, text)
+                raise TransportError(
+                    response.status, body.decode(response.charset or "utf-8", "replace")
+                )
             except ValueError:
-                raise InvalidJSONError()
+                raise InvalidJSONError(status_code=response.status)
 
-        try:
-            data = await response.json()
-            return data
-        except ValueError:
-            raise InvalidJSONError()
+        return body
 
-    async def get_rates(self) -> list[Rate]:
+    async def get_rates(self, deadline: Optional[Union[float, Deadline]] = None) -> list[Rate]:
         """
         Asynchronously retrieves the current exchange rates.
 
+        Served from the rates cache, if the client has one and it is fresh.
+
+        Parameters:
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
         Returns:
              Rate DTO: The exchange rate data.
         """
-        rates = await self._get_request(Endpoints.rates)
-        return [Rate(**rate) for rate in rates]
-
-    async def get_payment_methods(self) -> PaymentMethods:
+        if self.rates_cache is not None:
+            rates = self.rates_cache.get()
+            if rates is not None:
+                return rates
+
+        response_data = await self._get_request(Endpoints.rates, deadline=deadline)
+        rates = self._decode_list(Rate, response_data)
+        if self.rates_cache is not None:
+            self.rates_cache.set(rates)
+        return rates
+
+    async def get_payment_methods(
+        self,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> PaymentMethods:
         """
         Asynchronously retrieves the list of available payment methods.
 
+        Served from the payment methods cache, if the client has one.
+
+        Parameters:
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
         Returns:
              PaymentMethods: The payment methods data.
         """
-        response_data = await self._get_request(Endpoints.payment_methods)
-        return PaymentMethods(**response_data)
+        if self.payment_methods_cache is None:
+            response_data = await self._get_request(Endpoints.payment_methods, deadline=deadline)
+            return self._decode(PaymentMethods, response_data)
+
+        payment_methods, refresh = self.payment_methods_cache.get()
+        if refresh:
+            task = ensure_future(self._refresh_payment_methods())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            # A failed background refresh is retried by a later call.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        if payment_methods is not None:
+            return payment_methods
+        return await self._refresh_payment_methods(deadline)
+
+    async def _refresh_payment_methods(
+        self,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> PaymentMethods:
+        cache = self.payment_methods_cache
+        try:
+            response_data, headers = await self._request(
+                "GET",
+                Endpoints.payment_methods,
+                headers=cache.conditional_headers(),
+                with_headers=True,
+                deadline=deadline,
+            )
+        except BaseException:
+            cache.refresh_failed()
+            raise
+        payment_methods = (
+            self._decode(PaymentMethods, response_data)
+            if response_data is not None
+            else None
+        )
+        return cache.update(payment_methods, headers)
 
-    async def get_invoice(self, id: str) -> Invoice:
+    async def get_invoice(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Invoice:
         """
         Asynchronously retrieves information about a specific invoice by ID.
 
         Parameters:
             id (str): The invoice ID (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Invoice DTO: The invoice data.
         """
+        if self.invoice_cache is not None:
+            invoice = self.invoice_cache.get(id)
+            if invoice is not None:
+                return invoice
+
         endpoint = Endpoints.invoice_by_id.value.format(id=id)
-        response_data = await self._get_request(endpoint)
-        return Invoice(**response_data)
+        response_data = await self._get_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
     async def get_invoices(
         self,
@@ -143,6 +470,7 @@ class AsyncClient(BaseClient):
         to_date: Optional[str] = None,
         limit: int = 100,
         not_notified: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> InvoicesHistory:
         """
         Asynchronously retrieves a list of invoices within a specified date range.
@@ -151,6 +479,7 @@ class AsyncClient(BaseClient):
             to_date (Optional[str], optional): The end date for the invoice history in 'YYYY-MM-DD' format. Defaults to None.
             limit (int, optional): The maximum number of invoices to retrieve. Defaults to 100.
             not_notified (bool, optional): Return only notifications not yet acknowledged.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
         Returns:
             InvoicesHistory: An object containing the list of invoices and the total count of invoices.
         Raises:
@@ -164,11 +493,10 @@ class AsyncClient(BaseClient):
         if not_notified is not None:
             params["notNotified"] = not_notified
 
-        response_data = await self._get_request(Endpoints.invoices_history, params)
-        invoices = [Invoice(**data) for data in response_data.get("invoices")]
-        return InvoicesHistory(
-            invoices=invoices, totalCount=response_data.get("totalCount")
+        response_data = await self._get_request(
+            Endpoints.invoices_history, params, deadline=deadline
         )
+        return self._decode(InvoicesHistory, response_data)
 
     async def get_transactions(
         self,
@@ -176,6 +504,7 @@ class AsyncClient(BaseClient):
         to_date: Optional[str] = None,
         limit: int = 100,
         not_notified: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> TransactionsHistory:
         """
         Asynchronously retrieves transaction history within a specified date range.
@@ -184,6 +513,7 @@ class AsyncClient(BaseClient):
             to_date (Optional[str], optional): The end date for the transaction history in 'YYYY-MM-DD' format. Defaults to None.
             limit (int, optional): The maximum number of transactions to retrieve. Defaults to 100.
             not_notified (bool, optional): Return only notifications not yet acknowledged.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
         Returns:
             TransactionsHistory: An object containing the list of transactions and the total count.
         Raises:
@@ -197,47 +527,259 @@ class AsyncClient(BaseClient):
         if not_notified is not None:
             params["notNotified"] = not_notified
 
-        response_data = await self._get_request(Endpoints.transactions_history, params)
-        transactions = [
-            Transaction(**data) for data in response_data.get("transactions")
-        ]
-        return TransactionsHistory(
-            transactions=transactions, totalCount=response_data.get("totalCount")
+        response_data = await self._get_request(
+            Endpoints.transactions_history, params, deadline=deadline
         )
+        return self._decode(TransactionsHistory, response_data)
 
-    async def get_wallet(self, id: str) -> Wallet:
+    async def iter_invoices(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> AsyncIterator[Invoice]:
+        """
+        Asynchronously iterates over all invoices within a specified date range, page by page.
+
+        The next page is requested while the current one is consumed,
+        and at most two pages are held in memory.
+
+        Args:
+            from_date (str): The start date for the invoice history in 'YYYY-MM-DDTHH:MM:SS.sssZ' format.
+            to_date (Optional[str], optional): The end date for the invoice history. Defaults to None.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            page_size (int, optional): The number of invoices per request (max 1000). Defaults to 1000.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+        Yields:
+            Invoice: The invoices, one at a time.
+        Raises:
+            ValueError: If the date format for `from_date` or `to_date` is invalid.
+        """
+        cursor = HistoryCursor(from_date, to_date, page_size, not_notified)
+        async for item in self._iter_history(
+            Endpoints.invoices_history, InvoicesHistory, cursor, Deadline.of(deadline)
+        ):
+            yield item
+
+    async def iter_transactions(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Asynchronously iterates over all transactions within a specified date range, page by page.
+
+        The next page is requested while the current one is consumed,
+        and at most two pages are held in memory.
+
+        Args:
+            from_date (str): The start date for the transaction history in 'YYYY-MM-DDTHH:MM:SS.sssZ' format.
+            to_date (Optional[str], optional): The end date for the transaction history. Defaults to None.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            page_size (int, optional): The number of transactions per request (max 1000). Defaults to 1000.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+        Yields:
+            Transaction: The transactions, one at a time.
+        Raises:
+            ValueError: If the date format for `from_date` or `to_date` is invalid.
+        """
+        cursor = HistoryCursor(from_date, to_date, page_size, not_notified)
+        async for item in self._iter_history(
+            Endpoints.transactions_history, TransactionsHistory, cursor, Deadline.of(deadline)
+        ):
+            yield item
+
+    async def _iter_history(
+        self,
+        endpoint: Endpoints,
+        model: Type[HistoryModel],
+        cursor: HistoryCursor,
+        deadline: Optional[Deadline],
+    ) -> AsyncIterator:
+        task = ensure_future(self._get_request(endpoint, cursor.params(), deadline=deadline))
+        try:
+            while task is not None:
+                items = cursor.advance(*self._decode_history(model, await task))
+                task = (
+                    None
+                    if cursor.done
+                    else ensure_future(
+                        self._get_request(endpoint, cursor.params(), deadline=deadline)
+                    )
+                )
+                for item in items:
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def fetch_invoices(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        shards: int = 8,
+        concurrency: Union[int, AdaptiveConcurrency] = 8,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> InvoicesHistory:
+        """
+        Asynchronously retrieves all invoices within a date range using concurrent requests.
+
+        The range is split into time shards that are fetched in parallel. A shard whose
+        `totalCount` exceeds the page limit is bisected until every shard fits in one page.
+        Args:
+            from_date (str): The start date for the invoice history in 'YYYY-MM-DDTHH:MM:SS.sssZ' format.
+            to_date (Optional[str], optional): The end date for the invoice history. Defaults to now.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            shards (int, optional): The number of shards the range is initially split into. Defaults to 8.
+            concurrency (int | AdaptiveConcurrency, optional): The maximum number of requests
+                in flight, or a controller adjusting it to the responses. Defaults to 8.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+        Returns:
+            InvoicesHistory: All invoices in the range, de-duplicated by id and ordered by creation date.
+        Raises:
+            ValueError: If the date format for `from_date` or `to_date` is invalid.
+        """
+        items = await self._fetch_sharded(
+            Endpoints.invoices_history,
+            InvoicesHistory,
+            from_date,
+            to_date,
+            not_notified,
+            shards,
+            concurrency,
+            Deadline.of(deadline),
+        )
+        return self._build_history(InvoicesHistory, items)
+
+    async def fetch_transactions(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        shards: int = 8,
+        concurrency: Union[int, AdaptiveConcurrency] = 8,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> TransactionsHistory:
+        """
+        Asynchronously retrieves all transactions within a date range using concurrent requests.
+
+        The range is split into time shards that are fetched in parallel. A shard whose
+        `totalCount` exceeds the page limit is bisected until every shard fits in one page.
+        Args:
+            from_date (str): The start date for the transaction history in 'YYYY-MM-DDTHH:MM:SS.sssZ' format.
+            to_date (Optional[str], optional): The end date for the transaction history. Defaults to now.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            shards (int, optional): The number of shards the range is initially split into. Defaults to 8.
+            concurrency (int | AdaptiveConcurrency, optional): The maximum number of requests
+                in flight, or a controller adjusting it to the responses. Defaults to 8.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+        Returns:
+            TransactionsHistory: All transactions in the range, de-duplicated by id and ordered by creation date.
+        Raises:
+            ValueError: If the date format for `from_date` or `to_date` is invalid.
+        """
+        items = await self._fetch_sharded(
+            Endpoints.transactions_history,
+            TransactionsHistory,
+            from_date,
+            to_date,
+            not_notified,
+            shards,
+            concurrency,
+            Deadline.of(deadline),
+        )
+        return self._build_history(TransactionsHistory, items)
+
+    async def _fetch_sharded(
+        self,
+        endpoint: Endpoints,
+        model: Type[HistoryModel],
+        from_date: str,
+        to_date: Optional[str],
+        not_notified: Optional[bool],
+        shards: int,
+        concurrency: Union[int, AdaptiveConcurrency],
+        deadline: Optional[Deadline],
+    ) -> List:
+        Utils.validate_date(from_date)
+        if to_date:
+            Utils.validate_date(to_date)
+        else:
+            to_date = Utils.format_date(datetime.now(timezone.utc))
+
+        slot = _slots(concurrency)
+        results = {}
+
+        async def fetch(shard_from: str, shard_to: str):
+            params = {"fromDate": shard_from, "toDate": shard_to, "limit": MAX_PAGE_SIZE}
+            if not_notified is not None:
+                params["notNotified"] = not_notified
+            async with slot():
+                body = await self._get_request(endpoint, params, deadline=deadline)
+
+            items, total_count = self._decode_history(model, body)
+            if total_count > len(items):
+                halves = split_range(shard_from, shard_to, 2)
+                if len(halves) > 1:
+                    await gather(*(fetch(*half) for half in halves))
+                    return
+                warnings.warn(
+                    f"More than {MAX_PAGE_SIZE} history items were created at {shard_from}; "
+                    "some of them were skipped.",
+                    RuntimeWarning,
+                )
+            for item in items:
+                results[item_id(item)] = item
+
+        await gather(*(fetch(*shard) for shard in split_range(from_date, to_date, shards)))
+        return sorted(results.values(), key=item_created_at)
+
+    async def get_wallet(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Wallet:
         """
         Retrieve wallet information by wallet ID.
         Args:
             id (str): The ID of the wallet to retrieve (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
         Returns:
             Wallet: An instance of the Wallet class containing the retrieved wallet information.
         """
         endpoint = Endpoints.wallet_by_id.value.format(id=id)
-        response_data = await self._get_request(endpoint)
-        return Wallet(**response_data)
+        response_data = await self._get_request(endpoint, deadline=deadline)
+        return self._decode(Wallet, response_data)
 
     async def create_invoice(
         self,
         order_id: str,
-        amount: Optional[str] = None,
+        amount: Optional[Union[str, Decimal]] = None,
         fee_included: Optional[bool] = False,
-        accuracy: Optional[str] = None,
+        accuracy: Optional[Union[str, Decimal]] = None,
         url_return: Optional[str] = None,
         url_success: Optional[str] = None,
         chain_token: Optional[ChainToken] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> Invoice:
         """
         Asynchronously creates a new invoice.
 
         Parameters:
             order_id (str): The order ID in your system.
-            amount (str, optional): The amount in USD (decimal string, e.g., "15.4").
+            amount (str | Decimal, optional): The amount in USD (e.g., "15.4").
             fee_included (bool, optional): Whether the fee is included in the amount.
-            accuracy (str, optional): Payment tolerance ("0" to "0.05", e.g., "0.01" = 99% minimum).
+            accuracy (str | Decimal, optional): Payment tolerance ("0" to "0.05", e.g., "0.01" = 99% minimum).
             url_return (str, optional): Redirect URL after failure.
             url_success (str, optional): Redirect URL after success.
             chain_token (ChainToken, optional): Pre-selected chain and token.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Invoice DTO: The created invoice data.
@@ -257,65 +799,115 @@ class AsyncClient(BaseClient):
                 "token": chain_token.token,
             }
 
-        response_data = await self._post_request(Endpoints.invoice, json=data)
-        return Invoice(**response_data)
+        response_data = await self._post_request(Endpoints.invoice, json=data, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
+
+    async def create_invoices(
+        self,
+        specs: Sequence[Dict],
+        concurrency: Union[int, AdaptiveConcurrency] = 10,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> List[Union[Invoice, Exception]]:
+        """
+        Asynchronously creates many invoices concurrently.
+
+        Parameters:
+            specs (Sequence[dict]): Keyword arguments for `create_invoice`, one dict per invoice.
+            concurrency (int | AdaptiveConcurrency, optional): The maximum number of requests
+                in flight, or a controller adjusting it to the responses. Defaults to 10.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
+        Returns:
+             list: For each spec, in input order, the created Invoice or the error raised while
+                 creating it (a ChiefPayError, or e.g. an aiohttp.ClientError if the connection failed).
+        """
+        slot = _slots(concurrency)
+        deadline = Deadline.of(deadline)
+
+        async def create(spec: Dict) -> Union[Invoice, Exception]:
+            try:
+                async with slot():
+                    return await self.create_invoice(**spec, deadline=deadline)
+            except Exception as e:
+                # Connection and timeout errors too: the other invoices may already exist,
+                # so their results must not be lost to one failed item.
+                return e
 
-    async def create_wallet(self, order_id: str) -> Wallet:
+        return list(await gather(*(create(spec) for spec in specs)))
+
+    async def create_wallet(
+        self,
+        order_id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Wallet:
         """
         Asynchronously creates a new wallet.
 
         Parameters:
             order_id (str): The order ID.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Wallet DTO: The created wallet data.
         """
         data = {"orderId": order_id}
 
-        response_data = await self._post_request(Endpoints.wallet, json=data)
-        return Wallet(**response_data)
+        response_data = await self._post_request(Endpoints.wallet, json=data, deadline=deadline)
+        return self._decode(Wallet, response_data)
 
-    async def cancel_invoice(self, id: str) -> Invoice:
+    async def cancel_invoice(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Invoice:
         """
         Asynchronously cancels an invoice by its ID.
 
         Parameters:
             id (str): The invoice ID (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
                 Invoice DTO: The invoice data.
         """
         endpoint = Endpoints.invoice_cancel.value.format(id=id)
-        response_data = await self._post_request(endpoint)
-        return Invoice(**response_data)
+        response_data = await self._post_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
-    async def prolongate_invoice(self, id: str) -> Invoice:
+    async def prolongate_invoice(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Invoice:
         """
         Asynchronously prolongs an existing invoice expiration time.
 
         Parameters:
             id (str): The invoice ID (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Invoice DTO: The invoice data.
         """
         endpoint = Endpoints.invoice_prolong.value.format(id=id)
-        response_data = await self._post_request(endpoint)
-        return Invoice(**response_data)
+        response_data = await self._post_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
     async def patch_invoice(
         self,
         id: str,
-        amount: Optional[str] = None,
+        amount: Optional[Union[str, Decimal]] = None,
         chain_token: Optional[ChainToken] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> Invoice:
         """
         Updates invoice amount and/or chain_token if they were not set during creation.
 
         Parameters:
             id (str): The invoice ID (UUID).
-            amount (str, optional): Invoice amount (can only be set if not specified during creation).
+            amount (str | Decimal, optional): Invoice amount (can only be set if not specified during creation).
             chain_token (ChainToken, optional): Chain and token (can only be set if not specified during creation).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
             Invoice DTO: The updated invoice details.
@@ -330,8 +922,8 @@ class AsyncClient(BaseClient):
             }
 
         endpoint = Endpoints.invoice_by_id.value.format(id=id)
-        response_data = await self._patch_request(endpoint, json=data)
-        return Invoice(**response_data)
+        response_data = await self._patch_request(endpoint, json=data, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
     async def close(self):
         """
@@ -339,10 +931,27 @@ class AsyncClient(BaseClient):
 
         This should be called after all asynchronous requests are complete.
         """
-        await self.session.close()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
+
+
+def _internal(connector: Optional[aiohttp.BaseConnector], name: str, kind: type) -> Any:
+    """
+    Returns a private attribute of `connector`, or an empty `kind` if it has no such attribute.
+    """
+    value = getattr(connector, name, None)
+    return value if isinstance(value, kind) else kind()
+
+
+def _slots(concurrency: Union[int, AdaptiveConcurrency]):
+    if isinstance(concurrency, AdaptiveConcurrency):
+        return concurrency.async_slot
+    semaphore = Semaphore(concurrency)
+    return lambda: semaphore
@@ -1,7 +1,29 @@
 from aiohttp import ClientSession
+from contextlib import nullcontext
 from requests import Session
+from chiefpay.breaker import CircuitBreaker
+from chiefpay.cache import InvoiceCache, PaymentMethodsCache, RatesCache
+from chiefpay.codec import JSONCodec, default_codec
+from chiefpay.concurrency import SingleFlight
 from chiefpay.constants import BASE_URL, Endpoints
-from typing import Union
+from chiefpay.deadline import Deadline
+from chiefpay.decoding import (
+    HistoryModel,
+    Validation,
+    build_history,
+    check_validation,
+    decode,
+    decode_history,
+    decode_list,
+    load,
+)
+from chiefpay.metrics import Metrics
+from chiefpay.profiling import Profiler, take_profile
+from chiefpay.ratelimit import RateLimit, RateLimiter
+from chiefpay.transport import PoolStats, TransportConfig
+from chiefpay.types import Invoice
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 
 class BaseClient:
@@ -9,16 +31,57 @@ class BaseClient:
     Base class for interacting with the payment system.
     """
 
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        transport: Optional[TransportConfig] = None,
+        rates_cache: Optional[RatesCache] = None,
+        payment_methods_cache: Optional[PaymentMethodsCache] = None,
+        invoice_cache: Optional[InvoiceCache] = None,
+        validate: Validation = "full",
+        codec: Optional[JSONCodec] = None,
+        rate_limit: Optional[RateLimit] = None,
+        single_flight: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         """
         Initialize the client.
 
         Parameters:
             api_key (str): API key for authentication.
             base_url (str): Base URL for the API endpoints.
+            transport (TransportConfig, optional): Connection pooling and timeout settings.
+            rates_cache (RatesCache, optional): Cache `get_rates` is served from.
+            payment_methods_cache (PaymentMethodsCache, optional): Cache `get_payment_methods` is served from.
+            invoice_cache (InvoiceCache, optional): Cache `get_invoice` is served from.
+            validate (str): How responses are decoded: "full" validates them into models
+                and "raw" returns plain dicts.
+            codec (JSONCodec, optional): JSON codec for request and response bodies
+                (orjson when installed, the standard library otherwise).
+            rate_limit (RateLimit, optional): Client-side request budget, shared by every
+                client using the same API key.
+            single_flight (bool): Whether identical concurrent GET requests share one HTTP call
+                (each caller still decodes the shared response itself). Off by default.
+            circuit_breaker (CircuitBreaker, optional): Fails requests fast while the API is failing.
+            metrics (Metrics, optional): Request hooks and metrics, e.g. shared with other clients.
+            profiler (Profiler, optional): Reports the per-phase timing of sampled calls.
         """
         self.api_key = api_key
         self.base_url = base_url
+        self.transport = transport or TransportConfig()
+        self.rates_cache = rates_cache
+        self.payment_methods_cache = payment_methods_cache
+        self.invoice_cache = invoice_cache
+        self.validate = check_validation(validate)
+        self.codec = codec or default_codec()
+        self.rate_limiter = RateLimiter.shared(api_key, rate_limit) if rate_limit else None
+        self.single_flight = SingleFlight() if single_flight else None
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics or Metrics()
+        self.profiler = profiler
         self.headers = {
             "Accept": "application/json",
             "X-Api-Key": self.api_key,
@@ -28,6 +91,82 @@ class BaseClient:
     def _init_session(self):
         raise NotImplementedError
 
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the HTTP connection pool utilization.
+        """
+        raise NotImplementedError
+
+    def _load(self, body: bytes) -> Any:
+        return load(body, self.codec)
+
+    def _decode(self, model: Type[BaseModel], data: Any) -> Any:
+        profile, data = take_profile(data)
+        if profile is not None:
+            build = lambda payload: decode(model, payload, self.validate)
+            return self.profiler.decode(profile, data, build, self._load)
+        return decode(model, data, self.validate, self.codec)
+
+    def _decode_list(self, model: Type[BaseModel], items: Any) -> List:
+        profile, items = take_profile(items)
+        if profile is not None:
+            build = lambda payload: decode_list(model, payload, self.validate)
+            return self.profiler.decode(profile, items, build, self._load)
+        return decode_list(model, items, self.validate, self.codec)
+
+    def _decode_history(self, model: Type[HistoryModel], body: bytes) -> Tuple[List, int]:
+        profile, body = take_profile(body)
+        if profile is not None:
+            build = lambda payload: decode_history(model, payload, self.validate)
+            return self.profiler.decode(profile, body, build, self._load)
+        return decode_history(model, body, self.validate, self.codec)
+
+    def _build_history(self, model: Type[HistoryModel], items: List) -> Any:
+        return build_history(model, items, self.validate)
+
+    def _cache_invoice(self, invoice: Invoice) -> Invoice:
+        if self.invoice_cache is not None:
+            self.invoice_cache.put(invoice)
+        return invoice
+
+    def _guard(self, path: Union[Endpoints, str]):
+        if self.circuit_breaker is None:
+            return nullcontext()
+        return self.circuit_breaker.guard(path)
+
+    def _timeout(
+        self, path: Union[Endpoints, str], deadline: Optional[Deadline]
+    ) -> Tuple[Optional[float], bool]:
+        """
+        Returns the seconds the next attempt of a request to `path` may take and whether
+        the deadline, rather than the configured timeout, sets them; raises
+        RequestTimeoutError once the deadline has passed.
+        """
+        timeout = self.transport.timeout(path)
+        if deadline is None:
+            return timeout, False
+        remaining = deadline.remaining()
+        if timeout is None or remaining < timeout:
+            return remaining, True
+        return timeout, False
+
+    @staticmethod
+    def _flight_key(method: str, url: str, with_headers: bool, kwargs: Dict) -> Optional[Tuple]:
+        """
+        Returns the key identical requests share in the single-flight layer, or None
+        if the request must not be coalesced.
+        """
+        if method != "GET":
+            return None
+        params = kwargs.get("params") or {}
+        headers = kwargs.get("headers") or {}
+        return (
+            url,
+            tuple(sorted((key, str(value)) for key, value in params.items())),
+            tuple(sorted(headers.items())),
+            with_headers,
+        )
+
     def _get_url(self, endpoint: Union[Endpoints, str]):
         if not self.session:
             self.session = self._init_session()
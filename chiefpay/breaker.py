@@ -0,0 +1,250 @@
+import time
+from contextlib import contextmanager
+from enum import Enum
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from aiohttp import ClientError
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+from chiefpay.exceptions import (
+    APIError,
+    CircuitOpenError,
+    InvalidJSONError,
+    ManyRequestsError,
+    RequestTimeoutError,
+    TransportError,
+)
+
+
+class CircuitState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class BreakerPolicy(BaseModel):
+    """
+    When a CircuitBreaker opens and how it probes for recovery.
+
+    `groups` maps endpoint names (`Endpoints` member names, e.g. "invoice_by_id") to
+    the group whose circuit they share; other paths share the "default" circuit.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    failure_threshold: int = Field(5, gt=0, description="Consecutive failures that open a circuit")
+    reset_timeout: float = Field(30.0, gt=0, description="Seconds a circuit stays open before probing")
+    half_open_requests: int = Field(
+        1, gt=0, description="Trial requests that must succeed before a circuit closes"
+    )
+    groups: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "invoices_history": "history",
+            "transactions_history": "history",
+            "rates": "rates",
+            "payment_methods": "payment_methods",
+            "invoice": "invoice",
+            "invoice_by_id": "invoice",
+            "invoice_cancel": "invoice",
+            "invoice_prolong": "invoice",
+            "invoice_subscribe": "invoice",
+            "wallet": "wallet",
+            "wallet_by_id": "wallet",
+        },
+        description="Circuit group, by endpoint name",
+    )
+
+
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of the REST clients, with one circuit per endpoint group.
+
+    A circuit opens after `failure_threshold` consecutive failures: transport
+    errors, 5xx responses, timeouts and connection errors. 429 responses and
+    timeouts of attempts cut short by the caller's deadline count as neither
+    failures nor successes. While open, requests
+    fail at once with CircuitOpenError. After `reset_timeout` seconds the circuit
+    turns half-open and lets `half_open_requests` trial requests through: if they
+    all succeed it closes, and the first failure opens it again.
+
+    The state is guarded by a lock, so one breaker can be shared by several clients,
+    threads and event loops.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[BreakerPolicy] = None,
+        on_state_change: Optional[StateListener] = None,
+    ):
+        """
+        Parameters:
+            policy (BreakerPolicy, optional): Thresholds, timeouts and endpoint groups.
+            on_state_change (callable, optional): Called with the group, the previous and
+                the new state whenever a circuit changes state.
+        """
+        self.policy = policy or BreakerPolicy()
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    def group(self, path: Union[Endpoints, str]) -> str:
+        """
+        Returns the group whose circuit requests to `path` go through.
+        """
+        endpoint = resolve_endpoint(path)
+        if endpoint is None:
+            return "default"
+        return self.policy.groups.get(endpoint.name, "default")
+
+    def state(self, group: str) -> CircuitState:
+        """
+        Returns the current state of the circuit of `group`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None:
+                return CircuitState.closed
+            changes = self._expire(group, circuit)
+            state = circuit.state
+        self._notify(changes)
+        return state
+
+    def states(self) -> Dict[str, CircuitState]:
+        """
+        Returns the state of every circuit used so far.
+        """
+        with self._lock:
+            groups = list(self._circuits)
+        return {group: self.state(group) for group in groups}
+
+    @contextmanager
+    def guard(self, path: Union[Endpoints, str]) -> Iterator[None]:
+        """
+        Runs one request to `path` through its circuit.
+
+        Raises CircuitOpenError instead of entering while the circuit is open, and
+        records whether the request failed when leaving.
+        """
+        group = self.group(path)
+        trial = self._enter(group)
+        try:
+            yield
+        except BaseException as e:
+            if is_failure(e):
+                self._failed(group)
+            elif _is_neutral(e):
+                # Rate limited (the API is shedding load, not recovered), out of the
+                # caller's deadline or cancelled: neither a success nor a failure.
+                self._released(group, trial)
+            else:
+                self._succeeded(group, trial)
+            raise
+        self._succeeded(group, trial)
+
+    def _enter(self, group: str) -> bool:
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None:
+                circuit = self._circuits[group] = _Circuit()
+            changes = self._expire(group, circuit)
+            if circuit.state is CircuitState.open:
+                retry_after = circuit.opened_at + self.policy.reset_timeout - time.monotonic()
+                error = CircuitOpenError(group, retry_after)
+            elif circuit.state is CircuitState.half_open:
+                if circuit.trials + circuit.successes >= self.policy.half_open_requests:
+                    error = CircuitOpenError(group, 0.0)
+                else:
+                    circuit.trials += 1
+                    error = None
+            else:
+                error = None
+            trial = circuit.state is CircuitState.half_open
+        self._notify(changes)
+        if error is not None:
+            raise error
+        return trial
+
+    def _succeeded(self, group: str, trial: bool):
+        with self._lock:
+            circuit = self._circuits[group]
+            changes = []
+            if trial and circuit.state is CircuitState.half_open:
+                circuit.trials = max(0, circuit.trials - 1)
+                circuit.successes += 1
+                if circuit.successes >= self.policy.half_open_requests:
+                    changes.append(self._move(group, circuit, CircuitState.closed))
+            elif circuit.state is CircuitState.closed:
+                circuit.failures = 0
+        self._notify(changes)
+
+    def _failed(self, group: str):
+        with self._lock:
+            circuit = self._circuits[group]
+            changes = []
+            if circuit.state is CircuitState.half_open:
+                changes.append(self._move(group, circuit, CircuitState.open))
+            elif circuit.state is CircuitState.closed:
+                circuit.failures += 1
+                if circuit.failures >= self.policy.failure_threshold:
+                    changes.append(self._move(group, circuit, CircuitState.open))
+        self._notify(changes)
+
+    def _released(self, group: str, trial: bool):
+        with self._lock:
+            circuit = self._circuits[group]
+            if trial and circuit.state is CircuitState.half_open:
+                circuit.trials = max(0, circuit.trials - 1)
+
+    def _expire(self, group: str, circuit: "_Circuit") -> List[Tuple]:
+        if (
+            circuit.state is CircuitState.open
+            and time.monotonic() - circuit.opened_at >= self.policy.reset_timeout
+        ):
+            return [self._move(group, circuit, CircuitState.half_open)]
+        return []
+
+    def _move(self, group: str, circuit: "_Circuit", state: CircuitState) -> Tuple:
+        previous = circuit.state
+        circuit.state = state
+        circuit.failures = circuit.trials = circuit.successes = 0
+        if state is CircuitState.open:
+            circuit.opened_at = time.monotonic()
+        return group, previous, state
+
+    def _notify(self, changes: List[Tuple]):
+        if self.on_state_change is not None:
+            for change in changes:
+                self.on_state_change(*change)
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "trials", "successes", "opened_at")
+
+    def __init__(self):
+        self.state = CircuitState.closed
+        self.failures = 0
+        self.trials = 0
+        self.successes = 0
+        self.opened_at = 0.0
+
+
+def is_failure(error: BaseException) -> bool:
+    """
+    Returns whether `error` means the API is failing, rather than rejecting the request.
+    """
+    if isinstance(error, (APIError, InvalidJSONError)):
+        return error.status_code is not None and error.status_code >= 500
+    if isinstance(error, RequestTimeoutError):
+        return not error.deadline_exceeded
+    return isinstance(error, (TransportError, OSError, ClientError))
+
+
+def _is_neutral(error: BaseException) -> bool:
+    if isinstance(error, RequestTimeoutError):
+        return error.deadline_exceeded
+    return isinstance(error, ManyRequestsError) or not isinstance(error, Exception)
@@ -0,0 +1,302 @@
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
+from uuid import UUID
+
+from chiefpay.types import Invoice, NotificationInvoice, PaymentMethods, Rate
+from chiefpay.utils import Utils
+
+if TYPE_CHECKING:
+    from chiefpay.socket.base import BaseSocketClient
+
+
+# How far along its lifecycle an invoice in each status is; final statuses share a rank.
+_STATUS_PROGRESS = {
+    "WAITING_SELECTION": 0,
+    "WAITING_PAYMENT": 1,
+    "UNDER_PAID": 2,
+    "COMPLETE": 3,
+    "OVER_PAID": 3,
+    "EXPIRED": 3,
+}
+
+
+class RatesCache:
+    """
+    In-memory exchange rates served to `get_rates` instead of calling the API.
+
+    Rates pushed by a linked socket client stay fresh for `socket_max_age` seconds;
+    when the socket goes quiet, rates fetched over REST are kept for `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 30.0, socket_max_age: float = 60.0):
+        """
+        Parameters:
+            ttl (float): Seconds rates fetched over REST are served from the cache.
+            socket_max_age (float): Seconds rates pushed by the socket are served from the cache.
+        """
+        self.ttl = ttl
+        self.socket_max_age = socket_max_age
+        self._rates: Optional[List[Rate]] = None
+        self._expires_at = 0.0
+        self._lock = Lock()
+
+    def link(self, socket_client: "BaseSocketClient"):
+        """
+        Keeps the cache up to date with the rates pushed to a socket client.
+
+        Parameters:
+            socket_client (BaseSocketClient): A SocketClient or AsyncSocketClient.
+        """
+        socket_client.add_rates_listener(self.push)
+        if socket_client.rates:
+            self.push(socket_client.rates)
+
+    def push(self, rates: List[Rate]):
+        """
+        Stores rates received from the socket.
+        """
+        self._store(rates, self.socket_max_age)
+
+    def set(self, rates: List[Rate]):
+        """
+        Stores rates fetched over REST.
+        """
+        self._store(rates, self.ttl)
+
+    def get(self) -> Optional[List[Rate]]:
+        """
+        Returns the cached rates, or None if they are missing or stale.
+        """
+        with self._lock:
+            if self._rates is None or monotonic() >= self._expires_at:
+                return None
+            return list(self._rates)
+
+    def _store(self, rates: List[Rate], max_age: float):
+        with self._lock:
+            expires_at = monotonic() + max_age
+            # A REST refresh must not cut short the lifetime of a newer socket push.
+            if expires_at >= self._expires_at or self._rates is None:
+                self._rates = list(rates)
+                self._expires_at = expires_at
+
+
+class PaymentMethodsCache:
+    """
+    TTL cache for `get_payment_methods` with stale-while-revalidate and conditional requests.
+
+    Within `ttl` the cached value is returned as is. For `stale_while_revalidate` seconds
+    after that it is still returned while one caller refreshes it in the background.
+    Refreshes send `If-None-Match`/`If-Modified-Since` when the server provided an
+    `ETag`/`Last-Modified`, so an unchanged list costs a bodiless 304.
+    """
+
+    def __init__(self, ttl: float = 3600.0, stale_while_revalidate: float = 300.0):
+        """
+        Parameters:
+            ttl (float): Seconds the payment methods are served without revalidation.
+            stale_while_revalidate (float): Seconds past `ttl` a stale value is served
+                while it is refreshed in the background.
+        """
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._value: Optional[PaymentMethods] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._lock = Lock()
+
+    def get(self) -> Tuple[Optional[PaymentMethods], bool]:
+        """
+        Looks up the cached payment methods.
+
+        Returns:
+            tuple: The cached value (None if missing or expired) and whether the caller
+            should refresh it in the background. Only one caller is asked to refresh.
+        """
+        with self._lock:
+            if self._value is None:
+                return None, False
+            age = monotonic() - self._fetched_at
+            if age < self.ttl:
+                return self._value, False
+            if age >= self.ttl + self.stale_while_revalidate:
+                return None, False
+            if self._refreshing:
+                return self._value, False
+            self._refreshing = True
+            return self._value, True
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Returns the validators to send with a refresh request.
+        """
+        with self._lock:
+            headers = {}
+            if self._value is not None and self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._value is not None and self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+            return headers
+
+    def update(
+        self, value: Optional[PaymentMethods], headers: Mapping[str, str]
+    ) -> PaymentMethods:
+        """
+        Stores a refresh result.
+
+        Parameters:
+            value (PaymentMethods, optional): The new value, or None if the server answered 304.
+            headers (Mapping[str, str]): The response headers.
+
+        Returns:
+            PaymentMethods: The current value.
+        """
+        with self._lock:
+            if value is not None or self._value is None:
+                self._value = value
+                self._etag = headers.get("ETag")
+                self._last_modified = headers.get("Last-Modified")
+            self._fetched_at = monotonic()
+            self._refreshing = False
+            return self._value
+
+    def refresh_failed(self):
+        """
+        Releases the background refresh after it raised, so a later caller retries it.
+        """
+        with self._lock:
+            self._refreshing = False
+
+
+class InvoiceCache:
+    """
+    Bounded LRU cache of invoices served to `get_invoice` instead of calling the API.
+
+    It is filled by `get_invoice` and by the invoices returned from `create_invoice`,
+    `patch_invoice`, `cancel_invoice` and `prolongate_invoice`. A linked socket client
+    replaces entries with the invoice carried by every invoice notification. An entry
+    is only replaced by a state at least as far along (see `supersedes`), so a slow
+    response does not undo a notification received while it was in flight.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60.0):
+        """
+        Parameters:
+            maxsize (int): Maximum number of cached invoices.
+            ttl (float, optional): Seconds an entry is served before it is fetched again
+                (None to rely on socket notifications only).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Invoice, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def link(self, socket_client: "BaseSocketClient"):
+        """
+        Keeps cached invoices up to date with the notifications received by a socket client.
+
+        Parameters:
+            socket_client (BaseSocketClient): A SocketClient or AsyncSocketClient.
+        """
+        socket_client.add_notification_listener(self._on_notification)
+
+    def get(self, id: Union[str, UUID]) -> Optional[Invoice]:
+        """
+        Returns the cached invoice, or None if it is missing or expired.
+        """
+        key = str(id).lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            invoice, stored_at = entry
+            if self.ttl is not None and monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return invoice
+
+    def put(self, invoice: Invoice):
+        """
+        Stores an invoice (or its raw payload), evicting the least recently used one when full.
+        An older state of a cached invoice is ignored.
+        """
+        key = str(invoice["id"] if isinstance(invoice, dict) else invoice.id).lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not supersedes(invoice, entry[0]):
+                return
+            self._entries[key] = (invoice, monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, id: Union[str, UUID]):
+        """
+        Removes an invoice from the cache.
+        """
+        with self._lock:
+            self._entries.pop(str(id).lower(), None)
+
+    def clear(self):
+        """
+        Removes all invoices from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _on_notification(self, notification):
+        if isinstance(notification, NotificationInvoice):
+            self.put(notification.invoice)
+        elif isinstance(notification, dict) and notification.get("type") == "invoice":
+            self.put(notification["invoice"])
+
+
+def invoice_progress(invoice: Union[Invoice, Dict]) -> Tuple[int, Decimal]:
+    """
+    Returns how far along an invoice (a model or a raw payload) is: the rank of its
+    status, then the amount paid so far. Neither goes back as an invoice is paid.
+    """
+    status = _invoice_field(invoice, "status", "status")
+    status = status.value if isinstance(status, Enum) else status
+    paid_amount = _invoice_field(invoice, "paid_amount", "paidAmount")
+    return _STATUS_PROGRESS.get(status, 0), Decimal(str(paid_amount or 0))
+
+
+def invoice_expired_at(invoice: Union[Invoice, Dict]) -> str:
+    """
+    Returns the expiration date of an invoice (a model or a raw payload), formatted
+    as YYYY-MM-DDTHH:MM:SS.sssZ.
+    """
+    expired_at = _invoice_field(invoice, "expired_at", "expiredAt")
+    if not isinstance(expired_at, datetime):
+        expired_at = Utils.parse_date(expired_at)
+    return Utils.format_date(expired_at)
+
+
+def supersedes(invoice: Union[Invoice, Dict], current: Union[Invoice, Dict]) -> bool:
+    """
+    Returns whether `invoice` may replace `current`, another state of the same invoice
+    received earlier: it is at least as far along, or `current` expired and `invoice`
+    was prolonged since. A state fetched before `current` but received after it
+    does not replace it.
+    """
+    if invoice_progress(invoice) >= invoice_progress(current):
+        return True
+    return _invoice_field(current, "status", "status") == "EXPIRED" and (
+        invoice_expired_at(invoice) > invoice_expired_at(current)
+    )
+
+
+def _invoice_field(invoice: Any, name: str, alias: str) -> Any:
+    return invoice.get(alias) if isinstance(invoice, dict) else getattr(invoice, name)
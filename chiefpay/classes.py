@@ -1,14 +1,60 @@
+from typing import Optional
 from chiefpay import Client, SocketClient, AsyncClient, AsyncSocketClient
+from chiefpay.cache import InvoiceCache, RatesCache
 from chiefpay.constants import BASE_URL
+from chiefpay.decoding import Validation
+from chiefpay.transport import TransportConfig
 
 
 class ChiefPayClient:
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
-        self.rest = Client(api_key, base_url)
-        self.socket = SocketClient(api_key, base_url)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        transport: Optional[TransportConfig] = None,
+        rates_cache: Optional[RatesCache] = None,
+        invoice_cache: Optional[InvoiceCache] = None,
+        validate: Validation = "full",
+        **kwargs,
+    ):
+        self.rest = Client(
+            api_key,
+            base_url,
+            transport=transport,
+            rates_cache=rates_cache,
+            invoice_cache=invoice_cache,
+            validate=validate,
+            **kwargs,
+        )
+        self.socket = SocketClient(api_key, base_url, validate)
+        if rates_cache is not None:
+            rates_cache.link(self.socket)
+        if invoice_cache is not None:
+            invoice_cache.link(self.socket)
 
 
 class AsyncChiefPayClient:
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
-        self.rest = AsyncClient(api_key, base_url)
-        self.socket = AsyncSocketClient(api_key, base_url)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        transport: Optional[TransportConfig] = None,
+        rates_cache: Optional[RatesCache] = None,
+        invoice_cache: Optional[InvoiceCache] = None,
+        validate: Validation = "full",
+        **kwargs,
+    ):
+        self.rest = AsyncClient(
+            api_key,
+            base_url,
+            transport=transport,
+            rates_cache=rates_cache,
+            invoice_cache=invoice_cache,
+            validate=validate,
+            **kwargs,
+        )
+        self.socket = AsyncSocketClient(api_key, base_url, validate)
+        if rates_cache is not None:
+            rates_cache.link(self.socket)
+        if invoice_cache is not None:
+            invoice_cache.link(self.socket)
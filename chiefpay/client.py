@@ -1,15 +1,42 @@
 import requests
-from typing import Dict, Optional
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from time import perf_counter, sleep
 
 from chiefpay.base import BaseClient
-from chiefpay.constants import Endpoints
+from chiefpay.breaker import CircuitBreaker
+from chiefpay.cache import InvoiceCache, PaymentMethodsCache, RatesCache
+from chiefpay.codec import JSON_CONTENT_TYPE, JSONCodec
+from chiefpay.concurrency import AdaptiveConcurrency, report_overload, report_success
+from chiefpay.constants import BASE_URL, Endpoints
+from chiefpay.deadline import Deadline
+from chiefpay.decoding import HistoryModel, Validation
 from chiefpay.exceptions import (
     APIError,
     InvalidJSONError,
     ManyRequestsError,
+    RequestTimeoutError,
     TransportError,
 )
+from chiefpay.pagination import MAX_PAGE_SIZE, HistoryCursor
+from chiefpay.metrics import Metrics
+from chiefpay.profiling import CallProfile, Profiler
+from chiefpay.ratelimit import RateLimit
+from chiefpay.transport import PoolStats, TransportConfig
 from chiefpay.types import (
     Rate,
     Wallet,
@@ -28,53 +55,288 @@ class Client(BaseClient):
     Client for making synchronous requests to the payment system API.
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        transport: Optional[TransportConfig] = None,
+        rates_cache: Optional[RatesCache] = None,
+        payment_methods_cache: Optional[PaymentMethodsCache] = None,
+        invoice_cache: Optional[InvoiceCache] = None,
+        validate: Validation = "full",
+        codec: Optional[JSONCodec] = None,
+        max_workers: int = 10,
+        rate_limit: Optional[RateLimit] = None,
+        single_flight: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[Metrics] = None,
+        profiler: Optional[Profiler] = None,
+    ):
+        """
+        Initialize the client.
+
+        Parameters:
+            api_key (str): API key for authentication.
+            base_url (str): Base URL for the API endpoints.
+            transport (TransportConfig, optional): Connection pooling and timeout settings.
+            rates_cache (RatesCache, optional): Cache `get_rates` is served from.
+            payment_methods_cache (PaymentMethodsCache, optional): Cache `get_payment_methods` is served from.
+            invoice_cache (InvoiceCache, optional): Cache `get_invoice` is served from.
+            validate (str): How responses are decoded: "full" validates them into models
+                and "raw" returns plain dicts.
+            codec (JSONCodec, optional): JSON codec for request and response bodies
+                (orjson when installed, the standard library otherwise).
+            max_workers (int): Number of threads used by batch methods.
+            rate_limit (RateLimit, optional): Client-side request budget, shared by every
+                client using the same API key.
+            single_flight (bool): Whether identical concurrent GET requests share one HTTP call
+                (each caller still decodes the shared response itself). Off by default.
+            circuit_breaker (CircuitBreaker, optional): Fails requests fast while the API is failing.
+            metrics (Metrics, optional): Request hooks and metrics, e.g. shared with other clients.
+            profiler (Profiler, optional): Reports the per-phase timing of sampled calls.
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            transport,
+            rates_cache,
+            payment_methods_cache,
+            invoice_cache,
+            validate,
+            codec,
+            rate_limit,
+            single_flight,
+            circuit_breaker,
+            metrics,
+            profiler,
+        )
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     def _init_session(self):
         session = requests.Session()
         session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_maxsize=self._pool_maxsize())
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         return session
 
-    def _request(self, method: str, path: str, max_retries: int = 3, **kwargs):
+    def _pool_maxsize(self) -> int:
+        return max(self.transport.pool_size, self.max_workers)
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the HTTP connection pool utilization.
+
+        The counts come from urllib3 internals; they are 0 if this urllib3 version
+        does not expose them. The client talks to one host, so `limit` is the size of
+        its pool.
+        """
+        adapter = self.session.get_adapter(self.base_url) if self.session else None
+        manager = getattr(adapter, "poolmanager", None)
+        container = getattr(getattr(manager, "pools", None), "_container", None)
+        pools = list(container.values()) if isinstance(container, dict) else []
+        in_use = idle = 0
+        for pool in pools:
+            queue = getattr(pool, "pool", None)
+            if queue is None or not hasattr(queue, "queue"):
+                continue
+            # urllib3 pre-fills the queue with None placeholders up to maxsize.
+            queued = list(queue.queue)
+            in_use += getattr(queue, "maxsize", len(queued)) - len(queued)
+            idle += sum(1 for conn in queued if conn is not None)
+        return PoolStats(
+            hosts=len(pools),
+            in_use=in_use,
+            idle=idle,
+            limit=self._pool_maxsize(),
+            limit_per_host=self._pool_maxsize(),
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if not self.session:
+            self.session = self._init_session()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="chiefpay"
+            )
+        return self._executor
+
+    def _map(
+        self,
+        func: Callable,
+        items: Iterable,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+    ) -> List:
+        def call(item):
+            try:
+                if concurrency is None:
+                    return func(item)
+                with concurrency.slot():
+                    return func(item)
+            except Exception as e:
+                # Connection errors too: one failed item must not discard the others' results.
+                return e
+
+        return list(self._get_executor().map(call, items))
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        max_retries: int = 3,
+        with_headers: bool = False,
+        json: Optional[Dict] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        **kwargs,
+    ):
         url = self._get_url(path)
+        deadline = Deadline.of(deadline)
+        if json is not None:
+            kwargs["data"] = self.codec.dumps(json)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **JSON_CONTENT_TYPE}
+
+        profile = self.profiler.sample(method, path) if self.profiler is not None else None
+        send = partial(
+            self._send, method, path, url, max_retries, with_headers, deadline, profile, **kwargs
+        )
+        key = self._flight_key(method, url, with_headers, kwargs)
+        if key is not None and self.single_flight is not None:
+            return self.single_flight.do(key, send, deadline.remaining() if deadline else None)
+        return send()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        max_retries: int,
+        with_headers: bool,
+        deadline: Optional[Deadline],
+        profile: Optional[CallProfile],
+        **kwargs,
+    ):
         for attempt in range(max_retries):
-            response = self.session.request(method, url, **kwargs)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path, deadline.remaining() if deadline else None)
+            timeout, by_deadline = self._timeout(path, deadline)
             try:
-                return self._handle_response(response)
-            except ManyRequestsError:
+                with self._guard(path):
+                    start = perf_counter()
+                    data, headers = self._attempt(
+                        method, path, url, timeout, by_deadline, profile, **kwargs
+                    )
+                    report_success(perf_counter() - start)
+                return (data, headers) if with_headers else data
+            except ManyRequestsError as e:
+                report_overload()
                 if attempt == max_retries - 1:
-                    raise ManyRequestsError() from None
-                continue
+                    raise
+                self.metrics.retried(path, e.retry_after)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.penalize(e.retry_after)
+                elif deadline is not None and e.retry_after >= deadline.remaining():
+                    raise RequestTimeoutError(
+                        "Deadline exceeded before retrying", deadline_exceeded=True
+                    ) from e
+                else:
+                    sleep(e.retry_after)
+
+    def _attempt(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Optional[float],
+        by_deadline: bool,
+        profile: Optional[CallProfile],
+        **kwargs,
+    ):
+        with self.metrics.track(method, path, url, kwargs.get("data")) as event:
+            if profile is not None:
+                Profiler.start_attempt(profile)
+            try:
+                # A profiled response is streamed, so that the body read can be timed.
+                response = self.session.request(
+                    method,
+                    url,
+                    timeout=self._requests_timeout(timeout),
+                    stream=profile is not None,
+                    **kwargs,
+                )
+                if profile is not None:
+                    Profiler.headers_received(profile)
+                event.status = response.status_code
+                event.bytes_in = len(response.content)
+            except requests.Timeout as e:
+                # The configured connect or read timeout may be shorter than the deadline.
+                configured = (
+                    self.transport.connect_timeout
+                    if isinstance(e, requests.ConnectTimeout)
+                    else self.transport.read_timeout
+                )
+                raise RequestTimeoutError(
+                    f"Request to {url} timed out",
+                    deadline_exceeded=by_deadline and (configured is None or timeout < configured),
+                ) from e
+            data = self._handle_response(response)
+            if profile is not None and data is not None:
+                data = Profiler.body_read(profile, data)
+            return data, response.headers
+
+    def _requests_timeout(self, timeout: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+        # requests has no total timeout: bound the connect time and each read instead.
+        connect, read = self.transport.connect_timeout, self.transport.read_timeout
+        if timeout is None:
+            return connect, read
+        return min(connect or timeout, timeout), min(read or timeout, timeout)
 
     def _get_request(
-        self, path: str, params: Optional[Dict] = None, max_retries: int = 3
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
-        return self._request("GET", path, max_retries, params=params)
+        return self._request("GET", path, max_retries, params=params, deadline=deadline)
 
     def _post_request(
-        self, path: str, json: Optional[Dict] = None, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = None,
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
-        return self._request("POST", path, max_retries, json=json)
+        return self._request("POST", path, max_retries, json=json, deadline=deadline)
 
     def _patch_request(
-        self, path: str, json: Optional[Dict] = None, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = None,
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
-        return self._request("PATCH", path, max_retries, json=json)
+        return self._request("PATCH", path, max_retries, json=json, deadline=deadline)
 
     def _delete_request(
-        self, path: str, json: Optional[Dict] = None, max_retries: int = 3
+        self,
+        path: str,
+        json: Optional[Dict] = None,
+        max_retries: int = 3,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
-        return self._request("DELETE", path, max_retries, json=json)
+        return self._request("DELETE", path, max_retries, json=json, deadline=deadline)
 
-    @staticmethod
-    def _handle_response(response: requests.Response):
+    def _handle_response(self, response: requests.Response) -> Optional[bytes]:
         if response.status_code == 429:
-            headers = response.headers
-            retry = int(headers.get("Retry-After-ms", "3000")) / 1000
-            sleep(retry)
-            raise ManyRequestsError()
+            raise ManyRequestsError(int(response.headers.get("Retry-After-ms", "3000")) / 1000)
+
+        if response.status_code == 304:
+            return None
 
         if not (200 <= response.status_code < 300):
             try:
-                error_data = response.json()
+                error_data = self.codec.loads(response.content)
                 if error_data:
                     raise APIError(
                         status_code=response.status_code,
@@ -84,47 +346,101 @@ class Client(BaseClient):
                     )
                 raise TransportError(response.status_code, response.text)
             except ValueError:
-                raise InvalidJSONError()
+                raise InvalidJSONError(status_code=response.status_code)
 
-        try:
-            data = response.json()
-            return data
-        except ValueError:
-            raise InvalidJSONError()
+        return response.content
 
-    def get_rates(self) -> list[Rate]:
+    def get_rates(self, deadline: Optional[Union[float, Deadline]] = None) -> list[Rate]:
         """
         Retrieves the current exchange rates.
 
+        Served from the rates cache, if the client has one and it is fresh.
+
+        Parameters:
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
         Returns:
              Rate DTO: The exchange rate data.
         """
-        response_data = self._get_request(Endpoints.rates)
-        return [Rate(**rate) for rate in response_data]
-
-    def get_payment_methods(self) -> PaymentMethods:
+        if self.rates_cache is not None:
+            rates = self.rates_cache.get()
+            if rates is not None:
+                return rates
+
+        response_data = self._get_request(Endpoints.rates, deadline=deadline)
+        rates = self._decode_list(Rate, response_data)
+        if self.rates_cache is not None:
+            self.rates_cache.set(rates)
+        return rates
+
+    def get_payment_methods(
+        self,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> PaymentMethods:
         """
         Retrieves the list of available payment methods.
 
+        Served from the payment methods cache, if the client has one.
+
+        Parameters:
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
         Returns:
              PaymentMethods: The payment methods data.
         """
-        response_data = self._get_request(Endpoints.payment_methods)
-        return PaymentMethods(**response_data)
+        if self.payment_methods_cache is None:
+            response_data = self._get_request(Endpoints.payment_methods, deadline=deadline)
+            return self._decode(PaymentMethods, response_data)
+
+        payment_methods, refresh = self.payment_methods_cache.get()
+        if refresh:
+            self._get_executor().submit(self._refresh_payment_methods)
+        if payment_methods is not None:
+            return payment_methods
+        return self._refresh_payment_methods(deadline)
+
+    def _refresh_payment_methods(
+        self,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> PaymentMethods:
+        cache = self.payment_methods_cache
+        try:
+            response_data, headers = self._request(
+                "GET",
+                Endpoints.payment_methods,
+                headers=cache.conditional_headers(),
+                with_headers=True,
+                deadline=deadline,
+            )
+        except BaseException:
+            cache.refresh_failed()
+            raise
+        payment_methods = (
+            self._decode(PaymentMethods, response_data)
+            if response_data is not None
+            else None
+        )
+        return cache.update(payment_methods, headers)
 
-    def get_invoice(self, id: str) -> Invoice:
+    def get_invoice(self, id: str, deadline: Optional[Union[float, Deadline]] = None) -> Invoice:
         """
         Retrieves information about a specific invoice by ID.
 
         Parameters:
             id (str): The invoice ID (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Invoice DTO: The invoice data.
         """
+        if self.invoice_cache is not None:
+            invoice = self.invoice_cache.get(id)
+            if invoice is not None:
+                return invoice
+
         endpoint = Endpoints.invoice_by_id.value.format(id=id)
-        response_data = self._get_request(endpoint)
-        return Invoice(**response_data)
+        response_data = self._get_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
     def get_invoices(
         self,
@@ -132,6 +448,7 @@ class Client(BaseClient):
         to_date: Optional[str] = None,
         limit: int = 100,
         not_notified: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> InvoicesHistory:
         """
         Retrieves invoices history within a given date range.
@@ -141,6 +458,7 @@ class Client(BaseClient):
             to_date (str, optional): The end date.
             limit (int): Maximum number of items (max 1000).
             not_notified (bool, optional): Return only notifications not yet acknowledged.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
             Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS.sssZ)
 
         Returns:
@@ -153,11 +471,8 @@ class Client(BaseClient):
         params = {"fromDate": from_date, "toDate": to_date, "limit": limit}
         if not_notified is not None:
             params["notNotified"] = not_notified
-        response_data = self._get_request(Endpoints.invoices_history, params)
-        invoices = [Invoice(**data) for data in response_data.get("invoices")]
-        return InvoicesHistory(
-            invoices=invoices, totalCount=response_data.get("totalCount")
-        )
+        response_data = self._get_request(Endpoints.invoices_history, params, deadline=deadline)
+        return self._decode(InvoicesHistory, response_data)
 
     def get_transactions(
         self,
@@ -165,6 +480,7 @@ class Client(BaseClient):
         to_date: Optional[str] = None,
         limit: int = 100,
         not_notified: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> TransactionsHistory:
         """
         Retrieves transaction history within a given date range.
@@ -174,6 +490,7 @@ class Client(BaseClient):
             to_date (str, optional): The end date.
             limit (int): Maximum number of items (max 1000).
             not_notified (bool, optional): Return only notifications not yet acknowledged.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
             Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS.sssZ)
 
         Returns:
@@ -187,49 +504,132 @@ class Client(BaseClient):
 
         if not_notified is not None:
             params["notNotified"] = not_notified
-        response_data = self._get_request(Endpoints.transactions_history, params)
-        transactions = [
-            Transaction(**data) for data in response_data.get("transactions")
-        ]
-        return TransactionsHistory(
-            transactions=transactions, totalCount=response_data.get("totalCount")
+        response_data = self._get_request(
+            Endpoints.transactions_history, params, deadline=deadline
         )
+        return self._decode(TransactionsHistory, response_data)
+
+    def iter_invoices(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Iterator[Invoice]:
+        """
+        Iterates over all invoices within a given date range, page by page.
+
+        The next page is requested in the background while the current one is consumed,
+        and at most two pages are held in memory.
 
-    def get_wallet(self, id: str) -> Wallet:
+        Parameters:
+            from_date (str): The start date.
+            to_date (str, optional): The end date.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            page_size (int): Number of items per request (max 1000).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+            Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS.sssZ)
+
+        Yields:
+             Invoice: The invoices, one at a time.
+        """
+        cursor = HistoryCursor(from_date, to_date, page_size, not_notified)
+        yield from self._iter_history(
+            Endpoints.invoices_history, InvoicesHistory, cursor, Deadline.of(deadline)
+        )
+
+    def iter_transactions(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        not_notified: Optional[bool] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Iterates over all transactions within a given date range, page by page.
+
+        The next page is requested in the background while the current one is consumed,
+        and at most two pages are held in memory.
+
+        Parameters:
+            from_date (str): The start date.
+            to_date (str, optional): The end date.
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+            page_size (int): Number of items per request (max 1000).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+            Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS.sssZ)
+
+        Yields:
+             Transaction: The transactions, one at a time.
+        """
+        cursor = HistoryCursor(from_date, to_date, page_size, not_notified)
+        yield from self._iter_history(
+            Endpoints.transactions_history, TransactionsHistory, cursor, Deadline.of(deadline)
+        )
+
+    def _iter_history(
+        self,
+        endpoint: Endpoints,
+        model: Type[HistoryModel],
+        cursor: HistoryCursor,
+        deadline: Optional[Deadline],
+    ) -> Iterator:
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._get_request, endpoint, cursor.params(), deadline=deadline)
+        try:
+            while future is not None:
+                items = cursor.advance(*self._decode_history(model, future.result()))
+                future = (
+                    None
+                    if cursor.done
+                    else executor.submit(
+                        self._get_request, endpoint, cursor.params(), deadline=deadline
+                    )
+                )
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_wallet(self, id: str, deadline: Optional[Union[float, Deadline]] = None) -> Wallet:
         """
         Retrieve wallet information by wallet ID.
 
         Args:
             id (str): The ID of the wallet to retrieve (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
             Wallet: An instance of the Wallet class containing the wallet information.
         """
         endpoint = Endpoints.wallet_by_id.value.format(id=id)
-        response_data = self._get_request(endpoint)
-        return Wallet(**response_data)
+        response_data = self._get_request(endpoint, deadline=deadline)
+        return self._decode(Wallet, response_data)
 
     def create_invoice(
         self,
         order_id: str,
-        amount: Optional[str] = None,
+        amount: Optional[Union[str, Decimal]] = None,
         fee_included: Optional[bool] = False,
-        accuracy: Optional[str] = None,
+        accuracy: Optional[Union[str, Decimal]] = None,
         url_return: Optional[str] = None,
         url_success: Optional[str] = None,
         chain_token: Optional[ChainToken] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> Invoice:
         """
         Creates a new invoice.
 
         Parameters:
             order_id (str): The order ID in your system.
-            amount (str, optional): The amount in USD (decimal string, e.g., "15.4").
+            amount (str | Decimal, optional): The amount in USD (e.g., "15.4").
             fee_included (bool, optional): Whether the fee is included in the amount.
-            accuracy (str, optional): Payment tolerance ("0" to "0.05", e.g., "0.01" = 99% minimum).
+            accuracy (str | Decimal, optional): Payment tolerance ("0" to "0.05", e.g., "0.01" = 99% minimum).
             url_return (str, optional): Redirect URL after failure.
             url_success (str, optional): Redirect URL after success.
             chain_token (ChainToken, optional): Pre-selected chain and token.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Invoice: The created invoice data.
@@ -251,15 +651,107 @@ class Client(BaseClient):
 
         data = {k: v for k, v in data.items() if v is not None}
 
-        response_data = self._post_request(Endpoints.invoice, json=data)
-        return Invoice(**response_data)
+        response_data = self._post_request(Endpoints.invoice, json=data, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
+
+    def create_invoices(
+        self,
+        specs: Sequence[Dict],
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> List[Union[Invoice, Exception]]:
+        """
+        Creates many invoices concurrently on the client's thread pool.
+
+        Args:
+            specs (Sequence[dict]): Keyword arguments for `create_invoice`, one dict per invoice.
+            concurrency (AdaptiveConcurrency, optional): Adjusts the number of requests in flight
+                (at most `max_workers`) to the responses.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
+        Returns:
+            list: For each spec, in input order, the created Invoice or the error raised while
+                creating it (a ChiefPayError, or e.g. a requests.ConnectionError).
+        """
+        deadline = Deadline.of(deadline)
+        return self._map(
+            lambda spec: self.create_invoice(**spec, deadline=deadline), specs, concurrency
+        )
 
-    def create_wallet(self, order_id: str) -> Wallet:
+    def get_invoices_by_ids(
+        self,
+        ids: Sequence[str],
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> List[Union[Invoice, Exception]]:
+        """
+        Retrieves many invoices concurrently on the client's thread pool.
+
+        Args:
+            ids (Sequence[str]): The invoice IDs (UUID).
+            concurrency (AdaptiveConcurrency, optional): Adjusts the number of requests in flight
+                (at most `max_workers`) to the responses.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
+        Returns:
+            list: For each ID, in input order, the Invoice or the error raised while retrieving it.
+        """
+        deadline = Deadline.of(deadline)
+        return self._map(lambda id: self.get_invoice(id, deadline), ids, concurrency)
+
+    def get_wallets_by_ids(
+        self,
+        ids: Sequence[str],
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> List[Union[Wallet, Exception]]:
+        """
+        Retrieves many wallets concurrently on the client's thread pool.
+
+        Args:
+            ids (Sequence[str]): The wallet IDs (UUID).
+            concurrency (AdaptiveConcurrency, optional): Adjusts the number of requests in flight
+                (at most `max_workers`) to the responses.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
+        Returns:
+            list: For each ID, in input order, the Wallet or the error raised while retrieving it.
+        """
+        deadline = Deadline.of(deadline)
+        return self._map(lambda id: self.get_wallet(id, deadline), ids, concurrency)
+
+    def cancel_invoices(
+        self,
+        ids: Sequence[str],
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> List[Union[Invoice, Exception]]:
+        """
+        Cancels many invoices concurrently on the client's thread pool.
+
+        Args:
+            ids (Sequence[str]): The invoice IDs (UUID).
+            concurrency (AdaptiveConcurrency, optional): Adjusts the number of requests in flight
+                (at most `max_workers`) to the responses.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
+
+        Returns:
+            list: For each ID, in input order, the canceled Invoice or the error raised while canceling it.
+        """
+        deadline = Deadline.of(deadline)
+        return self._map(lambda id: self.cancel_invoice(id, deadline), ids, concurrency)
+
+    def create_wallet(
+        self,
+        order_id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Wallet:
         """
         Creates a new wallet.
 
         Parameters:
             order_id (str): The order ID.
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
              Wallet DTO: The created wallet data.
@@ -267,50 +759,62 @@ class Client(BaseClient):
 
         data = {"orderId": order_id}
 
-        response_data = self._post_request(Endpoints.wallet, json=data)
-        return Wallet(**response_data)
+        response_data = self._post_request(Endpoints.wallet, json=data, deadline=deadline)
+        return self._decode(Wallet, response_data)
 
-    def cancel_invoice(self, id: str) -> Invoice:
+    def cancel_invoice(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Invoice:
         """
         Cancels an invoice by its ID.
 
         Args:
             id (str): The unique identifier of the invoice to be canceled (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
             Invoice: The canceled invoice details.
         """
         endpoint = Endpoints.invoice_cancel.value.format(id=id)
-        response_data = self._post_request(endpoint)
-        return Invoice(**response_data)
+        response_data = self._post_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
-    def prolongate_invoice(self, id: str) -> Invoice:
+    def prolongate_invoice(
+        self,
+        id: str,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Invoice:
         """
         Prolongs an existing invoice expiration time.
 
         Args:
             id (str): The unique identifier of the invoice to be prolonged (UUID).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
             Invoice: The prolonged invoice details.
         """
         endpoint = Endpoints.invoice_prolong.value.format(id=id)
-        response_data = self._post_request(endpoint)
-        return Invoice(**response_data)
+        response_data = self._post_request(endpoint, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
 
     def patch_invoice(
         self,
         id: str,
-        amount: Optional[str] = None,
+        amount: Optional[Union[str, Decimal]] = None,
         chain_token: Optional[ChainToken] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> Invoice:
         """
         Updates invoice amount and/or chain_token if they were not set during creation.
 
         Args:
             id (str): The invoice ID (UUID).
-            amount (str, optional): Invoice amount (can only be set if not specified during creation).
+            amount (str | Decimal, optional): Invoice amount (can only be set if not specified during creation).
             chain_token (ChainToken, optional): Chain and token (can only be set if not specified during creation).
+            deadline (float | Deadline, optional): Seconds the call may take, retries included.
 
         Returns:
             Invoice: The updated invoice details.
@@ -325,5 +829,22 @@ class Client(BaseClient):
             }
 
         endpoint = Endpoints.invoice_by_id.value.format(id=id)
-        response_data = self._patch_request(endpoint, json=data)
-        return Invoice(**response_data)
+        response_data = self._patch_request(endpoint, json=data, deadline=deadline)
+        return self._cache_invoice(self._decode(Invoice, response_data))
+
+    def close(self):
+        """
+        Shuts down the batch thread pool and closes the HTTP session.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,72 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Decimal values are encoded as strings, the format the API expects for amounts;
+    UUIDs, datetimes, enums and pydantic models are encoded natively.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by orjson.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is required for OrjsonCodec: pip install orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """
+    Returns the fastest available codec: orjson if it is installed, the standard library otherwise.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
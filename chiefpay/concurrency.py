@@ -0,0 +1,328 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from threading import Condition, Lock
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.exceptions import RequestTimeoutError
+
+
+_active: ContextVar[Optional["AdaptiveConcurrency"]] = ContextVar(
+    "chiefpay_adaptive_concurrency", default=None
+)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit of bulk operations, adjusted like TCP congestion control (AIMD).
+
+    Every successful request raises the limit by about one per `limit` requests
+    (additive increase). A 429 response, or a smoothed latency more than
+    `latency_tolerance` times the best one observed, multiplies it by `backoff`
+    (multiplicative decrease), at most once per `limit` completed requests.
+    Latency is that of the HTTP attempt that succeeded, without rate-limit waits
+    or 429 backoff.
+
+    One controller can be shared by threads (`slot`) and coroutines (`async_slot`),
+    and across batches, so what it learned about the account's rate limit carries over.
+
+    Example:
+        controller = AdaptiveConcurrency(initial=4, max_limit=32)
+        await client.create_invoices(specs, concurrency=controller)
+        controller.limit  # the concurrency currently allowed
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        """
+        Parameters:
+            initial (int): The starting limit.
+            min_limit (int): The limit never goes below this value.
+            max_limit (int): The limit never goes above this value.
+            backoff (float): Factor applied to the limit on overload (between 0 and 1).
+            latency_tolerance (float): Latency increase, relative to the best smoothed
+                latency observed, that counts as overload.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.decreases = 0
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._cooldown = 0
+        self._condition = Condition()
+        self._async_waiters = deque()
+
+    @property
+    def limit(self) -> int:
+        """
+        The number of requests currently allowed in flight.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently in flight.
+        """
+        return self._in_flight
+
+    def acquire(self):
+        """
+        Blocks the calling thread until a request may be sent.
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self):
+        """
+        Waits, without blocking the event loop, until a request may be sent.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._condition:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # _wake already picked this waiter: pass the wakeup on.
+                        self._wake()
+                raise
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._wake()
+
+    def succeeded(self, latency: float):
+        """
+        Records a successful request and its latency in seconds.
+        """
+        with self._condition:
+            if self._latency is None:
+                self._latency = self._baseline = latency
+            else:
+                self._latency = 0.8 * self._latency + 0.2 * latency
+                # Let the baseline follow slow drifts so one lucky sample does not pin it.
+                self._baseline = min(
+                    self._latency, self._baseline + 0.05 * (self._latency - self._baseline)
+                )
+            if self._cooldown:
+                self._cooldown -= 1
+            if self._latency > self._baseline * self.latency_tolerance:
+                self._decrease()
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._wake()
+
+    def overloaded(self):
+        """
+        Records a 429 response.
+        """
+        with self._condition:
+            if self._cooldown:
+                self._cooldown -= 1
+            self._decrease()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Holds a slot for one request made in the block, on a thread. The clients
+        report the request's outcome to the controller.
+        """
+        self.acquire()
+        token = _active.set(self)
+        try:
+            yield
+        finally:
+            _active.reset(token)
+            self.release()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """
+        Holds a slot for one request made in the block, in a coroutine. The clients
+        report the request's outcome to the controller.
+        """
+        await self.acquire_async()
+        token = _active.set(self)
+        try:
+            yield
+        finally:
+            _active.reset(token)
+            self.release()
+
+    def _decrease(self):
+        if self._cooldown:
+            return
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self._cooldown = self.limit
+        self.decreases += 1
+
+    def _wake(self):
+        free = self.limit - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        while free and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(_resolve, waiter)
+                free -= 1
+
+
+class FlightStats(BaseModel):
+    """
+    Counters of a SingleFlight.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    calls: int = Field(..., description="Requests that went through the single-flight layer")
+    coalesced: int = Field(..., description="Requests answered by another caller's request")
+    in_flight: int = Field(..., description="Distinct requests currently in flight")
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call for a key is in flight, other
+    callers with the same key wait for its result instead of making their own.
+
+    Results are not kept once the call completes, so nothing is ever served stale.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._futures: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self._lock = Lock()
+
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(
+                calls=self.calls,
+                coalesced=self.coalesced,
+                in_flight=len(self._futures) + len(self._tasks),
+            )
+
+    def do(self, key: Hashable, func: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Returns `func()`, or the result of the identical call already in flight on another thread.
+
+        Waiting for another thread's call raises RequestTimeoutError after `timeout` seconds.
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._futures.get(key)
+            if future is not None:
+                self.coalesced += 1
+            else:
+                self._futures[key] = leader = Future()
+        if future is not None:
+            try:
+                return future.result(timeout)
+            except FutureTimeoutError:
+                raise RequestTimeoutError("Deadline exceeded", deadline_exceeded=True) from None
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key)
+            leader.set_exception(e)
+            raise
+        self._finish(key)
+        leader.set_result(result)
+        return result
+
+    async def do_async(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Returns `await func()`, or the result of the identical call already in flight.
+
+        The shared call is not cancelled when one of its callers is, or when a caller
+        stops waiting for it with RequestTimeoutError after `timeout` seconds.
+        """
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._tasks[key] = asyncio.ensure_future(func())
+                task.add_done_callback(lambda done: self._finish_task(key, done))
+        if timeout is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            if task.done() and not task.cancelled():
+                return task.result()
+            raise RequestTimeoutError("Deadline exceeded", deadline_exceeded=True) from None
+
+    def _finish(self, key: Hashable):
+        with self._lock:
+            del self._futures[key]
+
+    def _finish_task(self, key: Hashable, task: asyncio.Future):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Mark the error as retrieved when every caller gave up waiting.
+            task.exception()
+
+
+def report_success(latency: float):
+    """
+    Tells the controller of the current slot, if any, that a request succeeded after
+    an HTTP attempt of `latency` seconds.
+    """
+    controller = _active.get()
+    if controller is not None:
+        controller.succeeded(latency)
+
+
+def report_overload():
+    """
+    Tells the controller of the current slot, if any, that a request got a 429 response.
+    """
+    controller = _active.get()
+    if controller is not None:
+        controller.overloaded()
+
+
+def _resolve(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -1,4 +1,6 @@
+import re
 from enum import Enum
+from typing import Optional, Union
 
 BASE_URL = "https://api.chiefpay.org"
 
@@ -16,3 +18,23 @@ class Endpoints(Enum):
     wallet = "/v1/wallet"
     wallet_by_id = "/v1/wallet/{id}"  # For GET with path parameter
     socket = "/socket.io"
+
+
+_ENDPOINT_PATTERNS = [
+    (re.compile("^" + re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(endpoint.value)) + "$"), endpoint)
+    for endpoint in Endpoints
+]
+
+
+def resolve_endpoint(path: Union[Endpoints, str]) -> Optional[Endpoints]:
+    """
+    Returns the endpoint a request path belongs to, e.g. `Endpoints.invoice_by_id`
+    for "/v1/invoice/<id>", or None for unknown paths.
+    """
+    if isinstance(path, Endpoints):
+        return path
+    path = path.split("?", 1)[0]
+    for pattern, endpoint in _ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return endpoint
+    return None
@@ -0,0 +1,43 @@
+import time
+from typing import Optional, Union
+
+from chiefpay.exceptions import RequestTimeoutError
+
+
+class Deadline:
+    """
+    Point in time by which a call must complete, retries and backoff included.
+
+    Public client methods accept either a number of seconds or a Deadline, so a
+    caller can share one budget between several calls.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        """
+        Parameters:
+            seconds (float): Seconds from now until the deadline.
+        """
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def of(cls, deadline: Optional[Union[float, "Deadline"]]) -> Optional["Deadline"]:
+        """
+        Returns `deadline` as a Deadline, converting a number of seconds from now.
+        """
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        """
+        Returns the seconds left, or raises RequestTimeoutError once the deadline has passed.
+        """
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise RequestTimeoutError("Deadline exceeded", deadline_exceeded=True)
+        return remaining
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.expires_at - time.monotonic():.3f})"
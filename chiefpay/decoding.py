@@ -0,0 +1,136 @@
+from functools import lru_cache
+from typing import Any, List, Literal, Optional, Tuple, Type, Union, get_args
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from chiefpay.codec import JSONCodec, default_codec
+from chiefpay.exceptions import InvalidJSONError
+from chiefpay.types import InvoicesHistory, TransactionsHistory
+
+
+Validation = Literal["full", "raw"]
+
+VALIDATION_MODES = get_args(Validation)
+
+HistoryModel = Union[InvoicesHistory, TransactionsHistory]
+
+_DEFAULT_CODEC = default_codec()
+
+_HISTORY_ITEMS = {InvoicesHistory: "invoices", TransactionsHistory: "transactions"}
+
+
+def decode(
+    model: Type[BaseModel],
+    data: Any,
+    validate: Validation = "full",
+    codec: Optional[JSONCodec] = None,
+) -> Any:
+    """
+    Converts an API payload into a model according to the decoding mode.
+
+    Parameters:
+        model (Type[BaseModel]): The model the payload describes.
+        data (Any): The response body (bytes) or an already decoded JSON payload.
+        validate (str): "full" validates the payload and "raw" returns it unchanged.
+        codec (JSONCodec, optional): The codec used to parse bodies in "raw" mode.
+
+    Returns:
+        The model instance, or the payload itself in "raw" mode.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        if validate == "full":
+            return _validate_json(_adapter(model).validate_json, data)
+        data = load(data, codec)
+    if validate == "full":
+        return model.model_validate(data)
+    return data
+
+
+def decode_list(
+    model: Type[BaseModel],
+    items: Any,
+    validate: Validation = "full",
+    codec: Optional[JSONCodec] = None,
+) -> List:
+    """
+    Converts a list of API payloads, see `decode`.
+    """
+    if isinstance(items, (bytes, bytearray)):
+        if validate == "full":
+            return _validate_json(_adapter(List[model]).validate_json, items)
+        items = load(items, codec)
+    if validate == "raw":
+        return items
+    return [decode(model, item, validate) for item in items]
+
+
+def decode_history(
+    model: Type[HistoryModel],
+    data: Any,
+    validate: Validation = "full",
+    codec: Optional[JSONCodec] = None,
+) -> Tuple[List, int]:
+    """
+    Decodes a history page in a single pass, see `decode`.
+
+    Parameters:
+        model (Type[InvoicesHistory | TransactionsHistory]): The history model of the page.
+        data (Any): The response body (bytes) or an already decoded JSON payload.
+
+    Returns:
+        tuple: The decoded items of the page and its `totalCount`.
+    """
+    page = decode(model, data, validate, codec)
+    key = _HISTORY_ITEMS[model]
+    if isinstance(page, dict):
+        return page[key], page["totalCount"]
+    return getattr(page, key), page.total_count
+
+
+def build_history(
+    model: Type[HistoryModel], items: List, validate: Validation = "full"
+) -> Any:
+    """
+    Wraps already decoded items into a history object without validating them again.
+    """
+    key = _HISTORY_ITEMS[model]
+    if validate == "raw":
+        return {key: items, "totalCount": len(items)}
+    return model.model_construct(**{key: items, "total_count": len(items)})
+
+
+def load(data: bytes, codec: Optional[JSONCodec] = None) -> Any:
+    """
+    Parses a response body, raising InvalidJSONError if it is not valid JSON.
+    """
+    try:
+        return (codec or _DEFAULT_CODEC).loads(data)
+    except ValueError:
+        raise InvalidJSONError() from None
+
+
+def check_validation(validate: str) -> Validation:
+    if validate not in VALIDATION_MODES:
+        raise ValueError(
+            f"Invalid validate mode: {validate}. Expected one of {', '.join(VALIDATION_MODES)}"
+        )
+    return validate
+
+
+def _validate_json(validator, data: bytes):
+    try:
+        return validator(data)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise InvalidJSONError() from None
+        raise
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+# History pages are the largest payloads: build their validators once, at import time.
+for _model in _HISTORY_ITEMS:
+    _adapter(_model)
@@ -36,12 +36,15 @@ class APIError(ChiefPayError):
 
 
 class ManyRequestsError(ChiefPayError):
-    def __init__(self):
-        super().__init__("Too Many Requests", code="OUT_OF_RANGE")
+    def __init__(self, retry_after: float = 3.0):
+        self.code = ChiefPayErrorCode.OUT_OF_RANGE
+        self.retry_after = retry_after
+        super().__init__("Too Many Requests")
 
 
 class InvalidJSONError(ChiefPayError):
-    def __init__(self, message: str = "Invalid JSON response"):
+    def __init__(self, message: str = "Invalid JSON response", status_code: Optional[int] = None):
+        self.status_code = status_code
         super().__init__(message)
 
 
@@ -54,3 +57,22 @@ class TransportError(ChiefPayError):
 class SocketError(ChiefPayError):
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class RequestTimeoutError(ChiefPayError):
+    def __init__(self, message: str = "Request timed out", deadline_exceeded: bool = False):
+        # True when the caller's deadline, not a configured timeout, ran out.
+        self.deadline_exceeded = deadline_exceeded
+        super().__init__(message)
+
+
+class CircuitOpenError(ChiefPayError):
+    def __init__(self, group: str, retry_after: float = 0.0):
+        self.group = group
+        self.retry_after = max(0.0, retry_after)
+        super().__init__(f"Circuit open for {group} requests")
+
+
+class HistoryOrderError(ChiefPayError):
+    def __init__(self, message: str = "History page is not ordered by createdAt"):
+        super().__init__(message)
@@ -0,0 +1,273 @@
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from decimal import MAX_PREC, ROUND_HALF_EVEN, Context, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from chiefpay.utils import Utils
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+AMOUNT_COLUMNS = ("value", "usd", "fee", "merchant_amount")
+CATEGORY_COLUMNS = ("chain", "token")
+GROUP_KEYS = CATEGORY_COLUMNS + ("day",)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLIS_PER_DAY = 86_400_000
+_INT64_MAX = 2**63 - 1
+# Amounts are scaled and unscaled without rounding, however many digits they have.
+_EXACT = Context(prec=MAX_PREC)
+_ALIASES = {"merchant_amount": "merchantAmount", "created_at": "createdAt"}
+
+
+class TransactionsFrame:
+    """
+    Columnar container of transactions for aggregations over large histories.
+
+    Amounts (`value`, `usd`, `fee`, `merchant_amount`) are stored as integers scaled by
+    10**scale, `chain`/`token` as integer codes into a list of categories and
+    `created_at` as epoch milliseconds. Columns are NumPy int64 arrays when NumPy is
+    installed and `array('q')` otherwise. An amount column with a scaled value beyond
+    int64 (e.g. an 18-decimal token amount) holds Python ints instead (an object
+    array or a list), and totals that could overflow int64 are summed as Python
+    ints, so sums are exact in all cases.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        categories: Dict[str, List[str]],
+        scale: int = 8,
+    ):
+        """
+        Parameters:
+            columns (dict): The amount, category code and `created_at` columns.
+            categories (dict): The values behind the `chain` and `token` codes.
+            scale (int): Number of decimal places kept for amounts.
+        """
+        self.columns = columns
+        self.categories = categories
+        self.scale = scale
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable, scale: int = 8) -> "TransactionsFrame":
+        """
+        Builds a frame from transactions, consuming them one at a time.
+
+        Parameters:
+            transactions (Iterable): Transaction models (validated or not) or raw dicts,
+                e.g. `TransactionsHistory.transactions` or `client.iter_transactions(...)`.
+            scale (int): Number of decimal places kept for amounts.
+
+        Returns:
+            TransactionsFrame: The frame.
+        """
+        quantum = Decimal(1).scaleb(-scale)
+        columns = {name: array("q") for name in AMOUNT_COLUMNS + CATEGORY_COLUMNS + ("created_at",)}
+        codes = {name: {} for name in CATEGORY_COLUMNS}
+
+        for transaction in transactions:
+            for name in AMOUNT_COLUMNS:
+                amount = Decimal(_field(transaction, name))
+                scaled = int(
+                    amount.quantize(quantum, ROUND_HALF_EVEN, _EXACT).scaleb(scale, _EXACT)
+                )
+                try:
+                    columns[name].append(scaled)
+                except OverflowError:
+                    # Beyond int64: keep the column as Python ints.
+                    columns[name] = columns[name].tolist() + [scaled]
+            for name in CATEGORY_COLUMNS:
+                value = _field(transaction, name)
+                columns[name].append(codes[name].setdefault(value, len(codes[name])))
+            columns["created_at"].append(_epoch_millis(_field(transaction, "created_at")))
+
+        categories = {name: list(codes[name]) for name in CATEGORY_COLUMNS}
+        if np is not None:
+            columns = {
+                name: (
+                    np.frombuffer(column, dtype=np.int64)
+                    if isinstance(column, array)
+                    else np.array(column, dtype=object)
+                )
+                for name, column in columns.items()
+            }
+        return cls(columns, categories, scale)
+
+    def __len__(self) -> int:
+        return len(self.columns["created_at"])
+
+    def filter(
+        self,
+        chain: Optional[Union[str, Sequence[str]]] = None,
+        token: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> "TransactionsFrame":
+        """
+        Returns the transactions matching all the given conditions.
+
+        Parameters:
+            chain (str | Sequence[str], optional): Chain name(s) to keep.
+            token (str | Sequence[str], optional): Token name(s) to keep.
+            since (datetime, optional): Keep transactions created at or after this date.
+            until (datetime, optional): Keep transactions created before this date.
+
+        Returns:
+            TransactionsFrame: A new frame sharing the categories of this one.
+        """
+        conditions = []
+        for name, wanted in (("chain", chain), ("token", token)):
+            if wanted is None:
+                continue
+            wanted = [wanted] if isinstance(wanted, str) else wanted
+            known = self.categories[name]
+            conditions.append((name, {known.index(value) for value in wanted if value in known}))
+        lower = _epoch_millis(since) if since is not None else None
+        upper = _epoch_millis(until) if until is not None else None
+
+        if np is not None:
+            created_at = self.columns["created_at"]
+            mask = np.ones(len(self), dtype=bool)
+            for name, allowed in conditions:
+                mask &= np.isin(self.columns[name], list(allowed))
+            if lower is not None:
+                mask &= created_at >= lower
+            if upper is not None:
+                mask &= created_at < upper
+            columns = {name: column[mask] for name, column in self.columns.items()}
+        else:
+            created_at = self.columns["created_at"]
+            selected = [
+                i
+                for i in range(len(self))
+                if all(self.columns[name][i] in allowed for name, allowed in conditions)
+                and (lower is None or created_at[i] >= lower)
+                and (upper is None or created_at[i] < upper)
+            ]
+            columns = {
+                name: (
+                    array("q", (column[i] for i in selected))
+                    if isinstance(column, array)
+                    else [column[i] for i in selected]
+                )
+                for name, column in self.columns.items()
+            }
+        return TransactionsFrame(columns, self.categories, self.scale)
+
+    def sum(self, column: str = "usd") -> Decimal:
+        """
+        Returns the exact total of an amount column.
+        """
+        self._check_amount(column)
+        values = self.columns[column]
+        if np is None:
+            total = sum(values)
+        elif _fits_int64_sum(values):
+            total = int(values.sum(dtype=np.int64))
+        else:
+            total = sum(values.tolist())
+        return self._to_decimal(total)
+
+    def group_sum(
+        self, column: str = "usd", by: Union[str, Tuple[str, ...]] = "chain"
+    ) -> Dict[Any, Decimal]:
+        """
+        Returns the exact totals of an amount column per group.
+
+        Parameters:
+            column (str): One of "value", "usd", "fee", "merchant_amount".
+            by (str | tuple[str, ...]): "chain", "token", "day" (UTC date of `created_at`)
+                or a tuple of them, e.g. ("day", "chain").
+
+        Returns:
+            dict: Totals keyed by group value (a tuple of values when grouping by several keys).
+        """
+        self._check_amount(column)
+        keys = (by,) if isinstance(by, str) else tuple(by)
+        for key in keys:
+            if key not in GROUP_KEYS:
+                raise ValueError(f"Cannot group by {key}. Expected one of {', '.join(GROUP_KEYS)}")
+
+        group_columns = [self._group_column(key) for key in keys]
+        values = self.columns[column]
+
+        if np is not None:
+            if not len(self):
+                return {}
+            stacked = np.stack(group_columns, axis=1)
+            groups, inverse = np.unique(stacked, axis=0, return_inverse=True)
+            if _fits_int64_sum(values):
+                totals = np.zeros(len(groups), dtype=np.int64)
+            else:
+                values = values.astype(object)
+                totals = np.zeros(len(groups), dtype=object)
+            np.add.at(totals, inverse.reshape(-1), values)
+            pairs = zip(map(tuple, groups.tolist()), totals.tolist())
+        else:
+            accumulated = {}
+            for i, value in enumerate(values):
+                group = tuple(group_column[i] for group_column in group_columns)
+                accumulated[group] = accumulated.get(group, 0) + value
+            pairs = sorted(accumulated.items())
+
+        result = {}
+        for group, total in pairs:
+            labels = tuple(self._label(key, code) for key, code in zip(keys, group))
+            result[labels[0] if len(labels) == 1 else labels] = self._to_decimal(total)
+        return result
+
+    def to_decimal(self, column: str) -> List[Decimal]:
+        """
+        Returns an amount column as Decimals.
+        """
+        self._check_amount(column)
+        return [self._to_decimal(int(value)) for value in self.columns[column]]
+
+    def _group_column(self, key: str):
+        if key != "day":
+            return self.columns[key]
+        created_at = self.columns["created_at"]
+        if np is not None:
+            return created_at // _MILLIS_PER_DAY
+        return array("q", (millis // _MILLIS_PER_DAY for millis in created_at))
+
+    def _label(self, key: str, code: int):
+        if key == "day":
+            return date(1970, 1, 1) + timedelta(days=int(code))
+        return self.categories[key][int(code)]
+
+    def _to_decimal(self, value: int) -> Decimal:
+        return Decimal(value).scaleb(-self.scale, _EXACT)
+
+    @staticmethod
+    def _check_amount(column: str):
+        if column not in AMOUNT_COLUMNS:
+            raise ValueError(f"Unknown amount column: {column}. Expected one of {', '.join(AMOUNT_COLUMNS)}")
+
+
+def _fits_int64_sum(values) -> bool:
+    """
+    Returns whether no sum of `values`, a NumPy array, can overflow int64.
+    """
+    if values.dtype != np.int64:
+        return False
+    if not len(values):
+        return True
+    bound = max(abs(int(values.min())), abs(int(values.max())))
+    return bound * len(values) <= _INT64_MAX
+
+
+def _field(transaction: Any, name: str) -> Any:
+    if isinstance(transaction, dict):
+        return transaction[_ALIASES.get(name, name)]
+    return getattr(transaction, name)
+
+
+def _epoch_millis(value: Union[datetime, str]) -> int:
+    if isinstance(value, str):
+        value = Utils.parse_date(value)
+    return (value - _EPOCH) // timedelta(milliseconds=1)
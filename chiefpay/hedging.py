@@ -0,0 +1,136 @@
+import asyncio
+from collections import deque
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+
+
+class HedgePolicy(BaseModel):
+    """
+    When `AsyncClient` sends a second, hedged attempt of a slow GET request.
+
+    A GET that has not completed after the `percentile` latency recently observed on
+    its endpoint is sent again; the first response wins and the other attempt is
+    cancelled. At most `budget` of the requests are hedged, so the extra load stays bounded.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    percentile: float = Field(95.0, gt=0, lt=100, description="Latency percentile after which a request is hedged")
+    budget: float = Field(0.05, gt=0, le=1, description="Maximum fraction of requests that are hedged")
+    window: int = Field(200, gt=0, description="Number of recent latencies kept per endpoint")
+    min_samples: int = Field(20, gt=0, description="Latencies needed on an endpoint before hedging it")
+    min_delay: float = Field(0.005, ge=0, description="Seconds waited at least before hedging")
+
+
+class HedgeStats(BaseModel):
+    """
+    Counters of a Hedger.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    requests: int = Field(..., description="GET requests eligible for hedging")
+    hedged: int = Field(..., description="Requests for which a second attempt was sent")
+    won: int = Field(..., description="Hedged requests answered by the second attempt")
+
+
+class Hedger:
+    """
+    Tracks GET latencies per endpoint and runs hedged requests according to a HedgePolicy.
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy or HedgePolicy()
+        self.requests = 0
+        self.hedged = 0
+        self.won = 0
+        self._latencies: Dict[Any, Deque[float]] = {}
+        self._lock = Lock()
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(requests=self.requests, hedged=self.hedged, won=self.won)
+
+    def delay(self, path: Union[Endpoints, str]) -> Optional[float]:
+        """
+        Returns the seconds after which a request to `path` is hedged, or None while
+        too few latencies are known.
+        """
+        with self._lock:
+            latencies = self._latencies.get(_key(path))
+            if latencies is None or len(latencies) < self.policy.min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.policy.percentile / 100))
+        return max(self.policy.min_delay, ordered[index])
+
+    def record(self, path: Union[Endpoints, str], latency: float):
+        with self._lock:
+            key = _key(path)
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.policy.window)
+            latencies.append(latency)
+
+    async def run(
+        self,
+        path: Union[Endpoints, str],
+        send: Callable[[], Awaitable[Any]],
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        Awaits `send()`, starting a second `send()` if the first one is slow, the
+        budget allows it and `admit()`, if given, returns True. `send` must make a
+        single HTTP attempt, so that the recorded latencies exclude retries and waits.
+        Returns the first successful result; if both attempts fail, the error of the
+        first one is raised.
+        """
+        delay = self.delay(path)
+        with self._lock:
+            self.requests += 1
+
+        attempts = [asyncio.ensure_future(self._timed(path, send))]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done and self._allow(admit):
+                    attempts.append(asyncio.ensure_future(self._timed(path, send)))
+
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in attempts:
+                    if attempt in done and attempt.exception() is None:
+                        if attempt is not attempts[0]:
+                            with self._lock:
+                                self.won += 1
+                        return attempt.result()
+            return attempts[0].result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def _allow(self, admit: Optional[Callable[[], bool]]) -> bool:
+        with self._lock:
+            if self.hedged + 1 > self.policy.budget * self.requests:
+                return False
+        if admit is not None and not admit():
+            return False
+        with self._lock:
+            self.hedged += 1
+        return True
+
+    async def _timed(self, path: Union[Endpoints, str], send: Callable[[], Awaitable[Any]]) -> Any:
+        start = perf_counter()
+        result = await send()
+        self.record(path, perf_counter() - start)
+        return result
+
+
+def _key(path: Union[Endpoints, str]) -> Any:
+    endpoint = resolve_endpoint(path)
+    return endpoint if endpoint is not None else path
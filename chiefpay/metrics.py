@@ -0,0 +1,234 @@
+import asyncio
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestEvent:
+    """
+    One HTTP request of a REST client, as seen by the request hooks.
+
+    `status`, `bytes_in`, `latency` and `error` are filled in when the request ends;
+    `status` stays None if no response was received.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "bytes_out",
+        "bytes_in",
+        "status",
+        "latency",
+        "error",
+        "_start",
+    )
+
+    def __init__(self, method: str, endpoint: str, url: str, bytes_out: int):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.bytes_out = bytes_out
+        self.bytes_in = 0
+        self.status: Optional[int] = None
+        self.latency = 0.0
+        self.error: Optional[BaseException] = None
+        self._start = perf_counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(method={self.method!r}, endpoint={self.endpoint!r}, "
+            f"status={self.status}, latency={self.latency:.4f})"
+        )
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class EndpointMetrics(BaseModel):
+    """
+    Counters of the requests to one endpoint.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    requests: int = Field(0, description="Requests sent, retries included")
+    statuses: Dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Requests by response status, \"cancelled\" if the request was cancelled "
+            "(e.g. a losing hedge attempt) and \"error\" if there was no response"
+        ),
+    )
+    rate_limited: int = Field(0, description="Requests answered with 429")
+    retries: int = Field(0, description="Requests sent again after a 429 response")
+    retry_sleep: float = Field(0.0, description="Seconds of Retry-After-ms delay before retries")
+    bytes_in: int = Field(0, description="Response body bytes received")
+    bytes_out: int = Field(0, description="Request body bytes sent")
+    latency_sum: float = Field(0.0, description="Total request latency in seconds")
+    latency_buckets: List[int] = Field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS),
+        description="Requests at most as slow as each of LATENCY_BUCKETS (not cumulative)",
+    )
+
+
+class Metrics:
+    """
+    Request hooks and latency, status, retry and traffic metrics of the REST clients.
+
+    Every HTTP request, retries and hedged attempts included, is reported, so
+    `latency_sum` and the retry counters show how much time goes to the API and how
+    much to retries. One Metrics can be shared by several clients.
+
+    Example:
+        metrics = Metrics()
+        client = Client(api_key, metrics=metrics)
+
+        @metrics.on_request_end
+        def log(event: RequestEvent):
+            print(event.endpoint, event.status, event.latency)
+
+        print(metrics.prometheus())
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._start_hooks: List[RequestHook] = []
+        self._end_hooks: List[RequestHook] = []
+        self._lock = Lock()
+
+    def on_request_start(self, hook: RequestHook) -> RequestHook:
+        """
+        Registers `hook` to be called, on the requesting thread, before every request.
+        """
+        self._start_hooks.append(hook)
+        return hook
+
+    def on_request_end(self, hook: RequestHook) -> RequestHook:
+        """
+        Registers `hook` to be called, on the requesting thread, after every request.
+        """
+        self._end_hooks.append(hook)
+        return hook
+
+    def stats(self) -> Dict[str, EndpointMetrics]:
+        """
+        Returns a snapshot of the metrics, by endpoint name.
+        """
+        with self._lock:
+            return {name: metrics.model_copy(deep=True) for name, metrics in self._endpoints.items()}
+
+    @contextmanager
+    def track(
+        self, method: str, path: Union[Endpoints, str], url: str, body: Optional[bytes] = None
+    ) -> Iterator[RequestEvent]:
+        """
+        Measures the request made in the block; the caller sets `status` and `bytes_in`
+        on the yielded event.
+        """
+        event = RequestEvent(method, _endpoint_name(path), url, len(body) if body else 0)
+        for hook in self._start_hooks:
+            hook(event)
+        try:
+            yield event
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.latency = perf_counter() - event._start
+            self._record(event)
+            for hook in self._end_hooks:
+                hook(event)
+
+    def retried(self, path: Union[Endpoints, str], delay: float):
+        """
+        Records that a request to `path` got a 429 response and is retried after `delay` seconds.
+        """
+        with self._lock:
+            metrics = self._metrics(_endpoint_name(path))
+            metrics.retries += 1
+            metrics.retry_sleep += delay
+
+    def prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        endpoints = sorted(self.stats().items())
+        histogram = "chiefpay_request_duration_seconds"
+        lines = [
+            f"# HELP {histogram} Latency of ChiefPay API requests.",
+            f"# TYPE {histogram} histogram",
+        ]
+        for name, metrics in endpoints:
+            count = 0
+            for bound, observed in zip(LATENCY_BUCKETS, metrics.latency_buckets):
+                count += observed
+                lines.append(f'{histogram}_bucket{{endpoint="{name}",le="{bound}"}} {count}')
+            lines.append(f'{histogram}_bucket{{endpoint="{name}",le="+Inf"}} {metrics.requests}')
+            lines.append(f'{histogram}_sum{{endpoint="{name}"}} {metrics.latency_sum}')
+            lines.append(f'{histogram}_count{{endpoint="{name}"}} {metrics.requests}')
+
+        lines += [
+            "# HELP chiefpay_requests_total ChiefPay API requests by response status.",
+            "# TYPE chiefpay_requests_total counter",
+        ]
+        for name, metrics in endpoints:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'chiefpay_requests_total{{endpoint="{name}",status="{status}"}} {count}')
+
+        for metric, field, description in _COUNTERS:
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+            for name, metrics in endpoints:
+                lines.append(f'{metric}{{endpoint="{name}"}} {getattr(metrics, field)}')
+        return "\n".join(lines) + "\n"
+
+    def _record(self, event: RequestEvent):
+        if isinstance(event.error, asyncio.CancelledError):
+            # Hedging cancels the losing attempt; that is not a failed request.
+            status = "cancelled"
+        elif event.status is not None:
+            status = str(event.status)
+        else:
+            status = "error"
+        with self._lock:
+            metrics = self._metrics(event.endpoint)
+            metrics.requests += 1
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if event.status == 429:
+                metrics.rate_limited += 1
+            metrics.bytes_in += event.bytes_in
+            metrics.bytes_out += event.bytes_out
+            metrics.latency_sum += event.latency
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if event.latency <= bound:
+                    metrics.latency_buckets[index] += 1
+                    break
+
+    def _metrics(self, name: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = EndpointMetrics()
+        return metrics
+
+
+# Prometheus counter name, EndpointMetrics field and help text of the per-endpoint counters.
+_COUNTERS: Tuple[Tuple[str, str, str], ...] = (
+    ("chiefpay_rate_limited_total", "rate_limited", "ChiefPay API requests answered with 429."),
+    ("chiefpay_retries_total", "retries", "ChiefPay API requests retried after a 429 response."),
+    ("chiefpay_retry_sleep_seconds_total", "retry_sleep", "Seconds of Retry-After-ms delay."),
+    ("chiefpay_received_bytes_total", "bytes_in", "Response body bytes received from the ChiefPay API."),
+    ("chiefpay_sent_bytes_total", "bytes_out", "Request body bytes sent to the ChiefPay API."),
+)
+
+
+def _endpoint_name(path: Union[Endpoints, str]) -> str:
+    endpoint = resolve_endpoint(path)
+    return endpoint.name if endpoint is not None else "unknown"
@@ -0,0 +1,156 @@
+import warnings
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from chiefpay.exceptions import HistoryOrderError
+from chiefpay.utils import Utils
+
+
+MAX_PAGE_SIZE = 1000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class HistoryCursor:
+    """
+    Tracks the position of a walk through a history endpoint.
+
+    The history endpoints have no offset or cursor parameter, so pages are
+    addressed by moving `fromDate` up to the newest `createdAt` of the previous
+    page. Items sharing that boundary timestamp are returned again by the next
+    request and are skipped by id. This relies on pages listing items oldest
+    first: a full page in any other order raises HistoryOrderError, since moving
+    past it could skip items.
+    """
+
+    def __init__(
+        self,
+        from_date: str,
+        to_date: Optional[str] = None,
+        limit: int = MAX_PAGE_SIZE,
+        not_notified: Optional[bool] = None,
+    ):
+        """
+        Parameters:
+            from_date (str): The start date.
+            to_date (str, optional): The end date.
+            limit (int): Page size (max 1000).
+            not_notified (bool, optional): Return only notifications not yet acknowledged.
+        """
+        Utils.validate_date(from_date)
+        if to_date:
+            Utils.validate_date(to_date)
+        if not 0 < limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        self.from_date = from_date
+        self.to_date = to_date
+        self.limit = limit
+        self.not_notified = not_notified
+        self.done = False
+        self._boundary_ids = set()
+
+    def params(self) -> Dict:
+        """
+        Returns the query parameters for the next page.
+        """
+        params = {"fromDate": self.from_date, "toDate": self.to_date, "limit": self.limit}
+        if self.not_notified is not None:
+            params["notNotified"] = self.not_notified
+        return params
+
+    def advance(self, items: List[Any], total_count: Optional[int] = None) -> List[Any]:
+        """
+        Moves the cursor past a fetched page.
+
+        Parameters:
+            items (list): Items of the page, as models or raw dicts.
+            total_count (int, optional): The `totalCount` of the page.
+
+        Returns:
+            list: The items of the page that were not yielded before.
+
+        Raises:
+            HistoryOrderError: If more pages follow and this one is not ordered oldest first.
+        """
+        ids = [item_id(item) for item in items]
+        fresh = [item for item, id in zip(items, ids) if id not in self._boundary_ids]
+
+        if len(items) < self.limit or (total_count is not None and total_count <= len(items)):
+            self.done = True
+            return fresh
+
+        keys = [Utils.format_date(item_created_at(item)) for item in items]
+        if any(key > next_key for key, next_key in zip(keys, keys[1:])):
+            raise HistoryOrderError(
+                f"History page from {self.from_date} is not ordered oldest first; "
+                "cannot page past it without skipping items"
+            )
+        last = keys[-1]
+        boundary_ids = {id for id, key in zip(ids, keys) if key == last}
+
+        if last == self.from_date:
+            if not fresh:
+                # A whole page shares one millisecond: step over it rather than loop forever.
+                warnings.warn(
+                    f"History items created at {last} fill a whole page of {self.limit}; "
+                    "any more of them cannot be paged through and were skipped.",
+                    RuntimeWarning,
+                )
+                last = Utils.format_date(Utils.parse_date(last) + timedelta(milliseconds=1))
+                boundary_ids = set()
+            else:
+                boundary_ids |= self._boundary_ids
+
+        self.from_date = last
+        self._boundary_ids = boundary_ids
+        return fresh
+
+
+def item_id(item: Any) -> str:
+    """
+    Returns the id of a history item, given as a model or a raw dict.
+    """
+    return str(item["id"] if isinstance(item, dict) else item.id)
+
+
+def item_created_at(item: Any) -> datetime:
+    """
+    Returns the creation date of a history item, given as a model or a raw dict.
+    """
+    created_at = item["createdAt"] if isinstance(item, dict) else item.created_at
+    return Utils.parse_date(created_at) if isinstance(created_at, str) else created_at
+
+
+def split_range(from_date: str, to_date: str, parts: int) -> List[Tuple[str, str]]:
+    """
+    Splits a date range into `parts` adjacent windows of (roughly) equal length.
+
+    Windows share their boundary millisecond, since the history endpoints treat both
+    `fromDate` and `toDate` as inclusive; callers de-duplicate by id.
+
+    Parameters:
+        from_date (str): The start date.
+        to_date (str): The end date.
+        parts (int): The number of windows (fewer are returned for very short ranges).
+
+    Returns:
+        list[tuple[str, str]]: The (from_date, to_date) pairs, in order.
+    """
+    start = _to_millis(from_date)
+    end = _to_millis(to_date)
+    if end < start:
+        raise ValueError("to_date must not be earlier than from_date")
+
+    parts = max(1, min(parts, end - start))
+    bounds = [start + (end - start) * i // parts for i in range(parts + 1)]
+    return [(_from_millis(lo), _from_millis(hi)) for lo, hi in zip(bounds, bounds[1:])]
+
+
+def _to_millis(date: str) -> int:
+    delta = Utils.parse_date(date) - _EPOCH
+    return delta // timedelta(milliseconds=1)
+
+
+def _from_millis(millis: int) -> str:
+    return Utils.format_date(_EPOCH + timedelta(milliseconds=millis))
@@ -0,0 +1,183 @@
+import random
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from aiohttp import TraceConfig
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+
+
+class CallProfile:
+    """
+    Time spent in each phase of one client call, in seconds.
+
+    `connect` is the wait for a pooled or new connection, `first_byte` the time from
+    then until the response headers arrived, `read` the body download, `decode` the
+    JSON parsing and `validate` the model construction. Phases summed over retries;
+    a phase that could not be measured is None (the synchronous client cannot tell
+    connection acquisition apart, so it is included in `first_byte`).
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "attempts",
+        "connect",
+        "first_byte",
+        "read",
+        "decode",
+        "validate",
+        "total",
+        "_start",
+        "_mark",
+        "_reported",
+    )
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.attempts = 0
+        self.connect: Optional[float] = None
+        self.first_byte = 0.0
+        self.read = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self.total = 0.0
+        self._start = perf_counter()
+        self._mark = self._start
+        self._reported = False
+
+    def copy(self) -> "CallProfile":
+        profile = CallProfile.__new__(CallProfile)
+        for name in self.__slots__:
+            setattr(profile, name, getattr(self, name))
+        return profile
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{name}={value:.6f}" if isinstance(value, float) else f"{name}={value!r}"
+            for name, value in self.as_dict().items()
+        )
+        return f"CallProfile({phases})"
+
+
+class ProfiledBody(bytes):
+    """
+    Response body carrying the profile of the call that received it.
+    """
+
+    profile: CallProfile
+
+
+class Profiler:
+    """
+    Samples client calls and reports their per-phase timing breakdown.
+
+    A sampled call is timed from the request to the decoded result, and its
+    CallProfile is passed to `callback` once the result has been built. Calls that
+    fail, or that return without decoding a body, are not reported. For sampled
+    calls in "full" validation mode the body is parsed and validated in two steps
+    instead of one, so that each can be timed.
+    """
+
+    def __init__(self, callback: Callable[[CallProfile], None], sample_rate: float = 0.01):
+        """
+        Parameters:
+            callback (callable): Receives the CallProfile of every sampled call.
+            sample_rate (float): Fraction of calls that are profiled (0 to 1).
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.callback = callback
+        self.sample_rate = sample_rate
+
+    def sample(self, method: str, path: Union[Endpoints, str]) -> Optional[CallProfile]:
+        """
+        Returns a new CallProfile if this call is sampled, None otherwise.
+        """
+        if random.random() >= self.sample_rate:
+            return None
+        endpoint = resolve_endpoint(path)
+        return CallProfile(method, endpoint.name if endpoint is not None else "unknown")
+
+    def trace_config(self) -> TraceConfig:
+        """
+        Returns the aiohttp trace config measuring connection acquisition and time to first byte.
+        """
+        config = TraceConfig()
+        config.on_connection_create_end.append(_connected)
+        config.on_connection_reuseconn.append(_connected)
+        config.on_request_end.append(_headers_received)
+        return config
+
+    @staticmethod
+    def start_attempt(profile: CallProfile):
+        profile.attempts += 1
+        profile._mark = perf_counter()
+
+    @staticmethod
+    def connected(profile: CallProfile):
+        now = perf_counter()
+        profile.connect = (profile.connect or 0.0) + now - profile._mark
+        profile._mark = now
+
+    @staticmethod
+    def headers_received(profile: CallProfile):
+        now = perf_counter()
+        profile.first_byte += now - profile._mark
+        profile._mark = now
+
+    @staticmethod
+    def body_read(profile: CallProfile, body: bytes) -> ProfiledBody:
+        profile.read += perf_counter() - profile._mark
+        body = ProfiledBody(body)
+        body.profile = profile
+        return body
+
+    def decode(
+        self,
+        profile: CallProfile,
+        data: bytes,
+        build: Callable[[Any], Any],
+        load: Callable[[bytes], Any],
+    ) -> Any:
+        """
+        Returns `build(load(data))`, timing both steps and reporting `profile`.
+        """
+        start = perf_counter()
+        payload = load(data)
+        parsed = perf_counter()
+        result = build(payload)
+        profile.decode += parsed - start
+        profile.validate += perf_counter() - parsed
+        profile.total = perf_counter() - profile._start
+        self.callback(profile)
+        return result
+
+
+def take_profile(data: Any) -> Tuple[Optional[CallProfile], Any]:
+    """
+    Returns the profile carried by a response body, unless it was already reported,
+    and the body as plain bytes (JSON parsers reject bytes subclasses).
+    """
+    if not isinstance(data, ProfiledBody):
+        return None, data
+    profile = data.profile
+    data = bytes(data)
+    if profile._reported:
+        return None, data
+    profile._reported = True
+    return profile, data
+
+
+async def _connected(session, context, params):
+    if isinstance(context.trace_request_ctx, CallProfile):
+        Profiler.connected(context.trace_request_ctx)
+
+
+async def _headers_received(session, context, params):
+    if isinstance(context.trace_request_ctx, CallProfile):
+        Profiler.headers_received(context.trace_request_ctx)
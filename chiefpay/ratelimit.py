@@ -0,0 +1,152 @@
+import asyncio
+import time
+import weakref
+from threading import Lock
+from typing import Dict, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+from chiefpay.exceptions import RequestTimeoutError
+
+
+class RateLimit(BaseModel):
+    """
+    Client-side request budget, enforced with a token bucket shared by every client
+    using the same API key.
+
+    `weights` maps endpoint names (`Endpoints` member names, e.g. "invoices_history")
+    to the number of tokens a request costs; other endpoints cost one token.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    rate: float = Field(10.0, gt=0, description="Tokens added per second")
+    burst: float = Field(20.0, gt=0, description="Maximum number of tokens in the bucket")
+    weights: Dict[str, float] = Field(
+        default_factory=dict, description="Tokens consumed per request, by endpoint name"
+    )
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the request rate of the REST clients.
+
+    Requests reserve tokens, and when the bucket is empty they are told how long to
+    wait for their turn: the lock is only held to update the bucket, so the same
+    limiter is safe to share between threads (`acquire`) and event loops
+    (`acquire_async`). A 429 response empties the bucket for the announced
+    Retry-After delay, pausing every client sharing it instead of each one
+    bouncing off the server limit on its own.
+    """
+
+    _shared: "weakref.WeakValueDictionary[str, RateLimiter]" = weakref.WeakValueDictionary()
+    _shared_lock = Lock()
+
+    def __init__(self, config: Optional[RateLimit] = None):
+        """
+        Parameters:
+            config (RateLimit, optional): Rate, burst and endpoint weights.
+        """
+        self.config = config or RateLimit()
+        self._tokens = self.config.burst
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+        self.waited = 0.0
+
+    @classmethod
+    def shared(cls, api_key: str, config: Optional[RateLimit] = None) -> "RateLimiter":
+        """
+        Returns the limiter of an API key, creating it on first use.
+
+        A config given for an existing limiter replaces its previous one.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(api_key)
+            if limiter is None:
+                limiter = cls._shared[api_key] = cls(config)
+            elif config is not None and config != limiter.config:
+                limiter.configure(config)
+            return limiter
+
+    def configure(self, config: RateLimit):
+        with self._lock:
+            self._refill()
+            self.config = config
+            self._tokens = min(self._tokens, config.burst)
+
+    @property
+    def tokens(self) -> float:
+        """
+        Tokens currently available (negative while requests are queued).
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def weight(self, path: Union[Endpoints, str]) -> float:
+        """
+        Returns the number of tokens a request to `path` costs.
+        """
+        endpoint = resolve_endpoint(path)
+        if endpoint is None:
+            return 1.0
+        return self.config.weights.get(endpoint.name, 1.0)
+
+    def reserve(self, path: Union[Endpoints, str], timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Takes the tokens of a request and returns how many seconds the caller must
+        wait before sending it, or None, taking nothing, if that is more than `timeout`.
+        """
+        with self._lock:
+            self._refill()
+            weight = self.weight(path)
+            delay = max(0.0, (weight - self._tokens) / self.config.rate)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens -= weight
+            self.waited += delay
+            return delay
+
+    def penalize(self, retry_after: float):
+        """
+        Empties the bucket so that no request is sent for `retry_after` seconds.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -retry_after * self.config.rate)
+
+    def acquire(self, path: Union[Endpoints, str], timeout: Optional[float] = None):
+        """
+        Blocks the calling thread until a request to `path` may be sent.
+
+        Raises RequestTimeoutError at once if that would take more than `timeout` seconds.
+        """
+        delay = self._wait(path, timeout)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: Union[Endpoints, str], timeout: Optional[float] = None):
+        """
+        Waits, without blocking the event loop, until a request to `path` may be sent.
+
+        Raises RequestTimeoutError at once if that would take more than `timeout` seconds.
+        """
+        delay = self._wait(path, timeout)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _wait(self, path: Union[Endpoints, str], timeout: Optional[float]) -> float:
+        delay = self.reserve(path, timeout)
+        if delay is None:
+            raise RequestTimeoutError(
+                "Deadline exceeded waiting for the rate limit", deadline_exceeded=True
+            )
+        return delay
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.config.burst, self._tokens + (now - self._updated_at) * self.config.rate
+        )
+        self._updated_at = now
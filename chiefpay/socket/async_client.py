@@ -1,13 +1,16 @@
 import socketio
 from typing import Callable, Any
 from chiefpay.constants import BASE_URL
+from chiefpay.decoding import Validation
 from chiefpay.exceptions import SocketError
 from chiefpay.socket.base import BaseSocketClient
 
 
 class AsyncSocketClient(BaseSocketClient):
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
-        super().__init__(api_key, base_url)
+    def __init__(
+        self, api_key: str, base_url: str = BASE_URL, validate: Validation = "full"
+    ):
+        super().__init__(api_key, base_url, validate)
         self.sio = socketio.AsyncClient()
         self._setup_event_handlers()
 
@@ -29,16 +32,15 @@ class AsyncSocketClient(BaseSocketClient):
 
         @self.sio.event
         async def rates(data: dict):
-            data = self._convert_to_dto_rates(data)
-            self.rates = data
+            data = self._update_rates(data)
             if self.on_rates:
                 await self.on_rates(data)
 
         @self.sio.event
         async def notification(data: dict):
             try:
+                data = self._dispatch_notification(data)
                 if self.on_notification:
-                    data = self._convert_to_dto(data)
                     await self.on_notification(data)
                     return {"status": "success"}
             except Exception as e:
@@ -1,10 +1,15 @@
-from typing import Callable, Union
+import logging
+from typing import Callable, List, Union
 from chiefpay.base import BaseClient
 from chiefpay.constants import BASE_URL, Endpoints
-from chiefpay.types import Rate, Invoice, Transaction
+from chiefpay.decoding import Validation
+from chiefpay.types import Rate
 from chiefpay.types.notification import NotificationInvoice, NotificationTransaction
 
 
+logger = logging.getLogger(__name__)
+
+
 class BaseSocketClient(BaseClient):
     """
     Base class for interacting with the payment system via WebSockets.
@@ -12,18 +17,26 @@ class BaseSocketClient(BaseClient):
 
     PATH = Endpoints.socket.value
 
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
+    def __init__(
+        self, api_key: str, base_url: str = BASE_URL, validate: Validation = "full"
+    ):
         """
         Initializes the socket client.
 
         Parameters:
             api_key (str): API key for authentication.
             base_url (str): Base URL for the API endpoints.
+            validate (str): How events are decoded: "full" validates them into models
+                and "raw" returns plain dicts.
         """
-        super().__init__(api_key, base_url)
+        super().__init__(api_key, base_url, validate=validate)
         self.rates: list[Rate] = None
         self.on_rates = None
         self.on_notification = None
+        self._rates_listeners: list[Callable[[list[Rate]], None]] = []
+        self._notification_listeners: list[
+            Callable[[Union[NotificationInvoice, NotificationTransaction]], None]
+        ] = []
         self._too_many_connections = False
         self._invalid_api_key = False
 
@@ -56,6 +69,31 @@ class BaseSocketClient(BaseClient):
         """
         self.on_rates = callback
 
+    def add_rates_listener(self, listener: Callable[[list[Rate]], None]):
+        """
+        Registers a function that is called synchronously with every rates update,
+        independently of the `on_rates` callback. Errors it raises are logged and do
+        not affect other listeners or `on_rates`.
+
+        Parameters:
+            listener (function): A function that takes one argument (the rates data).
+        """
+        self._rates_listeners.append(listener)
+
+    def add_notification_listener(
+        self,
+        listener: Callable[[Union[NotificationInvoice, NotificationTransaction]], None],
+    ):
+        """
+        Registers a function that is called synchronously with every notification,
+        independently of the `on_notification` callback. Errors it raises are logged
+        and do not affect other listeners or `on_notification`.
+
+        Parameters:
+            listener (function): A function that takes one argument (the notification data).
+        """
+        self._notification_listeners.append(listener)
+
     def get_latest_rates(self) -> list[Rate] | None:
         """
         Retrieves the latest exchange rates.
@@ -65,19 +103,47 @@ class BaseSocketClient(BaseClient):
         """
         return self.rates
 
+    def _dispatch_notification(
+        self, data: dict
+    ) -> Union[NotificationInvoice, NotificationTransaction, dict]:
+        if not (self.on_notification or self._notification_listeners):
+            return data
+        data = self._convert_to_dto(data)
+        _call_listeners(self._notification_listeners, data, "notification")
+        return data
+
     def _convert_to_dto(
         self, data: dict
     ) -> Union[NotificationInvoice, NotificationTransaction]:
         notification_type = data.get("type")
 
+        if self.validate == "raw":
+            return data
         if notification_type == "invoice":
             invoice_data = data.get("invoice")
-            return NotificationInvoice(invoice=Invoice(**invoice_data))
+            return self._decode(NotificationInvoice, {"invoice": invoice_data})
         elif notification_type == "transaction":
             transaction_data = data.get("transaction")
-            return NotificationTransaction(transaction=Transaction(**transaction_data))
+            return self._decode(
+                NotificationTransaction, {"transaction": transaction_data}
+            )
 
         return data
 
+    def _update_rates(self, data: dict) -> list[Rate]:
+        self.rates = self._convert_to_dto_rates(data)
+        _call_listeners(self._rates_listeners, self.rates, "rates")
+        return self.rates
+
     def _convert_to_dto_rates(self, data: dict) -> list[Rate]:
-        return [Rate(**rate_data) for rate_data in data]
+        return self._decode_list(Rate, data)
+
+
+def _call_listeners(listeners: List[Callable], data, event: str):
+    # A failing listener (e.g. a locked store) must not keep the event from the other
+    # listeners and the user's callback, or leave a notification unacknowledged.
+    for listener in listeners:
+        try:
+            listener(data)
+        except Exception:
+            logger.exception("Error in %s listener %r", event, listener)
@@ -1,6 +1,7 @@
 import socketio
 from typing import Callable, Any
 from chiefpay.constants import BASE_URL
+from chiefpay.decoding import Validation
 from chiefpay.exceptions import SocketError
 from chiefpay.socket.base import BaseSocketClient
 
@@ -10,8 +11,10 @@ class SocketClient(BaseSocketClient):
     Client for interacting with the payment system via WebSockets (synchronous).
     """
 
-    def __init__(self, api_key: str, base_url: str = BASE_URL):
-        super().__init__(api_key, base_url)
+    def __init__(
+        self, api_key: str, base_url: str = BASE_URL, validate: Validation = "full"
+    ):
+        super().__init__(api_key, base_url, validate)
         self.sio = socketio.Client()
         self._setup_event_handlers()
 
@@ -33,16 +36,15 @@ class SocketClient(BaseSocketClient):
 
         @self.sio.event
         def rates(data: dict):
-            data = self._convert_to_dto_rates(data)
-            self.rates = data
+            data = self._update_rates(data)
             if self.on_rates:
                 self.on_rates(data)
 
         @self.sio.event
         def notification(data: dict):
             try:
+                data = self._dispatch_notification(data)
                 if self.on_notification:
-                    data = self._convert_to_dto(data)
                     self.on_notification(data)
                     return {"status": "success"}
             except Exception as e:
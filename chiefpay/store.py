@@ -0,0 +1,299 @@
+import sqlite3
+import threading
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from chiefpay.cache import invoice_expired_at, invoice_progress
+from chiefpay.codec import JSONCodec, default_codec
+from chiefpay.decoding import Validation, check_validation, decode
+from chiefpay.pagination import item_created_at, item_id
+from chiefpay.types import Invoice, Transaction
+from chiefpay.types.notification import NotificationInvoice, NotificationTransaction
+from chiefpay.utils import Utils
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invoices (
+    id TEXT PRIMARY KEY,
+    order_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    expired_at TEXT NOT NULL,
+    progress INTEGER NOT NULL,
+    paid_amount REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS invoices_order_id ON invoices (order_id);
+CREATE INDEX IF NOT EXISTS invoices_status_created_at ON invoices (status, created_at);
+CREATE INDEX IF NOT EXISTS invoices_created_at ON invoices (created_at);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    txid TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    token TEXT NOT NULL,
+    wallet_id TEXT,
+    created_at TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_txid ON transactions (txid);
+CREATE INDEX IF NOT EXISTS transactions_wallet_id ON transactions (wallet_id);
+CREATE INDEX IF NOT EXISTS transactions_chain_token ON transactions (chain, token, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+"""
+
+
+class Store:
+    """
+    Local SQLite mirror of invoices and transactions.
+
+    Records are stored as their API payload next to indexed columns (`order_id`,
+    `status`, `created_at`, `txid`, `chain`/`token`, `wallet.id`) and are returned
+    as the same models the clients return. Feed it with history pages
+    (`add_invoices`/`add_transactions`, or as a `chiefpay.sync` sink) and with
+    socket notifications (`link`). Whatever order they arrive in, a stored invoice
+    is only replaced by a state at least as far along (see `chiefpay.cache.supersedes`).
+
+    Example:
+        store = Store("chiefpay.db")
+        store.add_transactions(client.iter_transactions(from_date="2025-01-01T00:00:00.000Z"))
+        store.link(client.socket)
+        store.invoices(status="COMPLETE", since="2025-06-01T00:00:00.000Z")
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection] = ":memory:",
+        validate: Validation = "full",
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        Parameters:
+            database (str | sqlite3.Connection): A database path or an open connection.
+            validate (str): How stored records are decoded on read, see `Client`.
+            codec (JSONCodec, optional): The codec used to store payloads.
+        """
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.validate = check_validation(validate)
+        self.codec = codec or default_codec()
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def link(self, socket):
+        """
+        Stores the invoices and transactions received as socket notifications.
+
+        Parameters:
+            socket (SocketClient | AsyncSocketClient): The socket client to listen to.
+        """
+        socket.add_notification_listener(self._on_notification)
+
+    def add_invoices(self, invoices: Iterable[Union[Invoice, Dict]]) -> int:
+        """
+        Inserts invoices, given as models or raw payloads, or replaces the stored ones
+        with them. A stored invoice further along (e.g. updated by a notification) is
+        kept over an older state of it fetched earlier.
+
+        Returns:
+            int: The number of invoices inserted or replaced.
+        """
+        rows = []
+        for invoice in invoices:
+            progress, paid_amount = invoice_progress(invoice)
+            rows.append(
+                (
+                    item_id(invoice).lower(),
+                    _field(invoice, "order_id", "orderId"),
+                    _value(_field(invoice, "status", "status")),
+                    Utils.format_date(item_created_at(invoice)),
+                    invoice_expired_at(invoice),
+                    progress,
+                    float(paid_amount),
+                    self._payload(invoice),
+                )
+            )
+        # The same rule as `supersedes`, applied atomically by SQLite.
+        return self._insert(
+            "INSERT INTO invoices "
+            "(id, order_id, status, created_at, expired_at, progress, paid_amount, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET order_id = excluded.order_id, "
+            "status = excluded.status, created_at = excluded.created_at, "
+            "expired_at = excluded.expired_at, progress = excluded.progress, "
+            "paid_amount = excluded.paid_amount, payload = excluded.payload "
+            "WHERE (excluded.progress, excluded.paid_amount) >= (progress, paid_amount) "
+            "OR (status = 'EXPIRED' AND excluded.expired_at > expired_at)",
+            rows,
+        )
+
+    def add_transactions(self, transactions: Iterable[Union[Transaction, Dict]]) -> int:
+        """
+        Inserts or replaces transactions, given as models or raw payloads. Transactions
+        do not change once created, so replacing one never loses newer data.
+
+        Returns:
+            int: The number of stored transactions.
+        """
+        rows = []
+        for transaction in transactions:
+            wallet = _field(transaction, "wallet", "wallet")
+            wallet_id = _field(wallet, "id", "id") if wallet is not None else None
+            rows.append(
+                (
+                    item_id(transaction).lower(),
+                    _field(transaction, "txid", "txid"),
+                    _field(transaction, "chain", "chain"),
+                    _field(transaction, "token", "token"),
+                    str(wallet_id).lower() if wallet_id is not None else None,
+                    Utils.format_date(item_created_at(transaction)),
+                    self._payload(transaction),
+                )
+            )
+        return self._insert(
+            "INSERT OR REPLACE INTO transactions "
+            "(id, txid, chain, token, wallet_id, created_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def invoice(self, id: str) -> Optional[Invoice]:
+        """
+        Returns a stored invoice by id, or None.
+        """
+        rows = self._select("invoices", [("id = ?", str(id).lower())])
+        return rows[0] if rows else None
+
+    def invoices(
+        self,
+        order_id: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Invoice]:
+        """
+        Returns the stored invoices matching all the given conditions, oldest first.
+
+        Parameters:
+            order_id (str, optional): The order ID in your system.
+            status (str | InvoiceStatus, optional): The invoice status.
+            since (str | datetime, optional): Created at or after this date.
+            until (str | datetime, optional): Created before this date.
+            limit (int, optional): Maximum number of invoices.
+
+        Returns:
+            list[Invoice]: The invoices.
+        """
+        conditions = []
+        if order_id is not None:
+            conditions.append(("order_id = ?", order_id))
+        if status is not None:
+            conditions.append(("status = ?", _value(status)))
+        return self._select("invoices", conditions + _range(since, until), limit)
+
+    def transactions(
+        self,
+        txid: Optional[str] = None,
+        chain: Optional[str] = None,
+        token: Optional[str] = None,
+        wallet_id: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Transaction]:
+        """
+        Returns the stored transactions matching all the given conditions, oldest first.
+
+        Parameters:
+            txid (str, optional): The transaction hash.
+            chain (str, optional): The chain name.
+            token (str, optional): The token name.
+            wallet_id (str, optional): The static wallet ID.
+            since (str | datetime, optional): Created at or after this date.
+            until (str | datetime, optional): Created before this date.
+            limit (int, optional): Maximum number of transactions.
+
+        Returns:
+            list[Transaction]: The transactions.
+        """
+        conditions = []
+        if txid is not None:
+            conditions.append(("txid = ?", txid))
+        if chain is not None:
+            conditions.append(("chain = ?", chain))
+        if token is not None:
+            conditions.append(("token = ?", token))
+        if wallet_id is not None:
+            conditions.append(("wallet_id = ?", str(wallet_id).lower()))
+        return self._select("transactions", conditions + _range(since, until), limit)
+
+    def close(self):
+        self.connection.close()
+
+    def _on_notification(self, notification):
+        if isinstance(notification, NotificationInvoice):
+            self.add_invoices([notification.invoice])
+        elif isinstance(notification, NotificationTransaction):
+            self.add_transactions([notification.transaction])
+        elif isinstance(notification, dict):
+            if notification.get("type") == "invoice":
+                self.add_invoices([notification["invoice"]])
+            elif notification.get("type") == "transaction":
+                self.add_transactions([notification["transaction"]])
+
+    def _payload(self, item: Any) -> bytes:
+        if isinstance(item, BaseModel):
+            item = item.model_dump(mode="json", by_alias=True, warnings=False)
+        return self.codec.dumps(item)
+
+    def _insert(self, sql: str, rows: List[Tuple]) -> int:
+        with self._lock, self.connection:
+            return self.connection.executemany(sql, rows).rowcount
+
+    def _select(
+        self, table: str, conditions: List[Tuple[str, Any]], limit: Optional[int] = None
+    ) -> List:
+        sql = f"SELECT payload FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(clause for clause, _ in conditions)
+        sql += " ORDER BY created_at, id"
+        params = [value for _, value in conditions]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+
+        model = Invoice if table == "invoices" else Transaction
+        return [decode(model, bytes(payload), self.validate, self.codec) for (payload,) in rows]
+
+
+def _field(item: Any, name: str, alias: str) -> Any:
+    return item.get(alias) if isinstance(item, dict) else getattr(item, name)
+
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _range(
+    since: Optional[Union[str, datetime]], until: Optional[Union[str, datetime]]
+) -> List[Tuple[str, str]]:
+    conditions = []
+    if since is not None:
+        conditions.append(("created_at >= ?", _date(since)))
+    if until is not None:
+        conditions.append(("created_at < ?", _date(until)))
+    return conditions
+
+
+def _date(value: Union[str, datetime]) -> str:
+    if isinstance(value, str):
+        value = Utils.parse_date(value)
+    return Utils.format_date(value)
@@ -0,0 +1,352 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from chiefpay.constants import Endpoints
+from chiefpay.decoding import HistoryModel
+from chiefpay.pagination import MAX_PAGE_SIZE, HistoryCursor, item_created_at, item_id
+from chiefpay.types import InvoicesHistory, TransactionsHistory
+from chiefpay.utils import Utils
+
+
+logger = logging.getLogger(__name__)
+
+Kind = Literal["invoices", "transactions"]
+
+_KINDS: Dict[str, Tuple[Endpoints, Type[HistoryModel]]] = {
+    "invoices": (Endpoints.invoices_history, InvoicesHistory),
+    "transactions": (Endpoints.transactions_history, TransactionsHistory),
+}
+
+
+class Checkpoint:
+    """
+    Persists the state of sync engines, keyed by engine name.
+
+    `save` must replace the previous state atomically: after a crash, `load`
+    returns either the old or the new state, never a mix of both.
+    """
+
+    def load(self, name: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def save(self, name: str, state: Dict):
+        raise NotImplementedError
+
+
+class FileCheckpoint(Checkpoint):
+    """
+    Stores checkpoints in a JSON file, rewritten through a temporary file and `os.replace`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+            path (str): The checkpoint file. It is created on the first save.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            return self._read().get(name)
+
+    def save(self, name: str, state: Dict):
+        with self._lock:
+            states = self._read()
+            states[name] = state
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".chiefpay-checkpoint-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(states, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+
+class SQLiteCheckpoint(Checkpoint):
+    """
+    Stores checkpoints in a SQLite table, one row per engine.
+
+    `save` commits the connection. A sink that writes through the same connection
+    and leaves its writes uncommitted has them committed in one transaction with
+    the checkpoint; a sink that commits on its own gets at-least-once delivery,
+    as with any other checkpoint.
+    """
+
+    TABLE = "chiefpay_checkpoints"
+
+    def __init__(self, database: Any):
+        """
+        Parameters:
+            database (str | sqlite3.Connection): A database path or an open connection.
+        """
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} (name TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+
+    def load(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT state FROM {self.TABLE} WHERE name = ?", (name,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, name: str, state: Dict):
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE} (name, state) VALUES (?, ?)",
+                (name, json.dumps(state)),
+            )
+
+
+class BaseSyncEngine:
+    """
+    Base class of the incremental sync engines.
+
+    The state is a watermark, the newest `createdAt` seen so far, and a fingerprint
+    of every record created within `lookback` of it. Each poll walks the history from
+    `watermark - lookback`, hands the records that are new or whose fingerprint
+    changed to the sink, page by page, and saves the state once the sink returned.
+    Delivery is at-least-once: a page may be handed out again after a crash
+    between the sink call and the checkpoint save.
+    """
+
+    def __init__(
+        self,
+        client,
+        sink: Callable[[List], Any],
+        checkpoint: Checkpoint,
+        kind: Kind = "transactions",
+        start_date: Optional[str] = None,
+        not_notified: Optional[bool] = True,
+        lookback: float = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        name: Optional[str] = None,
+    ):
+        """
+        Parameters:
+            client: The REST client used to fetch the history.
+            sink (function): Called with each batch (list) of new or changed records.
+            checkpoint (Checkpoint): Where the state is persisted.
+            kind (str): "transactions" or "invoices".
+            start_date (str, optional): Where to start when there is no checkpoint yet.
+                Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS.sssZ)
+            not_notified (bool, optional): Passed as `notNotified` to the history endpoint.
+            lookback (float): Seconds before the watermark that are fetched again on
+                every poll, to pick up records that changed after they were synced
+                (e.g. invoice status updates).
+            page_size (int): Number of items per request (max 1000).
+            name (str, optional): Checkpoint key, defaults to `kind`.
+        """
+        if kind not in _KINDS:
+            raise ValueError(f"Invalid kind: {kind}. Expected one of {', '.join(_KINDS)}")
+        if start_date:
+            Utils.validate_date(start_date)
+        if lookback < 0:
+            raise ValueError("lookback must not be negative")
+
+        self.client = client
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.kind = kind
+        self.start_date = start_date
+        self.not_notified = not_notified
+        self.lookback = timedelta(seconds=lookback)
+        self.page_size = page_size
+        self.name = name or kind
+        self._endpoint, self._model = _KINDS[kind]
+        self._state: Optional[Dict] = None
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """
+        The newest `createdAt` synced so far, or None before the first record.
+        """
+        state = self._load_state()
+        return state["watermark"]
+
+    def _load_state(self) -> Dict:
+        if self._state is None:
+            state = self.checkpoint.load(self.name)
+            if state is None:
+                if not self.start_date:
+                    raise ValueError("start_date is required when there is no checkpoint yet")
+                state = {"watermark": None, "from_date": self.start_date, "seen": {}}
+            self._state = state
+        return self._state
+
+    def _cursor(self) -> HistoryCursor:
+        state = self._load_state()
+        from_date = state["from_date"]
+        if state["watermark"] is not None:
+            from_date = Utils.format_date(Utils.parse_date(state["watermark"]) - self.lookback)
+        return HistoryCursor(from_date, None, self.page_size, self.not_notified)
+
+    def _changes(self, items: List) -> Tuple[List, Dict]:
+        """
+        Returns the records of a page that are new or changed, and the state to
+        save once they are delivered.
+        """
+        state = self._load_state()
+        seen = dict(state["seen"])
+        watermark = state["watermark"]
+        changed = []
+        for item in items:
+            id = item_id(item)
+            created_at = Utils.format_date(item_created_at(item))
+            fingerprint = _fingerprint(item)
+            if id not in seen or seen[id][1] != fingerprint:
+                changed.append(item)
+            seen[id] = [created_at, fingerprint]
+            if watermark is None or created_at > watermark:
+                watermark = created_at
+
+        if watermark is not None:
+            horizon = Utils.format_date(Utils.parse_date(watermark) - self.lookback)
+            seen = {id: entry for id, entry in seen.items() if entry[0] >= horizon}
+        return changed, {"watermark": watermark, "from_date": state["from_date"], "seen": seen}
+
+    def _commit(self, state: Dict):
+        self.checkpoint.save(self.name, state)
+        self._state = state
+
+
+class SyncEngine(BaseSyncEngine):
+    """
+    Incremental sync of the invoice or transaction history with a sync client.
+
+    Example:
+        engine = SyncEngine(client, sink=handle, checkpoint=FileCheckpoint("sync.json"),
+                            start_date="2025-01-01T00:00:00.000Z")
+        engine.run(interval=30)
+    """
+
+    def poll(self) -> int:
+        """
+        Fetches everything created since the watermark and delivers the changes.
+
+        Returns:
+            int: The number of records handed to the sink.
+        """
+        cursor = self._cursor()
+        delivered = 0
+        while not cursor.done:
+            response_data = self.client._get_request(self._endpoint, cursor.params())
+            items = cursor.advance(*self.client._decode_history(self._model, response_data))
+            changed, state = self._changes(items)
+            if changed:
+                self.sink(changed)
+                delivered += len(changed)
+            if state != self._state:
+                self._commit(state)
+        return delivered
+
+    def run(self, interval: float = 30.0, stop: Optional[threading.Event] = None):
+        """
+        Polls every `interval` seconds until `stop` is set. A failed poll is logged
+        and retried at the next interval, from the last saved state.
+
+        Parameters:
+            interval (float): Seconds between the end of a poll and the next one.
+            stop (threading.Event, optional): Set it to end the loop.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Sync poll of %s failed", self.name)
+            stop.wait(interval)
+
+
+class AsyncSyncEngine(BaseSyncEngine):
+    """
+    Incremental sync of the invoice or transaction history with an async client.
+
+    The sink may be a regular function or a coroutine function.
+    """
+
+    async def poll(self) -> int:
+        """
+        Fetches everything created since the watermark and delivers the changes.
+
+        Returns:
+            int: The number of records handed to the sink.
+        """
+        cursor = self._cursor()
+        delivered = 0
+        while not cursor.done:
+            response_data = await self.client._get_request(self._endpoint, cursor.params())
+            items = cursor.advance(*self.client._decode_history(self._model, response_data))
+            changed, state = self._changes(items)
+            if changed:
+                result = self.sink(changed)
+                if inspect.isawaitable(result):
+                    await result
+                delivered += len(changed)
+            if state != self._state:
+                self._commit(state)
+        return delivered
+
+    async def run(self, interval: float = 30.0, stop: Optional[asyncio.Event] = None):
+        """
+        Polls every `interval` seconds until `stop` is set. A failed poll is logged
+        and retried at the next interval, from the last saved state.
+
+        Args:
+            interval (float): Seconds between the end of a poll and the next one.
+            stop (asyncio.Event, optional): Set it to end the loop.
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Sync poll of %s failed", self.name)
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+def _fingerprint(item: Any) -> str:
+    payload = json.dumps(_plain(item), sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return {name: _plain(field) for name, field in value.__dict__.items()}
+    if isinstance(value, dict):
+        return {key: _plain(field) for key, field in value.items()}
+    if isinstance(value, list):
+        return [_plain(field) for field in value]
+    return value
@@ -0,0 +1,77 @@
+from typing import Dict, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+from chiefpay.constants import Endpoints, resolve_endpoint
+
+
+class TransportConfig(BaseModel):
+    """
+    HTTP connection pooling, keep-alive and timeout settings of the REST clients.
+
+    The synchronous client keeps one pool of `pool_size` connections per host (at
+    least its `max_workers`) and has no global connection cap, idle-connection expiry
+    or DNS cache, so `pool_size_per_host`, `total_limit`, `keepalive_timeout` and
+    `dns_cache_ttl` only apply to the asynchronous client.
+
+    `endpoint_timeouts` maps endpoint names (`Endpoints` member names, e.g.
+    "invoices_history") to the seconds a request to them may take; other endpoints
+    use `request_timeout`. The synchronous client cannot bound the total time of a
+    request, so for it these limit the connect time and the wait between chunks.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    pool_size: int = Field(
+        10, gt=0, description="Connections the synchronous client keeps pooled per host"
+    )
+    pool_size_per_host: int = Field(
+        0, ge=0, description="Maximum number of simultaneous connections per host (0 for no limit)"
+    )
+    total_limit: int = Field(
+        100, ge=0, description="Maximum number of simultaneous connections (0 for no limit)"
+    )
+    keepalive_timeout: float = Field(
+        15.0, ge=0, description="Seconds an idle connection is kept open for reuse"
+    )
+    dns_cache_ttl: Optional[int] = Field(
+        10, ge=0, description="Seconds resolved addresses are cached (None to cache forever)"
+    )
+    connect_timeout: Optional[float] = Field(
+        None, gt=0, description="Seconds to wait for a connection to be established"
+    )
+    read_timeout: Optional[float] = Field(
+        None, gt=0, description="Seconds to wait between chunks of the response"
+    )
+    request_timeout: Optional[float] = Field(
+        30.0, gt=0, description="Seconds a request may take (None for no limit)"
+    )
+    endpoint_timeouts: Dict[str, float] = Field(
+        default_factory=lambda: {"invoices_history": 60.0, "transactions_history": 60.0},
+        description="Seconds a request may take, by endpoint name",
+    )
+
+    def timeout(self, path: Union[Endpoints, str]) -> Optional[float]:
+        """
+        Returns the seconds a request to `path` may take.
+        """
+        endpoint = resolve_endpoint(path)
+        if endpoint is not None and endpoint.name in self.endpoint_timeouts:
+            return self.endpoint_timeouts[endpoint.name]
+        return self.request_timeout
+
+
+class PoolStats(BaseModel):
+    """
+    Snapshot of the connection pool of a REST client.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    hosts: int = Field(..., description="Number of hosts with a connection pool")
+    in_use: int = Field(..., description="Connections currently serving a request")
+    idle: int = Field(..., description="Open connections waiting to be reused")
+    waiting: int = Field(0, description="Requests queued for a free connection")
+    limit: int = Field(..., description="Maximum number of simultaneous connections (0 for no limit)")
+    limit_per_host: int = Field(
+        ..., description="Maximum number of connections per host (0 for no limit)"
+    )
@@ -15,4 +15,15 @@ class TransactionsHistory(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
     
     transactions: List[Transaction]
-    total_count: int = Field(alias='totalCount')
\ No newline at end of file
+    total_count: int = Field(alias='totalCount')
+
+    def to_frame(self, scale: int = 8):
+        """
+        Returns the transactions as a columnar `chiefpay.frame.TransactionsFrame`.
+
+        Parameters:
+            scale (int): Number of decimal places kept for amounts.
+        """
+        from chiefpay.frame import TransactionsFrame
+
+        return TransactionsFrame.from_transactions(self.transactions, scale)
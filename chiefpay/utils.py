@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class Utils:
@@ -12,3 +12,20 @@ class Utils:
             return True
         except ValueError:
             raise ValueError(f"Invalid date format: {date}. Expected format is YYYY-MM-DDTHH:MM:SS.sssZ")
+
+    @staticmethod
+    def parse_date(date: str) -> datetime:
+        """
+        Parses an ISO 8601 date returned by the API into an aware datetime.
+        """
+        if date.endswith("Z"):
+            date = date[:-1] + "+00:00"
+        return datetime.fromisoformat(date)
+
+    @staticmethod
+    def format_date(date: datetime) -> str:
+        """
+        Formats an aware datetime as YYYY-MM-DDTHH:MM:SS.sssZ (millisecond precision).
+        """
+        date = date.astimezone(timezone.utc)
+        return date.strftime("%Y-%m-%dT%H:%M:%S.") + f"{date.microsecond // 1000:03d}Z"
@@ -14,6 +14,10 @@ setup(
         'python-socketio[client]>=5.1.0,<6.0.0',
         'pydantic>=2.0.0,<3.0.0',
     ],
+    extras_require={
+        'orjson': ['orjson>=3.6.0'],
+        'numpy': ['numpy>=1.20.0'],
+    },
     author='nelsn',
     author_email='egor.larrr@gmail.com',
     description='ChiefPay Python SDK',
@@ -0,0 +1,65 @@
+import asyncio
+
+import aiohttp
+import requests
+from aiohttp import web
+
+from chiefpay import AsyncClient, Client
+from chiefpay.types import Invoice
+
+from benchmarks.server import StandInServer
+
+
+DROPPED_ID = "00000000-0000-4000-8000-000000000007"
+
+class DroppingServer(StandInServer):
+    """
+    Stand-in API that closes the connection instead of answering requests for the
+    "drop" order or DROPPED_ID.
+    """
+
+    async def _create_invoice(self, request: web.Request) -> web.Response:
+        spec = await request.json()
+        if spec.get("orderId") == "drop":
+            request.transport.close()
+            raise asyncio.CancelledError()
+        return await super()._create_invoice(request)
+
+    async def _invoice(self, request: web.Request) -> web.Response:
+        if request.match_info["id"] == DROPPED_ID:
+            request.transport.close()
+            raise asyncio.CancelledError()
+        return await super()._invoice(request)
+
+
+def test_create_invoices_keeps_results_when_a_connection_drops():
+    specs = [{"order_id": f"order-{n}", "amount": "10"} for n in range(20)]
+    specs[7] = {"order_id": "drop", "amount": "10"}
+
+    async def create(url: str):
+        async with AsyncClient("test", base_url=url) as client:
+            return await client.create_invoices(specs, concurrency=5)
+
+    with DroppingServer() as server:
+        results = asyncio.run(create(server.url))
+
+    assert len(results) == len(specs)
+    assert isinstance(results[7], aiohttp.ClientError)
+    for n, result in enumerate(results):
+        if n != 7:
+            assert isinstance(result, Invoice)
+            assert result.order_id == f"order-{n}"
+
+
+def test_sync_batch_keeps_results_when_a_connection_drops():
+    ids = [f"00000000-0000-4000-8000-{n:012d}" for n in range(20)]
+
+    with DroppingServer() as server, Client("test", base_url=server.url, max_workers=5) as client:
+        results = client.get_invoices_by_ids(ids)
+
+    assert len(results) == len(ids)
+    assert isinstance(results[7], requests.ConnectionError)
+    for n, result in enumerate(results):
+        if n != 7:
+            assert isinstance(result, Invoice)
+            assert str(result.id) == ids[n]
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+
+from chiefpay import AsyncClient, Client
+from chiefpay.breaker import BreakerPolicy, CircuitBreaker, CircuitState
+from chiefpay.constants import Endpoints
+from chiefpay.exceptions import APIError, CircuitOpenError, ManyRequestsError, RequestTimeoutError
+from chiefpay.transport import TransportConfig
+
+from benchmarks.server import StandInServer
+
+
+INVOICE_ID = "00000000-0000-4000-8000-000000000001"
+
+
+def fail(breaker: CircuitBreaker, error: Exception):
+    with pytest.raises(type(error)):
+        with breaker.guard(Endpoints.rates):
+            raise error
+
+
+def test_rate_limited_request_does_not_reset_failures():
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=2))
+    fail(breaker, APIError(status_code=503))
+    fail(breaker, ManyRequestsError(0.1))
+    fail(breaker, APIError(status_code=503))
+    assert breaker.state("rates") is CircuitState.open
+
+
+def test_rate_limited_trial_does_not_close_circuit():
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=1, reset_timeout=0.01))
+    fail(breaker, APIError(status_code=503))
+    time.sleep(0.02)
+    fail(breaker, ManyRequestsError(0.1))
+    assert breaker.state("rates") is CircuitState.half_open
+
+    with breaker.guard(Endpoints.rates):
+        pass
+    assert breaker.state("rates") is CircuitState.closed
+
+
+def test_deadline_timeouts_do_not_open_circuit():
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=2))
+
+    async def call(client: AsyncClient, deadline: Optional[float] = None):
+        return await client.get_invoice(INVOICE_ID, deadline=deadline)
+
+    async def run(url: str):
+        async with AsyncClient("test", base_url=url, circuit_breaker=breaker) as client:
+            for _ in range(5):
+                with pytest.raises(RequestTimeoutError):
+                    await call(client, deadline=0.01)
+            assert breaker.state("invoice") is CircuitState.closed
+            return await call(client)
+
+    with StandInServer(latency=0.05) as server:
+        invoice = asyncio.run(run(server.url))
+        assert str(invoice.id) == INVOICE_ID
+
+        with Client("test", base_url=server.url, circuit_breaker=breaker) as client:
+            for _ in range(5):
+                with pytest.raises(RequestTimeoutError):
+                    client.get_invoice(INVOICE_ID, deadline=0.01)
+            assert breaker.state("invoice") is CircuitState.closed
+
+
+def test_configured_timeouts_open_circuit():
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=2))
+    transport = TransportConfig(request_timeout=0.01)
+
+    async def run(url: str):
+        async with AsyncClient(
+            "test", base_url=url, transport=transport, circuit_breaker=breaker
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(RequestTimeoutError):
+                    await client.get_invoice(INVOICE_ID, deadline=10)
+            with pytest.raises(CircuitOpenError):
+                await client.get_invoice(INVOICE_ID)
+
+    with StandInServer(latency=0.05) as server:
+        asyncio.run(run(server.url))
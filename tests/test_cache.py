@@ -0,0 +1,27 @@
+from chiefpay.cache import InvoiceCache
+from chiefpay.types import Invoice, InvoiceStatus, NotificationInvoice
+
+from benchmarks import payloads
+
+
+def state(status: str, paid_amount: str) -> dict:
+    invoice = payloads.invoice(1)
+    invoice.update(status=status, paidAmount=paid_amount)
+    return invoice
+
+
+def test_slow_response_does_not_replace_notified_invoice():
+    cache = InvoiceCache()
+    # A get_invoice response sent before the notification arrives after it.
+    cache._on_notification(NotificationInvoice.model_validate({"invoice": state("COMPLETE", "10")}))
+    cache.put(Invoice.model_validate(state("WAITING_PAYMENT", "0")))
+
+    cached = cache.get(payloads.invoice(1)["id"])
+    assert cached.status is InvoiceStatus.complete
+
+
+def test_newer_state_replaces_cached_invoice():
+    cache = InvoiceCache()
+    cache.put(state("WAITING_PAYMENT", "0"))
+    cache.put(state("UNDER_PAID", "3"))
+    assert cache.get(payloads.invoice(1)["id"])["status"] == "UNDER_PAID"
@@ -0,0 +1,98 @@
+import asyncio
+
+from aiohttp import web
+
+from chiefpay import AsyncClient
+from chiefpay.concurrency import AdaptiveConcurrency
+
+from benchmarks.server import StandInServer
+
+
+def test_limit_grows_by_about_one_per_limit_successes():
+    controller = AdaptiveConcurrency(initial=4, max_limit=8)
+    for _ in range(4):
+        controller.succeeded(0.01)
+    assert controller.limit == 4
+    for _ in range(5):
+        controller.succeeded(0.01)
+    assert controller.limit == 5
+
+    for _ in range(1000):
+        controller.succeeded(0.01)
+    assert controller.limit == 8
+
+
+def test_overload_halves_limit_once_per_limit_requests():
+    controller = AdaptiveConcurrency(initial=16)
+    controller.overloaded()
+    assert controller.limit == 8
+    # 429s of requests already in flight at the same limit do not count again.
+    for _ in range(7):
+        controller.overloaded()
+    assert (controller.limit, controller.decreases) == (8, 1)
+    controller.overloaded()
+    assert (controller.limit, controller.decreases) == (4, 2)
+
+
+def test_latency_spike_decreases_limit():
+    controller = AdaptiveConcurrency(initial=16)
+    for _ in range(10):
+        controller.succeeded(0.01)
+    controller.succeeded(1.0)
+    assert controller.limit < 16
+    assert controller.decreases == 1
+
+
+def test_cancelled_waiter_passes_its_wakeup_on():
+    async def run():
+        controller = AdaptiveConcurrency(initial=1, max_limit=1)
+        await controller.acquire_async()
+        first = asyncio.ensure_future(controller.acquire_async())
+        second = asyncio.ensure_future(controller.acquire_async())
+        await asyncio.sleep(0)
+
+        controller.release()  # picks `first`
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        assert controller.in_flight == 1
+
+    asyncio.run(run())
+
+
+class ThrottlingServer(StandInServer):
+    """
+    Stand-in API that answers the "throttled" order with one 429 first.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.throttled_once = False
+
+    async def _create_invoice(self, request: web.Request) -> web.Response:
+        spec = await request.json()
+        if spec.get("orderId") == "throttled" and not self.throttled_once:
+            self.throttled_once = True
+            return web.json_response(
+                {"code": "RESOURCE_EXHAUSTED", "errors": ["rate limited"]},
+                status=429,
+                headers={"Retry-After-ms": "300"},
+            )
+        return await super()._create_invoice(request)
+
+
+def test_retry_backoff_is_not_counted_as_latency():
+    specs = [{"order_id": f"order-{n}", "amount": "10"} for n in range(30)]
+    specs[5] = {"order_id": "throttled", "amount": "10"}
+    controller = AdaptiveConcurrency(initial=1, max_limit=1)
+
+    async def create(url: str):
+        async with AsyncClient("test", base_url=url) as client:
+            return await client.create_invoices(specs, concurrency=controller)
+
+    with ThrottlingServer(latency=0.005) as server:
+        results = asyncio.run(create(server.url))
+
+    assert not [result for result in results if isinstance(result, Exception)]
+    # The 429 decreases the limit once; its Retry-After wait is not a latency spike too.
+    assert controller.decreases == 1
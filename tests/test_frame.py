@@ -0,0 +1,69 @@
+from datetime import date
+from decimal import Decimal, localcontext
+
+import pytest
+
+from chiefpay import frame as frame_module
+from chiefpay.frame import TransactionsFrame
+
+
+np = frame_module.np
+
+
+@pytest.fixture(
+    params=[pytest.param("numpy", marks=pytest.mark.skipif(np is None, reason="needs NumPy")), "array"]
+)
+def backend(request, monkeypatch):
+    if request.param == "array":
+        monkeypatch.setattr(frame_module, "np", None)
+    return request.param
+
+
+def transaction(value: str, chain: str = "TRON", day: int = 1) -> dict:
+    return {
+        "value": value,
+        "usd": value,
+        "fee": "0",
+        "merchantAmount": value,
+        "chain": chain,
+        "token": "USDT",
+        "createdAt": f"2025-01-{day:02d}T12:00:00.000Z",
+    }
+
+
+def test_sums_and_groups(backend):
+    frame = TransactionsFrame.from_transactions(
+        [transaction("1.5"), transaction("2.25", "ETH"), transaction("0.1", day=2)]
+    )
+    assert frame.sum("usd") == Decimal("3.85")
+    assert frame.group_sum("usd", by="chain") == {"TRON": Decimal("1.6"), "ETH": Decimal("2.25")}
+    assert frame.filter(chain="TRON").group_sum("value", by="day") == {
+        date(2025, 1, 1): Decimal("1.5"),
+        date(2025, 1, 2): Decimal("0.1"),
+    }
+    if backend == "numpy":
+        assert frame.columns["usd"].dtype == np.int64
+
+
+def test_values_beyond_int64_stay_exact(backend):
+    # 18-decimal token amounts: 123456789012 * 10**18 does not fit in int64.
+    large = "123456789012.123456789012345678"
+    frame = TransactionsFrame.from_transactions(
+        [transaction("1"), transaction(large), transaction(large, "ETH")], scale=18
+    )
+    with localcontext() as context:
+        context.prec = 40
+        assert frame.sum("value") == Decimal(large) * 2 + 1
+        assert frame.group_sum("value") == {"TRON": Decimal(large) + 1, "ETH": Decimal(large)}
+    assert frame.filter(chain="ETH").sum("value") == Decimal(large)
+    assert frame.to_decimal("value")[1] == Decimal(large)
+
+
+def test_totals_beyond_int64_stay_exact(backend):
+    # Each scaled value fits in int64, their total does not.
+    amount = "60000000000"
+    frame = TransactionsFrame.from_transactions([transaction(amount)] * 3)
+    assert frame.sum("usd") == Decimal(amount) * 3
+    assert frame.group_sum("usd", by=("chain", "token")) == {("TRON", "USDT"): Decimal(amount) * 3}
+    if backend == "numpy":
+        assert frame.columns["usd"].dtype == np.int64
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from chiefpay import AsyncClient
+from chiefpay.hedging import HedgePolicy
+from chiefpay.metrics import Metrics
+from chiefpay.profiling import Profiler
+
+from benchmarks.server import StandInServer
+
+
+SLOW_ID = "00000000-0000-4000-8000-000000000999"
+
+
+class FlakyServer(StandInServer):
+    """
+    Stand-in API that rate limits the first request for every invoice, and stalls
+    the first answered request for SLOW_ID.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.seen = set()
+        self.stalled = False
+
+    async def _invoice(self, request: web.Request) -> web.Response:
+        id = request.match_info["id"]
+        if id not in self.seen:
+            self.seen.add(id)
+            return web.json_response({}, status=429, headers={"Retry-After-ms": "100"})
+        if id == SLOW_ID and not self.stalled:
+            self.stalled = True
+            await asyncio.sleep(1)
+        return await super()._invoice(request)
+
+
+def test_hedging_measures_single_attempts_with_own_profiles():
+    profiles = []
+    metrics = Metrics()
+    policy = HedgePolicy(percentile=50, budget=1, min_samples=5)
+
+    async def run(url: str):
+        async with AsyncClient(
+            "test", base_url=url, hedging=policy,
+            profiler=Profiler(profiles.append, 1),
+            metrics=metrics,
+        ) as client:
+            for n in range(10):
+                await client.get_invoice(f"00000000-0000-4000-8000-{n:012d}")
+            # Retry-After-ms sleeps are not part of the recorded latencies.
+            assert client.hedger.delay("/v1/invoice/x") < 0.05
+
+            start = time.monotonic()
+            await client.get_invoice(SLOW_ID)
+            return client.hedger.stats(), time.monotonic() - start
+
+    with FlakyServer() as server:
+        stats, elapsed = asyncio.run(run(server.url))
+
+    assert stats.won == 1
+    assert elapsed < 0.5
+    assert len(profiles) == 11
+    # The 429 attempt and the winning hedge; the stalled attempt is not counted.
+    assert profiles[-1].attempts == 2
+    # The cancelled loser of the race is not an error.
+    assert metrics.stats()["invoice_by_id"].statuses == {"200": 11, "429": 11, "cancelled": 1}
@@ -0,0 +1,71 @@
+import pytest
+
+from chiefpay.exceptions import HistoryOrderError
+from chiefpay.pagination import HistoryCursor
+
+
+FROM_DATE = "2025-01-01T00:00:00.000Z"
+
+
+def record(id: str, millis: int) -> dict:
+    return {"id": id, "createdAt": f"2025-01-01T00:00:00.{millis:03d}Z"}
+
+
+def page(records: list, params: dict) -> tuple:
+    """
+    Answers a history request the way the API does: the first `limit` records created
+    at or after `fromDate`, oldest first, and the count of all of them.
+    """
+    matching = [item for item in records if item["createdAt"] >= params["fromDate"]]
+    return matching[: params["limit"]], len(matching)
+
+
+def walk(records: list, limit: int) -> list:
+    cursor = HistoryCursor(FROM_DATE, limit=limit)
+    ids = []
+    while not cursor.done:
+        ids += [item["id"] for item in cursor.advance(*page(records, cursor.params()))]
+    return ids
+
+
+def test_pages_across_a_shared_boundary_timestamp():
+    records = [record("a", 1), record("b", 2), record("c", 2)]
+    records += [record("d", 3), record("e", 3), record("f", 4)]
+    assert walk(records, limit=3) == ["a", "b", "c", "d", "e", "f"]
+
+
+def test_skips_boundary_items_returned_again():
+    cursor = HistoryCursor(FROM_DATE, limit=2)
+    first = cursor.advance([record("a", 1), record("b", 1)], 4)
+    assert [item["id"] for item in first] == ["a", "b"]
+    assert cursor.params()["fromDate"] == "2025-01-01T00:00:00.001Z"
+
+    # The boundary millisecond holds more items than a page: keep every id seen in it.
+    second = cursor.advance([record("a", 1), record("c", 1)], 4)
+    assert [item["id"] for item in second] == ["c"]
+    assert cursor.params()["fromDate"] == "2025-01-01T00:00:00.001Z"
+
+    third = cursor.advance([record("b", 1), record("d", 2)], 2)
+    assert [item["id"] for item in third] == ["d"]
+    assert cursor.done
+
+
+def test_steps_over_a_millisecond_holding_more_than_a_page():
+    records = [record(id, 1) for id in "abc"] + [record("d", 2)]
+    with pytest.warns(RuntimeWarning, match="fill a whole page of 2"):
+        ids = walk(records, limit=2)
+    # "c" cannot be reached with 2-item pages; nothing is yielded twice and paging ends.
+    assert ids == ["a", "b", "d"]
+
+
+def test_newest_first_page_raises():
+    cursor = HistoryCursor(FROM_DATE, limit=2)
+    with pytest.raises(HistoryOrderError):
+        cursor.advance([record("b", 2), record("a", 1)], 5)
+
+
+def test_last_page_may_be_in_any_order():
+    cursor = HistoryCursor(FROM_DATE, limit=3)
+    items = cursor.advance([record("b", 2), record("a", 1)], 2)
+    assert [item["id"] for item in items] == ["b", "a"]
+    assert cursor.done
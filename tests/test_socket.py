@@ -0,0 +1,39 @@
+from chiefpay.socket.client import SocketClient
+from chiefpay.types import NotificationInvoice
+
+from benchmarks import payloads
+
+
+def test_failing_listener_does_not_drop_notification(caplog):
+    client = SocketClient("test", base_url="http://127.0.0.1")
+    received = []
+
+    def locked_store(notification):
+        raise RuntimeError("database is locked")
+
+    client.add_notification_listener(locked_store)
+    client.add_notification_listener(received.append)
+    client.set_on_notification(received.append)
+
+    handler = client.sio.handlers["/"]["notification"]
+    assert handler(payloads.notification(0)) == {"status": "success"}
+    assert len(received) == 2
+    assert all(isinstance(notification, NotificationInvoice) for notification in received)
+    assert "Error in notification listener" in caplog.text
+
+
+def test_failing_rates_listener_does_not_drop_rates(caplog):
+    client = SocketClient("test", base_url="http://127.0.0.1")
+    received = []
+
+    def broken_cache(rates):
+        raise RuntimeError("cache unavailable")
+
+    client.add_rates_listener(broken_cache)
+    client.add_rates_listener(received.append)
+    client.set_on_rates(received.append)
+
+    client.sio.handlers["/"]["rates"](payloads.rates())
+    assert len(received) == 2
+    assert received[1] == client.get_latest_rates()
+    assert "Error in rates listener" in caplog.text
@@ -0,0 +1,47 @@
+from chiefpay.store import Store
+from chiefpay.types import InvoiceStatus, NotificationInvoice
+
+from benchmarks import payloads
+
+
+def state(status: str, paid_amount: str, expired_at: str = None) -> dict:
+    invoice = payloads.invoice(1)
+    invoice.update(status=status, paidAmount=paid_amount)
+    if expired_at is not None:
+        invoice["expiredAt"] = expired_at
+    return invoice
+
+
+def test_stale_write_after_notification_keeps_newer_status():
+    store = Store()
+    fetched = state("WAITING_PAYMENT", "0")
+    notification = NotificationInvoice.model_validate({"invoice": state("COMPLETE", "10.5")})
+
+    # A history page fetched before the notification is written after it.
+    store._on_notification(notification)
+    assert store.add_invoices([fetched]) == 0
+
+    invoice = store.invoice(fetched["id"])
+    assert invoice.status is InvoiceStatus.complete
+    assert str(invoice.paid_amount) == "10.5"
+    assert store.invoices(status="WAITING_PAYMENT") == []
+
+
+def test_newer_states_replace_stored_invoice():
+    store = Store()
+    store.add_invoices([state("UNDER_PAID", "4")])
+    assert store.add_invoices([state("UNDER_PAID", "7")]) == 1
+    assert store.add_invoices([state("UNDER_PAID", "7")]) == 1
+    assert store.add_invoices([state("UNDER_PAID", "5")]) == 0
+    assert str(store.invoice(state("UNDER_PAID", "7")["id"]).paid_amount) == "7"
+
+
+def test_prolonged_invoice_replaces_expired_one():
+    store = Store()
+    expired = state("EXPIRED", "0")
+    store.add_invoices([expired])
+    # An older state with the same expiry is stale; a prolonged one is not.
+    assert store.add_invoices([state("WAITING_PAYMENT", "0")]) == 0
+    prolonged = state("WAITING_PAYMENT", "0", expired_at="2030-01-01T00:00:00.000Z")
+    assert store.add_invoices([prolonged]) == 1
+    assert store.invoice(expired["id"]).status is InvoiceStatus.waiting_payment
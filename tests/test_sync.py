@@ -0,0 +1,146 @@
+import asyncio
+import sqlite3
+import threading
+
+from chiefpay.sync import AsyncSyncEngine, FileCheckpoint, SQLiteCheckpoint, SyncEngine
+
+
+START = "2025-01-01T00:00:00.000Z"
+
+
+def record(id: str, second: int, status: str = "PENDING") -> dict:
+    return {"id": id, "createdAt": f"2025-01-01T00:00:{second:02d}.000Z", "status": status}
+
+
+class HistoryClient:
+    """
+    In-memory history endpoint: the first `limit` records created at or after
+    `fromDate`, oldest first. Fails the next `failures` requests.
+    """
+
+    def __init__(self, records: list):
+        self.records = records
+        self.failures = 0
+
+    def _get_request(self, path, params: dict):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection reset")
+        matching = sorted(
+            (item for item in self.records if item["createdAt"] >= params["fromDate"]),
+            key=lambda item: item["createdAt"],
+        )
+        return [dict(item) for item in matching[: params["limit"]]], len(matching)
+
+    def _decode_history(self, model, response):
+        return response
+
+
+class AsyncHistoryClient(HistoryClient):
+    async def _get_request(self, path, params: dict):
+        return super()._get_request(path, params)
+
+
+def engine(client, checkpoint, batches: list, **kwargs) -> SyncEngine:
+    sink = lambda items: batches.append([item["id"] for item in items])
+    return SyncEngine(client, sink, checkpoint, start_date=START, page_size=2, **kwargs)
+
+
+def test_delivers_new_records_once_and_advances_watermark(tmp_path):
+    client = HistoryClient([record("a", 1), record("b", 2), record("c", 3)])
+    batches = []
+    sync = engine(client, FileCheckpoint(str(tmp_path / "sync.json")), batches)
+
+    assert sync.poll() == 3
+    assert sum(batches, []) == ["a", "b", "c"]
+    assert sync.watermark == "2025-01-01T00:00:03.000Z"
+
+    batches.clear()
+    assert sync.poll() == 0
+    client.records.append(record("d", 4))
+    assert sync.poll() == 1
+    assert batches == [["d"]]
+
+
+def test_lookback_picks_up_changed_records(tmp_path):
+    client = HistoryClient([record("a", 1), record("b", 20), record("c", 30)])
+    batches = []
+    sync = engine(client, FileCheckpoint(str(tmp_path / "sync.json")), batches, lookback=15)
+    sync.poll()
+    batches.clear()
+
+    client.records[1] = record("b", 20, "PAID")
+    # "a" is out of the lookback window: its change is not seen.
+    client.records[0] = record("a", 1, "PAID")
+    assert sync.poll() == 1
+    assert batches == [["b"]]
+
+
+def test_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "sync.json")
+    client = HistoryClient([record("a", 1), record("b", 2)])
+    engine(client, FileCheckpoint(path), []).poll()
+
+    client.records.append(record("c", 3))
+    batches = []
+    assert engine(client, FileCheckpoint(path), batches).poll() == 1
+    assert batches == [["c"]]
+
+
+def test_sqlite_checkpoint_commits_pending_sink_writes(tmp_path):
+    path = str(tmp_path / "sync.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE records (id TEXT PRIMARY KEY)")
+    connection.commit()
+
+    def sink(items):
+        connection.executemany("INSERT INTO records VALUES (?)", [(item["id"],) for item in items])
+
+    client = HistoryClient([record("a", 1), record("b", 2), record("c", 3)])
+    SyncEngine(client, sink, SQLiteCheckpoint(connection), start_date=START, page_size=2).poll()
+
+    reader = sqlite3.connect(path)
+    assert reader.execute("SELECT COUNT(*) FROM records").fetchone() == (3,)
+    assert SQLiteCheckpoint(reader).load("transactions")["watermark"] == "2025-01-01T00:00:03.000Z"
+
+
+def test_run_survives_failed_polls(tmp_path, caplog):
+    client = HistoryClient([record("a", 1)])
+    client.failures = 2
+    stop = threading.Event()
+    batches = []
+
+    def sink(items):
+        batches.append([item["id"] for item in items])
+        stop.set()
+
+    sync = SyncEngine(client, sink, FileCheckpoint(str(tmp_path / "sync.json")), start_date=START)
+    thread = threading.Thread(target=sync.run, kwargs={"interval": 0.01, "stop": stop})
+    thread.start()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert batches == [["a"]]
+    assert caplog.text.count("Sync poll of transactions failed") == 2
+
+
+def test_async_run_survives_failed_polls(tmp_path, caplog):
+    client = AsyncHistoryClient([record("a", 1)])
+    client.failures = 1
+    batches = []
+
+    async def run():
+        stop = asyncio.Event()
+
+        async def sink(items):
+            batches.append([item["id"] for item in items])
+            stop.set()
+
+        sync = AsyncSyncEngine(
+            client, sink, FileCheckpoint(str(tmp_path / "sync.json")), start_date=START
+        )
+        await asyncio.wait_for(sync.run(interval=0.01, stop=stop), 5)
+
+    asyncio.run(run())
+    assert batches == [["a"]]
+    assert "Sync poll of transactions failed" in caplog.text